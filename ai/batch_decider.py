@@ -0,0 +1,71 @@
+import numpy as np
+from typing import Sequence
+
+from lib.action_codec import PLAY_ALL_CARDS_ACTION, TAKE_CARD_ACTION, action_to_index
+from lib.action_decider import CARD_DISTANCES
+from lib.game_state import GameState, TurnPhase
+
+# Distance of every rank to the cards on the board of its suit, by the lowest and the highest rank of the suit on
+# the board, shared with the ActionDecider: DISTANCE_TABLE[low, high, rank - 1].
+DISTANCE_TABLE: np.ndarray = np.array(CARD_DISTANCES, dtype=np.int8)
+
+_PLAY_ALL_CARDS_INDEX: int = action_to_index(PLAY_ALL_CARDS_ACTION)
+_TAKE_CARD_INDEX: int = action_to_index(TAKE_CARD_ACTION)
+
+
+def masks_to_bits(masks: Sequence[int]) -> np.ndarray:
+    """
+    Unpack bitmasks of cards into boolean arrays.
+
+    :param masks: the bitmasks of cards.
+    :return: a boolean array with one row of 52 cards per bitmask, by card index.
+    """
+
+    words = np.array(masks, dtype="<u8").reshape(-1, 1).view(np.uint8)
+    return np.unpackbits(words, axis=1, count=52, bitorder="little").view(bool)
+
+
+def card_distances(board_masks: Sequence[int]) -> np.ndarray:
+    """
+    Get the distance of every card to the cards on many boards at once, looked up in the distance table by the
+    frontier of every board.
+
+    :param board_masks: the bitmasks of the cards on the boards.
+    :return: an array with one row of 52 distances per board, by card index.
+    """
+
+    board = masks_to_bits(board_masks).reshape(-1, 4, 13)
+    ranks = board.shape[2]
+
+    # The frontier of a suit is its lowest and highest rank on the board, or the seven if the suit is empty
+    empty = ~board.any(axis=2)
+    low = np.where(empty, 7, board.argmax(axis=2) + 1)
+    high = np.where(empty, 7, ranks - board[:, :, ::-1].argmax(axis=2))
+
+    return DISTANCE_TABLE[low, high].reshape(-1, 52)
+
+
+def decide_actions(states: Sequence[GameState]) -> np.ndarray:
+    """
+    Decide the action of the player of the turn of many games at once, like the greedy strategy: play all cards
+    when possible, otherwise give away the card furthest from the board, play the card closest to it or take a
+    card. Ties go to the lowest card index.
+
+    :param states: the states of the games, which must not be finished.
+    :return: the action index decided for every game.
+    """
+
+    hands = masks_to_bits([state.hand_masks[state.turn_player_index] for state in states])
+    valid = hands & masks_to_bits([state.playable_mask for state in states])
+    distances = card_distances([state.board_mask for state in states])
+
+    give = np.array([state.phase is TurnPhase.GIVE for state in states], dtype=bool)
+    has_board = np.array([state.board_mask != 0 for state in states], dtype=bool)
+    has_valid = valid.any(axis=1)
+    play_all = has_valid & has_board & (valid == hands).all(axis=1)
+
+    play_indices = 2 * np.where(valid, distances, np.iinfo(np.int8).max).argmin(axis=1)
+    give_indices = 2 * np.where(hands, distances, -1).argmax(axis=1) + 1
+
+    return np.select([give, play_all, has_valid], [give_indices, _PLAY_ALL_CARDS_INDEX, play_indices],
+                     default=_TAKE_CARD_INDEX)
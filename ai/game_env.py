@@ -1,10 +1,13 @@
 import gym
 import numpy as np
 from gym import spaces
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from lib.action import Action, ActionType
-from lib.card import Card, Rank, Suit
+from ai.game_stepper import GameStepper, observation_box
+from ai.rewards import RewardConfig
+from lib.action import Action
+from lib.action_codec import ACTION_COUNT
+from lib.card import Rank, Suit
 
 from lib.game import Game
 
@@ -14,44 +17,33 @@ class GameEnv(gym.Env):
     and provides an interface for interacting with the game using the standard gym methods.
     """
 
-    def __init__(self, game: Game) -> None:
+    def __init__(self, game: Game, copy_observations: bool = True, extended_observations: bool = False,
+                 take_window: int = 4, reward_config: RewardConfig = RewardConfig()) -> None:
         """
         Initialize the environment with the given game.
 
         :param game: the game to initialize the environment with.
+        :param copy_observations: whether every observation is a new array. Otherwise the observations are
+                                  written into one reused buffer, which is overwritten by the next step.
+        :param extended_observations: whether the observations are extended with the playable cards, the
+                                      frontier of the board, the turn phase and the recent TAKE_CARD actions.
+        :param take_window: the number of recent TAKE_CARD actions of the extended observations.
+        :param reward_config: the rewards of the agent, which is the first player of the game.
         """
 
         super(GameEnv, self).__init__()
 
-        # Total number of cards in a deck
-        total_cards = 52
-
-        # Create a list of all possible actions
-        self.all_possible_actions: List[Action] = []
-        for suit in Suit:
-            for rank in Rank:
-                card = Card(suit=suit, rank=rank)
-                self.all_possible_actions.append(
-                    Action(type=ActionType.PLAY_CARD, card=card))
-                self.all_possible_actions.append(
-                    Action(type=ActionType.GIVE_CARD, card=card))
-        self.all_possible_actions += [
-            Action(type=ActionType.PLAY_ALL_CARDS),
-            Action(type=ActionType.TAKE_CARD),
-            Action(type=ActionType.PASS_TURN)
-        ]
+        self.__stepper = GameStepper(game, copy_observations=copy_observations,
+                                     extended_observations=extended_observations, take_window=take_window,
+                                     reward_config=reward_config)
+        self.all_possible_actions: List[Action] = self.__stepper.all_possible_actions
 
         # Define the action and observation space
-        self.action_space = spaces.Discrete(len(self.all_possible_actions))
-        self.observation_space = spaces.Box(
-            low=0,
-            high=total_cards,
-            shape=(total_cards * 2 + len(game.players) - 1,),
-            dtype=np.int32
-        )
+        self.action_space = spaces.Discrete(ACTION_COUNT)
+        self.observation_space = observation_box(spaces, self.__stepper.encoder)
 
         self.game = game
-        self.game.start()
+        self.__stepper.start(reset=False)
 
     def step(self, action: int) -> Tuple[np.array, float, bool, dict]:
         """
@@ -62,43 +54,19 @@ class GameEnv(gym.Env):
         :return: tuple containing the new observation, reward, whether the game is done and extra info.
         """
 
-        # Map to corresponding action
-        initial_action_choice: Action = self.all_possible_actions[action]
-        action_choice: Action = initial_action_choice
-
-        # If the action isn't valid for this state, select a new action at random until a valid one is found
-        if action_choice not in self.game.turn.actions:
-            # Give a small negative reward for attempting an invalid action
-            invalid_action_penalty = -0.01
-
-            while action_choice not in self.game.turn.actions:
-                action = self.action_space.sample()  # Sample a new action
-                action_choice = self.all_possible_actions[action]
-        else:
-            # The initial action was valid, so there is no penalty
-            invalid_action_penalty = 0
-
-        # Calculate the reward for the final action (valid initial or sampled)
-        reward = self.get_reward(action_choice) + invalid_action_penalty
+        reward, done = self.__stepper.step(action, self.np_random)
+        return self.get_state(), reward, done, {"action_mask": self.action_masks()}
 
-        self.game.execute_action(action_choice)
-
-        done = self.game.is_finished()
-        if done:
-            # Reward or penalty at the end of the game
-            reward = self.get_reward(action_choice)
-
-        return self.get_state(), reward, done, {}
-
-    def reset(self) -> np.array:
+    def reset(self, seed: Optional[int] = None) -> np.array:
         """
         Reset the state of the environment to an initial state.
 
+        :param seed: seed of the new game, or None to let the game draw one.
         :return: initial state of the environment.
         """
 
-        self.game.reset()
-        self.game.start()
+        super(GameEnv, self).reset(seed=seed)
+        self.__stepper.start(seed=seed)
         return self.get_state()
 
     def render(self, mode='human') -> None:
@@ -112,21 +80,14 @@ class GameEnv(gym.Env):
         self.__render_board()
         self.__render_finished_players()
 
-    def get_reward(self, action_choice: Action):
+    def action_masks(self) -> np.ndarray:
         """
-        Calculate and return the reward for the given action.
+        Return which actions are valid in the current state, for mask-aware policies such as MaskablePPO.
 
-        :param action_choice: the action to get the reward for.
-        :return: the reward for the given action.
+        :return: a copy of the boolean mask over the action space, True for every valid action.
         """
 
-        if self.game.is_finished():
-            if self.game.finished_players[0] == self.game.players[0]:
-                return 1.0
-            else:
-                return -1.0
-        else:
-            return 0  # default case (should ideally never be reached)
+        return self.__stepper.action_masks()
 
     def get_state(self) -> np.array:
         """
@@ -135,30 +96,7 @@ class GameEnv(gym.Env):
         :return: the current state of the game environment.
         """
 
-        # Flatten the board into a single list.
-        board_encoding = [card for suit in self.game.board for card in suit]
-
-        # One-hot encode the hand.
-        hand_encoding = [0]*52
-        for card in self.game.turn.player.hand:
-            hand_encoding[self.__card_to_index(card)] = 1
-
-        # Get the number of cards in each opponent's hand.
-        opponent_hand_sizes = [len(opponent.hand)
-                               for opponent in self.game.turn.opponents]
-
-        # Combine the encodings into a single list and return it.
-        return np.array(board_encoding + hand_encoding + opponent_hand_sizes)
-
-    def __card_to_index(self, card: Card) -> int:
-        """
-        Convert a card to an index.
-
-        :param card: the card to convert to an index.
-        :return: the index of the card.
-        """
-
-        return (card.suit.value - 1) * 13 + (card.rank.value - 1)
+        return self.__stepper.observation()
 
     def __render_board(self) -> None:
         """
@@ -171,13 +109,15 @@ class GameEnv(gym.Env):
             Rank.SIX: '6', Rank.FIVE: '5', Rank.FOUR: '4', Rank.THREE: '3', Rank.TWO: '2'
         }
 
+        board = self.game.board
+
         output = "|  ♥  |  ♦  |  ♣  |  ♠  |\n| --- | --- | --- | --- |\n"
 
         # Print the highest rank card for each suit
         for suit in Suit:
             rank_text = ""
             for i in range(Rank.KING.value, Rank.SEVEN.value, -1):
-                if self.game.board[suit.value - 1][i - 1]:
+                if board[suit.value - 1][i - 1]:
                     rank_text = f"{rank_symbols[Rank(i)]}  " if Rank.TEN != Rank(
                         i) else "10 "
                     break
@@ -186,15 +126,15 @@ class GameEnv(gym.Env):
 
         # Print the Seven of each suit, if it has been played
         for suit in Suit:
-            output += f"|  7  " if self.game.board[suit.value -
-                                                   1][Rank.SEVEN.value - 1] else "|     "
+            output += f"|  7  " if board[suit.value -
+                                         1][Rank.SEVEN.value - 1] else "|     "
         output += "|\n"
 
         # Print the lowest rank card for each suit
         for suit in Suit:
             rank_text = ""
             for i in range(Rank.ACE.value, Rank.SEVEN.value):
-                if self.game.board[suit.value - 1][i - 1]:
+                if board[suit.value - 1][i - 1]:
                     rank_text = f"{rank_symbols[Rank(i)]}  "
                     break
             output += f"|  {rank_text}" if rank_text else "|     "
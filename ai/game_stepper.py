@@ -0,0 +1,122 @@
+import numpy as np
+from typing import Any, List, Optional, Tuple
+
+from ai.observation import TOTAL_CARDS, ObservationEncoder
+from ai.rewards import RewardConfig, RewardTracker
+from lib.action import Action
+from lib.action_codec import ACTION_COUNT, ACTIONS, mask_to_indices
+from lib.game import Game
+
+
+def observation_box(spaces: Any, encoder: ObservationEncoder) -> Any:
+    """
+    Build the observation space of the observations written by an encoder.
+
+    :param spaces: the spaces module of gym or gymnasium.
+    :param encoder: the observation encoder.
+    :return: the Box of the observations, from 0 to the number of cards of a deck.
+    """
+
+    return spaces.Box(low=0, high=TOTAL_CARDS, shape=encoder.shape, dtype=encoder.dtype)
+
+
+class GameStepper:
+    """Steps a game for its first player, the agent, on behalf of a single-game environment. The stepper keeps the
+    mask of the valid actions, plays a random valid action instead of an invalid one, computes the reward of every
+    step and encodes the observation of the agent, so the gym and the gymnasium environments share them.
+    """
+
+    def __init__(self, game: Game, copy_observations: bool = True, extended_observations: bool = False,
+                 take_window: int = 4, reward_config: RewardConfig = RewardConfig()) -> None:
+        """
+        Initialize the stepper of the given game.
+
+        :param game: the game, where the first player is the agent.
+        :param copy_observations: whether every observation is a new array. Otherwise the observations are
+                                  written into one reused buffer, which is overwritten by the next step.
+        :param extended_observations: whether the observations are extended with the playable cards, the
+                                      frontier of the board, the turn phase and the recent TAKE_CARD actions.
+        :param take_window: the number of recent TAKE_CARD actions of the extended observations.
+        :param reward_config: the rewards of the agent.
+        """
+
+        self.game = game
+
+        # Create a list of all possible actions, indexed by their action index
+        self.all_possible_actions: List[Action] = list(ACTIONS)
+
+        self.encoder = ObservationEncoder(len(game.players), dtype=np.int32, extended=extended_observations,
+                                          take_window=take_window)
+        self.__copy_observations = copy_observations
+        self.__action_mask = np.zeros(ACTION_COUNT, dtype=bool)
+        self.__rewards = RewardTracker(reward_config)
+
+    def start(self, seed: Optional[int] = None, reset: bool = True) -> None:
+        """
+        Start a new game.
+
+        :param seed: seed of the new game, or None to let the game draw one.
+        :param reset: whether the game is reset before it is started, which a new game doesn't need.
+        """
+
+        if reset:
+            self.game.reset(seed=seed)
+        self.game.start()
+        self.__rewards.reset(self.game)
+        self.__update_action_mask()
+
+    def step(self, action: int, rng: np.random.Generator) -> Tuple[float, bool]:
+        """
+        Execute the action of the agent. If the action isn't valid, a random valid action is taken instead,
+        penalized by the reward of an invalid action.
+
+        :param action: the index of the action of the agent.
+        :param rng: the random number generator choosing the valid action taken instead of an invalid one.
+        :return: tuple containing the reward of the step and whether the game is finished.
+        """
+
+        # If the action isn't valid for this state, select one of the valid actions at random
+        invalid_action = not self.__action_mask[action]
+        if invalid_action:
+            action = rng.choice(np.flatnonzero(self.__action_mask))
+
+        self.game.execute_action(self.all_possible_actions[action])
+
+        # Calculate the reward of the step, including the reward or penalty at the end of the game
+        reward = self.__rewards.step(self.game, invalid_action)
+        done = self.game.is_finished()
+
+        self.__update_action_mask()
+
+        return reward, done
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Return which actions are valid in the current state, for mask-aware policies such as MaskablePPO.
+
+        :return: a copy of the boolean mask over the action space, True for every valid action.
+        """
+
+        return self.__action_mask.copy()
+
+    def observation(self) -> np.ndarray:
+        """
+        Encode the observation of the agent: the board, the hand of the player of the turn and the number of cards
+        of every opponent, and the extended features if enabled.
+
+        :return: the observation, or the reused buffer of the observation encoder if observations aren't copied.
+        """
+
+        observation = self.encoder.encode_game(self.game)
+        return observation.copy() if self.__copy_observations else observation
+
+    def __update_action_mask(self) -> None:
+        """
+        Precompute the mask of the valid actions for the current state from the action mask of the turn.
+        """
+
+        self.__action_mask[:] = False
+        if self.game.is_finished():
+            return
+
+        self.__action_mask[mask_to_indices(self.game.turn.action_mask)] = True
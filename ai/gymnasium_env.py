@@ -0,0 +1,93 @@
+import gymnasium
+import numpy as np
+from gymnasium import spaces
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai.game_stepper import GameStepper, observation_box
+from ai.rewards import RewardConfig
+from lib.action import Action
+from lib.action_codec import ACTION_COUNT
+from lib.game import Game, PlayerInfo
+
+
+class GymnasiumGameEnv(gymnasium.Env):
+    """Environment that follows the gymnasium interface, where the agent is the first player of the game.
+    Stepping returns the observation, the reward, whether the game is terminated or truncated and the extra info,
+    and resetting takes a seed and options and returns the observation and the extra info.
+
+    The environment only depends on gymnasium, not on the legacy gym package, and is created from the information
+    of its players, so it can be created in worker processes by gymnasium.vector.AsyncVectorEnv.
+    """
+
+    metadata = {"render_modes": []}
+
+    def __init__(self, player_infos: List[PlayerInfo], copy_observations: bool = True,
+                 extended_observations: bool = False, take_window: int = 4,
+                 reward_config: RewardConfig = RewardConfig()) -> None:
+        """
+        Initialize the environment with a game of the given players.
+
+        :param player_infos: the players of the game, where the first player is the agent.
+        :param copy_observations: whether every observation is a new array. Otherwise the observations are
+                                  written into one reused buffer, which is overwritten by the next step.
+        :param extended_observations: whether the observations are extended with the playable cards, the
+                                      frontier of the board, the turn phase and the recent TAKE_CARD actions.
+        :param take_window: the number of recent TAKE_CARD actions of the extended observations.
+        :param reward_config: the rewards of the agent.
+        """
+
+        super().__init__()
+
+        self.game = Game(player_infos=player_infos)
+        self.__stepper = GameStepper(self.game, copy_observations=copy_observations,
+                                     extended_observations=extended_observations, take_window=take_window,
+                                     reward_config=reward_config)
+        self.all_possible_actions: List[Action] = self.__stepper.all_possible_actions
+
+        # Define the action and observation space
+        self.action_space = spaces.Discrete(ACTION_COUNT)
+        self.observation_space = observation_box(spaces, self.__stepper.encoder)
+
+    def reset(self, *, seed: Optional[int] = None,
+              options: Optional[Dict[str, Any]] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Reset the environment to the start of a new game.
+
+        The seed of the game is drawn from the random number generator of the environment, so every game after
+        a seeded reset is reproducible.
+
+        :param seed: the seed of the random number generator of the environment, or None to keep its state.
+        :param options: the options of the reset, where "game_seed" sets the seed of the game itself.
+        :return: tuple containing the initial observation and the extra info.
+        """
+
+        super().reset(seed=seed)
+
+        game_seed = options.get("game_seed") if options else None
+        if game_seed is None:
+            game_seed = int(self.np_random.integers(2 ** 63))
+
+        self.__stepper.start(seed=game_seed)
+        return self.__stepper.observation(), {"action_mask": self.action_masks(), "game_seed": game_seed}
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
+        """
+        Execute one time step within the environment. If the action isn't valid, a random valid action is taken
+        instead, penalized by the reward of an invalid action.
+
+        :param action: the index of the action of the agent.
+        :return: tuple containing the new observation, the reward, whether the game is terminated, whether it is
+                 truncated and the extra info.
+        """
+
+        reward, terminated = self.__stepper.step(action, self.np_random)
+        return self.__stepper.observation(), reward, terminated, False, {"action_mask": self.action_masks()}
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Return which actions are valid in the current state, for mask-aware policies such as MaskablePPO.
+
+        :return: a copy of the boolean mask over the action space, True for every valid action.
+        """
+
+        return self.__stepper.action_masks()
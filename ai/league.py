@@ -0,0 +1,197 @@
+import random
+import numpy as np
+from stable_baselines3 import PPO
+from stable_baselines3.common.callbacks import BaseCallback
+from typing import List, Optional, Sequence
+
+from ai.batch_decider import decide_actions
+from ai.observation import ObservationEncoder
+from lib.action_codec import ACTION_COUNT, mask_to_indices
+from lib.game import Game
+from lib.game_state import GameState
+
+
+class League:
+    """League of snapshots of an agent saved during self-play training. Snapshots are sampled as opponents by how
+    often they beat the agent, so the agent trains more against the snapshots it hasn't learned to beat yet.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty league.
+
+        :param seed: the seed of the sampling of the snapshots.
+        """
+
+        self.paths: List[str] = []
+        self.__wins: List[int] = []
+        self.__games: List[int] = []
+        self.__rng = random.Random(seed)
+
+    def add(self, path: str) -> int:
+        """
+        Add a snapshot to the league.
+
+        :param path: the path the snapshot was saved to.
+        :return: the index of the snapshot in the league.
+        """
+
+        self.paths.append(path)
+        self.__wins.append(0)
+        self.__games.append(0)
+        return len(self.paths) - 1
+
+    def win_rate(self, index: int) -> float:
+        """
+        Get the estimated rate of the games of a snapshot where one of its seats finished ahead of the agent. The
+        estimate starts at one half for a snapshot that hasn't played yet.
+
+        :param index: the index of the snapshot.
+        :return: the win rate of the snapshot against the agent.
+        """
+
+        return (self.__wins[index] + 1) / (self.__games[index] + 2)
+
+    def sample(self) -> int:
+        """
+        Sample the snapshot to play against, weighted by the win rate of every snapshot.
+
+        :return: the index of the sampled snapshot.
+        """
+
+        if not self.paths:
+            raise ValueError("The league has no snapshots to sample")
+
+        weights = [self.win_rate(index) for index in range(len(self.paths))]
+        return self.__rng.choices(range(len(self.paths)), weights=weights)[0]
+
+    def record(self, index: int, snapshot_won: bool) -> None:
+        """
+        Record the result of a game of a snapshot against the agent.
+
+        :param index: the index of the snapshot.
+        :param snapshot_won: whether one of the seats of the snapshot finished ahead of the agent.
+        """
+
+        self.__games[index] += 1
+        if snapshot_won:
+            self.__wins[index] += 1
+
+
+class SnapshotOpponents:
+    """Opponent policy of a vectorized game environment that decides the actions of all the seats using the policy
+    strategy with a snapshot of the league. The observations of all the waiting games are encoded into one batch,
+    so every decision round of the environment takes a single forward pass of the snapshot. If the snapshot picks
+    an invalid action, the greedy strategy decides instead.
+
+    The snapshots sample their actions by default, since deterministic opponents that can't play may hand the
+    same cards around forever once the agent has finished.
+    """
+
+    def __init__(self, league: League, player_count: int, maskable: bool = False,
+                 extended_observations: bool = False, take_window: int = 4, deterministic: bool = False) -> None:
+        """
+        Initialize the opponents of the league.
+
+        :param league: the league of the snapshots.
+        :param player_count: the number of players of the games.
+        :param maskable: whether the snapshots were saved by MaskablePPO.
+        :param extended_observations: whether the snapshots observe the extended observations.
+        :param take_window: the number of recent TAKE_CARD actions of the extended observations.
+        :param deterministic: whether the snapshots pick their most likely action instead of sampling it.
+        """
+
+        self.league = league
+        self.index: Optional[int] = None
+        self.__maskable = maskable
+        self.__deterministic = deterministic
+        self.__model = None
+        self.__encoder = ObservationEncoder(player_count, dtype=np.int8, extended=extended_observations,
+                                            take_window=take_window)
+
+    def use(self, index: int) -> None:
+        """
+        Load the snapshot that decides the actions of the opponents from now on.
+
+        :param index: the index of the snapshot in the league.
+        """
+
+        if index == self.index:
+            return
+
+        if self.__maskable:
+            from sb3_contrib import MaskablePPO
+            self.__model = MaskablePPO.load(self.league.paths[index])
+        else:
+            self.__model = PPO.load(self.league.paths[index])
+        self.index = index
+
+    def __call__(self, games: List[Game], states: List[GameState]) -> np.ndarray:
+        """
+        Decide the action of the player of the turn of many games at once with the snapshot.
+
+        :param games: the games, which must not be finished.
+        :param states: the states of the games.
+        :return: the action index decided for every game.
+        """
+
+        if self.__model is None:
+            raise ValueError("No snapshot is used by the opponents")
+
+        observations = np.zeros((len(games),) + self.__encoder.shape, dtype=self.__encoder.dtype)
+        action_masks = np.zeros((len(games), ACTION_COUNT), dtype=bool)
+        for row, (game, state) in enumerate(zip(games, states)):
+            self.__encoder.encode_game(game, out=observations[row])
+            action_masks[row, mask_to_indices(state.legal_action_mask)] = True
+
+        if self.__maskable:
+            actions, _ = self.__model.predict(observations, deterministic=self.__deterministic,
+                                              action_masks=action_masks)
+        else:
+            actions, _ = self.__model.predict(observations, deterministic=self.__deterministic)
+        actions = np.asarray(actions, dtype=np.int64)
+
+        # Fall back to the greedy strategy for the games where the snapshot picked an invalid action
+        invalid = ~action_masks[np.arange(len(games)), actions]
+        if invalid.any():
+            actions[invalid] = decide_actions([state for state, bad in zip(states, invalid) if bad])
+        return actions
+
+
+class LeagueCallback(BaseCallback):
+    """Callback that records the results of the finished games of self-play training in the league, for the
+    snapshot used by the opponents. The snapshot wins a game when one of its seats finished ahead of the agent, so
+    the other opponents finishing ahead of the agent don't count for the snapshot.
+    """
+
+    def __init__(self, opponents: SnapshotOpponents, snapshot_seats: Sequence[int], agent_seat: int = 0) -> None:
+        """
+        Initialize the callback.
+
+        :param opponents: the opponents whose results are recorded.
+        :param snapshot_seats: the seats played by the snapshot.
+        :param agent_seat: the seat of the agent.
+        """
+
+        super(LeagueCallback, self).__init__()
+        self.opponents = opponents
+        self.snapshot_seats = list(snapshot_seats)
+        self.agent_seat = agent_seat
+
+    def _on_step(self) -> bool:
+        """
+        Record the results of the games that finished in the last step.
+
+        :return: True, to continue training.
+        """
+
+        if self.opponents.index is None or not self.snapshot_seats:
+            return True
+
+        for info in self.locals["infos"]:
+            positions = info.get("finishing_positions")
+            if positions is None:
+                continue
+            snapshot_won = min(positions[seat] for seat in self.snapshot_seats) < positions[self.agent_seat]
+            self.opponents.league.record(self.opponents.index, snapshot_won)
+        return True
@@ -0,0 +1,138 @@
+import numpy as np
+from typing import Mapping, Optional, Sequence, Tuple
+
+from lib.board import frontier_of
+from lib.card import Rank, Suit
+from lib.game import TAKE_HISTORY_LENGTH, Game
+from lib.game_state import GameState, TurnPhase
+
+# Total number of cards in a deck
+TOTAL_CARDS = 52
+
+# Shift of every card index, used to unpack the bitmasks of cards into one bit per card
+_CARD_SHIFTS: np.ndarray = np.arange(TOTAL_CARDS, dtype=np.uint64)
+
+
+def observation_size(player_count: int, extended: bool = False, take_window: int = 4) -> int:
+    """
+    Get the size of the observation of a game.
+
+    :param player_count: the number of players of the game.
+    :param extended: whether the observation is extended with the playable cards, the frontier of the board, the
+                     turn phase and the recent TAKE_CARD actions.
+    :param take_window: the number of recent TAKE_CARD actions of an extended observation.
+    :return: the number of values of the observation.
+    """
+
+    size = TOTAL_CARDS * 2 + player_count - 1
+    if extended:
+        size += TOTAL_CARDS + len(Suit) * 2 + len(TurnPhase) + take_window
+    return size
+
+
+class ObservationEncoder:
+    """Encodes what the player of the turn sees of a game into a reused NumPy buffer. The observation holds one
+    value per card on the board, one value per card in the hand of the player and the number of cards in the hand
+    of every opponent, in the order of play.
+
+    An extended observation adds one value per playable card, the lowest and the highest rank on the board of
+    every suit, a one-hot encoding of the turn phase and the players who took a card most recently. The players
+    are numbered relative to the player of the turn, starting at 1 for the player itself, and 0 marks an empty
+    slot of the window.
+
+    The bitmasks of the cards are unpacked with NumPy into preallocated scratch arrays, so encoding an
+    observation allocates no arrays.
+    """
+
+    def __init__(self, player_count: int, dtype: np.dtype = np.int32, extended: bool = False,
+                 take_window: int = 4) -> None:
+        """
+        Initialize the encoder for games with the given number of players.
+
+        :param player_count: the number of players of the games.
+        :param dtype: the data type of the observations.
+        :param extended: whether the observations are extended.
+        :param take_window: the number of recent TAKE_CARD actions of an extended observation.
+        """
+
+        if not 0 <= take_window <= TAKE_HISTORY_LENGTH:
+            raise ValueError(f"The take window must be between 0 and {TAKE_HISTORY_LENGTH}, got {take_window}")
+
+        self.player_count = player_count
+        self.extended = extended
+        self.take_window = take_window
+        self.shape = (observation_size(player_count, extended, take_window),)
+        self.dtype = np.dtype(dtype)
+
+        self.__buffer = np.zeros(self.shape, dtype=self.dtype)
+        self.__masks = np.zeros((3 if extended else 2, 1), dtype=np.uint64)
+        self.__bits = np.zeros((self.__masks.shape[0], TOTAL_CARDS), dtype=np.uint64)
+
+    def encode(self, state: GameState, out: Optional[np.ndarray] = None,
+               frontier: Optional[Mapping[Suit, Tuple[Rank, Rank]]] = None,
+               take_history: Sequence[int] = ()) -> np.ndarray:
+        """
+        Encode the observation of the player of the turn of a game.
+
+        :param state: the state of the game.
+        :param out: an array to write the observation into, such as a row of a batch of observations.
+                    Defaults to the buffer of the encoder, which is overwritten by the next call.
+        :param frontier: the frontier of the board of an extended observation, as kept by the board. Defaults to
+                         the frontier of the board of the state.
+        :param take_history: the players who took a card most recently, the most recent first.
+        :return: the array the observation was written into.
+        """
+
+        observation = self.__buffer if out is None else out
+
+        self.__masks[0, 0] = state.board_mask
+        self.__masks[1, 0] = state.hand_masks[state.turn_player_index]
+        if self.extended:
+            self.__masks[2, 0] = state.playable_mask
+        np.right_shift(self.__masks, _CARD_SHIFTS, out=self.__bits)
+        np.bitwise_and(self.__bits, 1, out=self.__bits)
+        observation[:TOTAL_CARDS * 2].reshape(2, TOTAL_CARDS)[:] = self.__bits[:2]
+
+        offset = TOTAL_CARDS * 2
+        for player_index, hand_mask in enumerate(state.hand_masks):
+            if player_index != state.turn_player_index:
+                observation[offset] = bin(hand_mask).count("1")
+                offset += 1
+
+        if not self.extended:
+            return observation
+
+        observation[offset:offset + TOTAL_CARDS] = self.__bits[2]
+        offset += TOTAL_CARDS
+
+        if frontier is None:
+            frontier = frontier_of(state.board_mask)
+        for suit in Suit:
+            low, high = frontier[suit]
+            observation[offset] = low.value
+            observation[offset + 1] = high.value
+            offset += 2
+
+        observation[offset:offset + len(TurnPhase)] = 0
+        observation[offset + state.phase.value - 1] = 1
+        offset += len(TurnPhase)
+
+        for slot in range(self.take_window):
+            if slot < len(take_history):
+                observation[offset + slot] = (take_history[slot] - state.turn_player_index) % self.player_count + 1
+            else:
+                observation[offset + slot] = 0
+
+        return observation
+
+    def encode_game(self, game: Game, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode the observation of the player of the turn of a started game, reading the frontier of the board and
+        the recent TAKE_CARD actions from the game, which keeps them up to date as it is played.
+
+        :param game: the game.
+        :param out: an array to write the observation into. Defaults to the buffer of the encoder.
+        :return: the array the observation was written into.
+        """
+
+        return self.encode(game.export_state(), out=out, frontier=game.frontier, take_history=game.take_history)
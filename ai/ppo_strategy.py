@@ -0,0 +1,57 @@
+import numpy as np
+from typing import Optional
+from stable_baselines3 import PPO
+
+from ai.observation import ObservationEncoder
+from lib.action import Action
+from lib.action_codec import ACTION_COUNT, ACTIONS, mask_to_indices
+from lib.game_state import GameState
+from lib.strategy import GreedyStrategy, Strategy
+
+
+class PPOStrategy(Strategy):
+    """Strategy that decides actions with a trained PPO agent. The observation of the agent is built from the
+    compact game state, in the same layout as the observations of the game environments. If the agent picks an
+    invalid action, the greedy strategy decides instead.
+    """
+
+    def __init__(self, model_path: str = "ppo_agent", maskable: bool = False) -> None:
+        """
+        Load the trained agent.
+
+        :param model_path: the path the agent was saved to.
+        :param maskable: whether the agent was trained with MaskablePPO.
+        """
+
+        if maskable:
+            from sb3_contrib import MaskablePPO
+            self.__model = MaskablePPO.load(model_path)
+        else:
+            self.__model = PPO.load(model_path)
+        self.__maskable = maskable
+        self.__fallback = GreedyStrategy()
+        self.__encoder: Optional[ObservationEncoder] = None
+
+    def decide_action(self, state: GameState) -> Action:
+        """
+        Decide the action of the player of the turn with the trained agent.
+
+        :param state: the state of the game.
+        :return: the action to take.
+        """
+
+        if self.__encoder is None or self.__encoder.player_count != len(state.hand_masks):
+            self.__encoder = ObservationEncoder(len(state.hand_masks), dtype=self.__model.observation_space.dtype)
+        observation = self.__encoder.encode(state)
+
+        legal_mask = state.legal_action_mask
+        if self.__maskable:
+            action_masks = np.zeros(ACTION_COUNT, dtype=bool)
+            action_masks[mask_to_indices(legal_mask)] = True
+            action, _ = self.__model.predict(observation, deterministic=True, action_masks=action_masks)
+        else:
+            action, _ = self.__model.predict(observation, deterministic=True)
+
+        if not (legal_mask >> int(action)) & 1:
+            return self.__fallback.decide_action(state)
+        return ACTIONS[int(action)]
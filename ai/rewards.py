@@ -0,0 +1,87 @@
+from typing import NamedTuple
+
+from lib.game import Game
+
+
+class RewardConfig(NamedTuple):
+    """Rewards of the agent. The default rewards only reward the end of the game, while the shaping rewards give
+    the agent a signal on every step.
+
+    :param win: the reward for finishing first.
+    :param loss: the reward for not finishing first.
+    :param invalid_action: the reward for attempting an invalid action.
+    :param card_shed: the reward for every card the agent gets rid of, by playing or giving it.
+    :param card_received: the reward for every card the agent receives through GIVE_CARD actions.
+    :param finish_position: the reward for finishing the game, scaled from 1 for finishing first to 0 for
+                            finishing last.
+    """
+
+    win: float = 1.0
+    loss: float = -1.0
+    invalid_action: float = -0.01
+    card_shed: float = 0.0
+    card_received: float = 0.0
+    finish_position: float = 0.0
+
+
+# Rewards that shape the reward of the agent on every step, for faster training.
+SHAPED_REWARDS = RewardConfig(card_shed=0.02, card_received=-0.02, finish_position=0.5)
+
+
+class RewardTracker:
+    """Computes the rewards of the agent of a game step by step. The rewards are computed from the changes of the
+    size of the hand of the agent and of the number of cards it has received, which the game keeps up to date, so
+    computing the reward of a step takes constant time.
+    """
+
+    def __init__(self, config: RewardConfig = RewardConfig(), player_index: int = 0) -> None:
+        """
+        Initialize the tracker.
+
+        :param config: the rewards of the agent.
+        :param player_index: the index of the agent in the game.
+        """
+
+        self.config = config
+        self.player_index = player_index
+        self.__hand_size = 0
+        self.__cards_received = 0
+
+    def reset(self, game: Game) -> None:
+        """
+        Start tracking a game that has just started.
+
+        :param game: the game.
+        """
+
+        self.__hand_size = game.players[self.player_index].hand_size
+        self.__cards_received = game.cards_received[self.player_index]
+
+    def step(self, game: Game, invalid_action: bool) -> float:
+        """
+        Compute the reward of the step that has just been taken in the game.
+
+        :param game: the game.
+        :param invalid_action: whether the agent attempted an invalid action in the step.
+        :return: the reward of the step.
+        """
+
+        config = self.config
+        hand_size = game.players[self.player_index].hand_size
+        cards_received = game.cards_received[self.player_index] - self.__cards_received
+        cards_shed = self.__hand_size + cards_received - hand_size
+        self.__hand_size = hand_size
+        self.__cards_received += cards_received
+
+        reward = config.card_shed * cards_shed + config.card_received * cards_received
+
+        if game.is_finished():
+            # Reward or penalty at the end of the game, which replaces the penalty of an invalid action
+            agent = game.players[self.player_index]
+            position = game.finished_players.index(agent)
+            reward += config.win if position == 0 else config.loss
+            reward += config.finish_position * (len(game.players) - 1 - position) / (len(game.players) - 1)
+        elif invalid_action:
+            reward += config.invalid_action
+
+        return reward
@@ -0,0 +1,114 @@
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ai.shared_vec_env import SharedMemoryVecEnv
+from ai.vec_game_env import VecGameEnv
+
+
+class StableBaselinesVecEnv(VecEnv):
+    """Adapter that exposes a natively vectorized game environment through the VecEnv interface of
+    stable-baselines3, so it can be trained on without wrapping every game in a DummyVecEnv.
+    """
+
+    def __init__(self, venv: Union[VecGameEnv, SharedMemoryVecEnv]) -> None:
+        """
+        Initialize the adapter around the given vectorized environment.
+
+        :param venv: the vectorized environment to adapt.
+        """
+
+        self.venv = venv
+        super(StableBaselinesVecEnv, self).__init__(
+            venv.num_envs, venv.observation_space, venv.action_space)
+
+    def reset(self) -> np.ndarray:
+        """
+        Reset all the environments, with the seeds set by seed, such as the seed of the model. Like the VecEnvs of
+        stable-baselines3, the seeds and options are only used by the next reset.
+
+        :return: a copy of the observations, since the environment reuses its observation array.
+        """
+
+        seeds = self._seeds if any(seed is not None for seed in self._seeds) else None
+        observations = self.venv.reset(seeds=seeds).copy()
+        self._reset_seeds()
+        self._reset_options()
+        return observations
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """
+        Tell all the environments to take a step with the given actions.
+
+        :param actions: one action index per environment.
+        """
+
+        self.venv.step_async(actions)
+
+    def step_wait(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        Wait for the step taken with step_async.
+
+        :return: copies of the observations, rewards and dones, and the extra info of every environment.
+        """
+
+        observations, rewards, dones, infos = self.venv.step_wait()
+        return observations.copy(), rewards.copy(), dones.copy(), infos
+
+    def close(self) -> None:
+        """
+        Clean up the resources of the environment.
+        """
+
+        self.venv.close()
+
+    def get_attr(self, attr_name: str, indices: Optional[Union[int, Sequence[int]]] = None) -> List[Any]:
+        """
+        Return an attribute of the vectorized environment, once per selected environment.
+
+        :param attr_name: the name of the attribute.
+        :param indices: the indices of the environments.
+        :return: the value of the attribute for every selected environment.
+        """
+
+        value = getattr(self.venv, attr_name)
+        return [value for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices: Optional[Union[int, Sequence[int]]] = None) -> None:
+        """
+        Set an attribute of the vectorized environment.
+
+        :param attr_name: the name of the attribute.
+        :param value: the value to assign.
+        :param indices: the indices of the environments, ignored since the attribute is shared.
+        """
+
+        setattr(self.venv, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices: Optional[Union[int, Sequence[int]]] = None, **method_kwargs) -> List[Any]:
+        """
+        Call a method of the vectorized environment, once per selected environment. The action masks are
+        computed for the whole batch at once and split into one mask per selected environment.
+
+        :param method_name: the name of the method.
+        :param indices: the indices of the environments.
+        :return: the value returned by the method for every selected environment.
+        """
+
+        if method_name == "action_masks":
+            action_masks = self.venv.action_masks()
+            return [action_masks[index].copy() for index in self._get_indices(indices)]
+
+        method = getattr(self.venv, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class: type, indices: Optional[Union[int, Sequence[int]]] = None) -> List[bool]:
+        """
+        Check if the environments are wrapped with a given wrapper, which they never are.
+
+        :param wrapper_class: the wrapper class.
+        :param indices: the indices of the environments.
+        :return: False for every selected environment.
+        """
+
+        return [False for _ in self._get_indices(indices)]
@@ -0,0 +1,231 @@
+import multiprocessing
+import numpy as np
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ai.vec_game_env import VecGameEnv
+from lib.game import PlayerInfo
+
+
+def _attach(name: str, shape: Tuple[int, ...], dtype: np.dtype) -> Tuple[SharedMemory, np.ndarray]:
+    """
+    Attach to a shared memory block and view it as an array.
+
+    :param name: the name of the shared memory block.
+    :param shape: the shape of the array.
+    :param dtype: the type of the array elements.
+    :return: tuple containing the shared memory block and the array backed by it.
+    """
+
+    shared_memory = SharedMemory(name=name)
+    return shared_memory, np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+
+
+def _worker(connection: Connection, buffers: Dict[str, Tuple[str, Tuple[int, ...], np.dtype]], start: int,
+            player_infos: List[PlayerInfo], num_envs: int, seed: Optional[int], env_kwargs: Dict[str, Any]) -> None:
+    """
+    Run a batch of games in a worker process. The worker waits for commands on its connection and exchanges
+    actions, observations, rewards and dones with the parent process through the shared memory buffers.
+
+    :param connection: the connection to the parent process.
+    :param buffers: the name, shape and type of the shared memory buffer of every exchanged array.
+    :param start: the index of the first game of the worker in the shared arrays.
+    :param player_infos: the players of every game.
+    :param num_envs: the number of games of the worker.
+    :param seed: the seed of the games of the worker.
+    :param env_kwargs: the extra keyword arguments of the VecGameEnv of the worker.
+    """
+
+    attached = {key: _attach(*buffer) for key, buffer in buffers.items()}
+    arrays = {key: array[start:start + num_envs]
+              for key, (_, array) in attached.items()}
+
+    venv = VecGameEnv(player_infos=player_infos, num_envs=num_envs, seed=seed,
+                      observations=arrays["observations"], action_masks=arrays["action_masks"], **env_kwargs)
+
+    try:
+        while True:
+            command = connection.recv()
+            if command == "step":
+                _, rewards, dones, infos = venv.step(arrays["actions"])
+                arrays["rewards"][:] = rewards
+                arrays["dones"][:] = dones
+                for index, info in enumerate(infos):
+                    if "terminal_observation" in info:
+                        arrays["terminal_observations"][index] = info.pop(
+                            "terminal_observation")
+                connection.send(infos)
+            elif command == "reset":
+                venv.reset(connection.recv())
+                connection.send(None)
+            elif command == "close":
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        venv.close()
+        for shared_memory, _ in attached.values():
+            shared_memory.close()
+        connection.close()
+
+
+class SharedMemoryVecEnv:
+    """Vectorized environment that runs batches of games in worker processes. Every worker steps its own
+    VecGameEnv, and actions, observations, action masks, rewards and dones are exchanged through shared memory
+    buffers instead of being pickled, so only the commands and the extra info travel over the pipes.
+
+    Games that finish are reset automatically, and the final observation is passed in the info of the game
+    under the key "terminal_observation".
+    """
+
+    def __init__(self, player_infos: List[PlayerInfo], num_workers: int, envs_per_worker: int,
+                 seed: Optional[int] = None, start_method: Optional[str] = None,
+                 env_kwargs: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initialize the environment and start the worker processes.
+
+        :param player_infos: the players of every game, where the first player is the agent.
+        :param num_workers: the number of worker processes.
+        :param envs_per_worker: the number of games stepped by every worker.
+        :param seed: the seed that the seeds of the workers are derived from.
+        :param start_method: the multiprocessing start method, defaults to the one of the platform.
+        :param env_kwargs: the extra keyword arguments of the VecGameEnv of every worker, such as the rewards.
+        """
+
+        env_kwargs = env_kwargs or {}
+        template = VecGameEnv(player_infos=player_infos, num_envs=0, **env_kwargs)
+        self.num_envs = num_workers * envs_per_worker
+        self.__envs_per_worker = envs_per_worker
+        self.render_mode = None
+        self.all_possible_actions = template.all_possible_actions
+        self.action_space = template.action_space
+        self.observation_space = template.observation_space
+
+        observation_shape = (self.num_envs,) + self.observation_space.shape
+        layouts = {
+            "observations": (observation_shape, np.dtype(np.int8)),
+            "terminal_observations": (observation_shape, np.dtype(np.int8)),
+            "action_masks": ((self.num_envs, self.action_space.n), np.dtype(bool)),
+            "actions": ((self.num_envs,), np.dtype(np.int64)),
+            "rewards": ((self.num_envs,), np.dtype(np.float32)),
+            "dones": ((self.num_envs,), np.dtype(bool)),
+        }
+        self.__shared_memories: List[SharedMemory] = []
+        self.__arrays: Dict[str, np.ndarray] = {}
+        buffers: Dict[str, Tuple[str, Tuple[int, ...], np.dtype]] = {}
+        for key, (shape, dtype) in layouts.items():
+            shared_memory = SharedMemory(create=True, size=max(
+                1, int(np.prod(shape)) * dtype.itemsize))
+            self.__shared_memories.append(shared_memory)
+            self.__arrays[key] = np.ndarray(
+                shape, dtype=dtype, buffer=shared_memory.buf)
+            buffers[key] = (shared_memory.name, shape, dtype)
+
+        context = multiprocessing.get_context(start_method)
+        self.__connections: List[Connection] = []
+        self.__processes: List[multiprocessing.Process] = []
+        for worker_index in range(num_workers):
+            parent_connection, child_connection = context.Pipe()
+            worker_seed = None if seed is None else seed * num_workers + worker_index
+            process = context.Process(target=_worker, args=(
+                child_connection, buffers, worker_index * envs_per_worker, player_infos, envs_per_worker, worker_seed,
+                env_kwargs),
+                daemon=True)
+            process.start()
+            child_connection.close()
+            self.__connections.append(parent_connection)
+            self.__processes.append(process)
+
+        self.__closed = False
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None) -> np.ndarray:
+        """
+        Reset all the games to an initial state.
+
+        :param seeds: the seed of every game, None for a game that keeps its generator, or None to reseed nothing.
+        :return: the shared observation array, which is overwritten by the next step.
+        """
+
+        for worker_index, connection in enumerate(self.__connections):
+            start = worker_index * self.__envs_per_worker
+            connection.send("reset")
+            connection.send(None if seeds is None else list(seeds[start:start + self.__envs_per_worker]))
+        for connection in self.__connections:
+            connection.recv()
+
+        return self.__arrays["observations"]
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """
+        Tell all the workers to take a step with the given actions.
+
+        :param actions: one action index per game.
+        """
+
+        self.__arrays["actions"][:] = actions
+        for connection in self.__connections:
+            connection.send("step")
+
+    def step_wait(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        Wait for all the workers to finish the step taken with step_async.
+
+        The returned arrays are backed by shared memory and overwritten by the next step.
+
+        :return: tuple containing the observations, rewards, dones and extra info of every game.
+        """
+
+        infos: List[Dict] = []
+        for connection in self.__connections:
+            infos += connection.recv()
+
+        for index in np.flatnonzero(self.__arrays["dones"]):
+            infos[index]["terminal_observation"] = self.__arrays["terminal_observations"][index].copy()
+
+        return self.__arrays["observations"], self.__arrays["rewards"], self.__arrays["dones"], infos
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        Execute one time step within every game.
+
+        :param actions: one action index per game.
+        :return: tuple containing the observations, rewards, dones and extra info of every game.
+        """
+
+        self.step_async(actions)
+        return self.step_wait()
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Return which actions are valid in the current state of every game, for mask-aware policies such as
+        MaskablePPO.
+
+        :return: the shared boolean mask array, with one row per game, which is overwritten by the next step.
+        """
+
+        return self.__arrays["action_masks"]
+
+    def close(self) -> None:
+        """
+        Stop the worker processes and release the shared memory buffers.
+        """
+
+        if self.__closed:
+            return
+        self.__closed = True
+
+        for connection in self.__connections:
+            try:
+                connection.send("close")
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self.__processes:
+            process.join()
+        for connection in self.__connections:
+            connection.close()
+
+        self.__arrays.clear()
+        for shared_memory in self.__shared_memories:
+            shared_memory.close()
+            shared_memory.unlink()
@@ -1,35 +1,104 @@
+import argparse
+import os
+from typing import Optional
+
 from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import DummyVecEnv
 
-from ai.game_env import GameEnv
-from lib.game import Game, PlayerInfo
+from ai.league import League, LeagueCallback, SnapshotOpponents
+from ai.rewards import SHAPED_REWARDS, RewardConfig
+from ai.sb3_vec_env import StableBaselinesVecEnv
+from ai.shared_vec_env import SharedMemoryVecEnv
+from ai.vec_game_env import POLICY_STRATEGY, VecGameEnv
+from lib.game import PlayerInfo
 from lib.player import PlayerType
 
 if __name__ == "__main__":
     import sys
     try:
-        # Define the game with players' information
-        game = Game(player_infos=[
-                    PlayerInfo(name="Agent", type=PlayerType.AGENT),
-                    PlayerInfo(name="Alice", type=PlayerType.AI),
-                    PlayerInfo(name="Ted", type=PlayerType.AI),
-                    PlayerInfo(name="Eve", type=PlayerType.AI)])
+        parser = argparse.ArgumentParser(
+            description="Train a PPO agent to play Sjuan.")
+        parser.add_argument("-w", "--workers", type=int, default=1,
+                            help="number of worker processes running games (default: 1)")
+        parser.add_argument("-e", "--envs-per-worker", type=int, default=8,
+                            help="number of games stepped by every worker (default: 8)")
+        parser.add_argument("-m", "--maskable", action="store_true",
+                            help="train with MaskablePPO, which never picks invalid actions")
+        parser.add_argument("-t", "--timesteps", type=int, default=10000,
+                            help="number of timesteps to train for (default: 10000)")
+        parser.add_argument("-s", "--shaped-rewards", action="store_true",
+                            help="reward the agent for every card it sheds and penalize every card it receives")
+        parser.add_argument("--self-play", action="store_true",
+                            help="train against a league of snapshots of the agent")
+        parser.add_argument("--snapshot-seats", type=int, default=2,
+                            help="number of opponents playing a snapshot in self-play (default: 2)")
+        parser.add_argument("--snapshot-interval", type=int, default=10000,
+                            help="number of timesteps between snapshots in self-play (default: 10000)")
+        parser.add_argument("--league-dir", default="league",
+                            help="directory the snapshots of self-play are saved to (default: league)")
+        args = parser.parse_args()
+
+        if args.self_play and args.workers > 1:
+            parser.error("self-play decides the actions of the snapshots in this process and needs --workers 1")
+        if args.self_play and not 1 <= args.snapshot_seats <= 3:
+            parser.error("--snapshot-seats must be between 1 and 3")
+
+        # Define the players' information of every game
+        player_infos = [
+            PlayerInfo(name="Agent", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI),
+            PlayerInfo(name="Eve", type=PlayerType.AI)]
 
-        # Initialize your environment
-        env = GameEnv(game)
+        # In self-play, the last opponents play a snapshot of the agent, decided in batch over all games
+        opponents: Optional[SnapshotOpponents] = None
+        if args.self_play:
+            snapshot_seats = range(len(player_infos) - args.snapshot_seats, len(player_infos))
+            opponents = SnapshotOpponents(League(), len(player_infos), maskable=args.maskable)
+            for seat in snapshot_seats:
+                player_infos[seat] = player_infos[seat]._replace(strategy=POLICY_STRATEGY)
 
-        # Vectorized environments allow to easily multiprocess training
-        # We only use one for this example hence the DummyVecEnv
-        vec_env = DummyVecEnv([lambda: env])
+        # Reward the agent at the end of the game only, or shape the reward on every step
+        reward_config = SHAPED_REWARDS if args.shaped_rewards else RewardConfig()
 
-        # Initialize the agent using PPO with a MLP (feed-forward neural network) policy
-        model = PPO("MlpPolicy", vec_env, verbose=1)
+        # Step a batch of games in lockstep, either in this process or in every worker process
+        if args.workers > 1:
+            venv = SharedMemoryVecEnv(player_infos=player_infos, num_workers=args.workers,
+                                      envs_per_worker=args.envs_per_worker,
+                                      env_kwargs={"reward_config": reward_config})
+        else:
+            venv = VecGameEnv(player_infos=player_infos, num_envs=args.envs_per_worker,
+                              batch_opponents=args.self_play, reward_config=reward_config,
+                              opponent_policy=opponents)
+        vec_env = StableBaselinesVecEnv(venv)
 
-        # Train the agent for specified timesteps
-        model.learn(total_timesteps=10000, progress_bar=True)
+        # Initialize the agent using PPO with a MLP (feed-forward neural network) policy, optionally masking
+        # the invalid actions of every state
+        if args.maskable:
+            from sb3_contrib import MaskablePPO
+            model = MaskablePPO("MlpPolicy", vec_env, verbose=1)
+        else:
+            model = PPO("MlpPolicy", vec_env, verbose=1)
+
+        # Train the agent for specified timesteps. In self-play, a snapshot of the agent is added to the league
+        # every interval, and the opponents play a snapshot sampled from the league until the next one
+        if args.self_play:
+            os.makedirs(args.league_dir, exist_ok=True)
+            league = opponents.league
+            callback = LeagueCallback(opponents, snapshot_seats)
+            while model.num_timesteps < args.timesteps:
+                path = os.path.join(args.league_dir, f"snapshot_{len(league.paths)}")
+                model.save(path)
+                league.add(path)
+                opponents.use(league.sample())
+                model.learn(total_timesteps=min(args.snapshot_interval, args.timesteps - model.num_timesteps),
+                            reset_num_timesteps=False, callback=callback)
+        else:
+            model.learn(total_timesteps=args.timesteps, progress_bar=True)
 
         # Save the trained agent for future use
         model.save("ppo_agent")
+
+        vec_env.close()
     except KeyboardInterrupt:
         # Graceful shutdown on keyboard interrupt
         print("\nQuiting...")
@@ -0,0 +1,280 @@
+import random
+import numpy as np
+from gymnasium import spaces
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ai.batch_decider import decide_actions
+from ai.game_stepper import observation_box
+from ai.observation import ObservationEncoder
+from ai.rewards import RewardConfig, RewardTracker
+from lib.action import Action
+from lib.action_codec import ACTION_COUNT, ACTIONS, mask_to_indices
+from lib.game import Game, PlayerInfo
+from lib.game_state import GameState
+from lib.player import PlayerType
+
+# Strategy of the seats whose actions are decided by the opponent policy of the environment.
+POLICY_STRATEGY = "policy"
+
+# Policy deciding the action indices of the player of the turn of many games at once, from the games and their states.
+OpponentPolicy = Callable[[List[Game], List[GameState]], np.ndarray]
+
+
+class VecGameEnv:
+    """Vectorized environment that steps a batch of games in lockstep. Every game has the same players, and the
+    agent is always the first player. Observations are written into one preallocated array, and rewards and
+    dones are returned as arrays, so stepping the batch costs one call instead of one call per game.
+
+    Games that finish are reset automatically, and the final observation is passed in the info of the game
+    under the key "terminal_observation".
+
+    With batched opponents, the computer controlled players of all games decide their actions together with the
+    vectorized greedy decider, instead of one game at a time. Seats using the policy strategy decide their actions
+    together with the opponent policy of the environment instead, such as snapshots of earlier agents.
+    """
+
+    def __init__(self, player_infos: List[PlayerInfo], num_envs: int, seed: Optional[int] = None,
+                 observations: Optional[np.ndarray] = None, action_masks: Optional[np.ndarray] = None,
+                 batch_opponents: bool = False, extended_observations: bool = False, take_window: int = 4,
+                 reward_config: RewardConfig = RewardConfig(),
+                 opponent_policy: Optional[OpponentPolicy] = None) -> None:
+        """
+        Initialize the environment with a batch of games.
+
+        :param player_infos: the players of every game, where the first player is the agent.
+        :param num_envs: the number of games to step in lockstep.
+        :param seed: the seed that the seeds of all games are drawn from.
+        :param observations: an array to write the observations into, such as one backed by shared memory.
+                             Defaults to a newly allocated array.
+        :param action_masks: an array to write the masks of the valid actions into. Defaults to a newly
+                             allocated array.
+        :param batch_opponents: whether the computer controlled players of all games decide their actions in
+                                batch, which requires them to use the greedy or the policy strategy.
+        :param extended_observations: whether the observations are extended with the playable cards, the
+                                      frontier of the board, the turn phase and the recent TAKE_CARD actions.
+        :param take_window: the number of recent TAKE_CARD actions of the extended observations.
+        :param reward_config: the rewards of the agent.
+        :param opponent_policy: the policy of the batched opponents using the policy strategy.
+        """
+
+        # Create a list of all possible actions, indexed by their action index
+        self.all_possible_actions: List[Action] = list(ACTIONS)
+
+        self.num_envs = num_envs
+        self.render_mode = None
+
+        self.__encoder = ObservationEncoder(len(player_infos), dtype=np.int8, extended=extended_observations,
+                                            take_window=take_window)
+
+        # Define the action and observation space of a single game
+        self.action_space = spaces.Discrete(ACTION_COUNT)
+        self.observation_space = observation_box(spaces, self.__encoder)
+
+        # Seats whose actions are decided in batch, which the games leave for the environment to play
+        self.__batched_seats = set()
+        self.__policy_seats = set()
+        self.__opponent_policy = opponent_policy
+        if batch_opponents:
+            for seat, player_info in enumerate(player_infos):
+                if player_info.type is not PlayerType.AI:
+                    continue
+                if player_info.strategy == POLICY_STRATEGY:
+                    if opponent_policy is None:
+                        raise ValueError("Batched opponents using the policy strategy need an opponent policy")
+                    self.__policy_seats.add(seat)
+                elif player_info.strategy != "greedy":
+                    raise ValueError(
+                        f"Batched opponents must use the greedy or the policy strategy, got {player_info.strategy}")
+                self.__batched_seats.add(seat)
+            player_infos = [player_info._replace(type=PlayerType.AGENT) if seat in self.__batched_seats
+                            else player_info for seat, player_info in enumerate(player_infos)]
+
+        seed_rng = random.Random(seed)
+        self.__game_seed_rngs = [random.Random(seed_rng.getrandbits(64)) for _ in range(num_envs)]
+        self.games: List[Game] = [Game(player_infos=player_infos, seed=game_seed_rng)
+                                  for game_seed_rng in self.__game_seed_rngs]
+        self.__rng = random.Random(seed_rng.getrandbits(64))
+
+        self.__observations = observations if observations is not None else np.zeros(
+            (num_envs,) + self.observation_space.shape, dtype=np.int8)
+        self.__action_masks = action_masks if action_masks is not None else np.zeros(
+            (num_envs, self.action_space.n), dtype=bool)
+        self.__rewards = np.zeros(num_envs, dtype=np.float32)
+        self.__reward_trackers = [RewardTracker(reward_config) for _ in range(num_envs)]
+        self.__invalid_actions = np.zeros(num_envs, dtype=bool)
+        self.__dones = np.zeros(num_envs, dtype=bool)
+        self.__actions: Optional[np.ndarray] = None
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None) -> np.ndarray:
+        """
+        Reset all the games to an initial state.
+
+        A game given a seed reseeds the generator its seeds are drawn from, so it and every game after it are
+        reproducible. The choice of the valid actions played instead of invalid ones is reseeded as well.
+
+        :param seeds: the seed of every game, None for a game that keeps its generator, or None to reseed nothing.
+        :return: the preallocated observation array, which is overwritten by the next step.
+        """
+
+        if seeds is not None:
+            for game_seed_rng, seed in zip(self.__game_seed_rngs, seeds):
+                if seed is not None:
+                    game_seed_rng.seed(seed)
+            if any(seed is not None for seed in seeds):
+                self.__rng.seed(",".join(str(seed) for seed in seeds))
+
+        for game in self.games:
+            game.reset()
+            game.start()
+        self.__play_opponents(range(self.num_envs))
+
+        for index, game in enumerate(self.games):
+            self.__reward_trackers[index].reset(game)
+            self.__write_observation(index)
+
+        return self.__observations
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """
+        Tell all the games to take a step with the given actions.
+
+        :param actions: one action index per game.
+        """
+
+        self.__actions = actions
+
+    def step_wait(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        Execute the actions given to step_async in every game.
+
+        The returned arrays are preallocated and overwritten by the next step.
+
+        :return: tuple containing the observations, rewards, dones and extra info of every game.
+        """
+
+        infos: List[Dict] = [{} for _ in range(self.num_envs)]
+
+        for index, game in enumerate(self.games):
+            action = self.__actions[index]
+
+            # If the action isn't valid for this state, play a random valid action instead, which is penalized
+            # by the reward of an invalid action
+            self.__invalid_actions[index] = not self.__action_masks[index, action]
+            if self.__invalid_actions[index]:
+                action = self.__rng.choice(
+                    np.flatnonzero(self.__action_masks[index]))
+
+            game.execute_action(self.all_possible_actions[action])
+        self.__play_opponents(range(self.num_envs))
+
+        restarted: List[int] = []
+        for index, game in enumerate(self.games):
+            # Calculate the reward of the step, including the reward or penalty at the end of the game
+            self.__rewards[index] = self.__reward_trackers[index].step(game, self.__invalid_actions[index])
+
+            if game.is_finished():
+                self.__dones[index] = True
+                infos[index]["finishing_position"] = game.finished_players.index(game.players[0])
+                infos[index]["finishing_positions"] = [game.finished_players.index(player) for player in game.players]
+
+                self.__write_observation(index)
+                infos[index]["terminal_observation"] = self.__observations[index].copy()
+
+                game.reset()
+                game.start()
+                restarted.append(index)
+            else:
+                self.__dones[index] = False
+        self.__play_opponents(restarted)
+        for index in restarted:
+            self.__reward_trackers[index].reset(self.games[index])
+
+        for index in range(self.num_envs):
+            self.__write_observation(index)
+
+        self.__actions = None
+
+        return self.__observations, self.__rewards, self.__dones, infos
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        Execute one time step within every game.
+
+        :param actions: one action index per game.
+        :return: tuple containing the observations, rewards, dones and extra info of every game.
+        """
+
+        self.step_async(actions)
+        return self.step_wait()
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Return which actions are valid in the current state of every game, for mask-aware policies such as
+        MaskablePPO.
+
+        :return: the preallocated boolean mask array, with one row per game, which is overwritten by the next step.
+        """
+
+        return self.__action_masks
+
+    def close(self) -> None:
+        """
+        Clean up the resources of the environment.
+        """
+
+        self.__actions = None
+
+    def __play_opponents(self, indices: Iterable[int]) -> None:
+        """
+        Play the turns of the batched opponents of the given games, until it's the turn of the agent or the
+        game is finished. The opponents of all games waiting on them decide their actions together.
+
+        :param indices: the indices of the games.
+        """
+
+        if not self.__batched_seats:
+            return
+
+        pending = list(indices)
+        while pending:
+            greedy_waiting: List[int] = []
+            greedy_states: List[GameState] = []
+            policy_waiting: List[int] = []
+            policy_states: List[GameState] = []
+            for index in pending:
+                game = self.games[index]
+                if game.is_finished():
+                    continue
+                state = game.export_state()
+                if state.turn_player_index in self.__policy_seats:
+                    policy_waiting.append(index)
+                    policy_states.append(state)
+                elif state.turn_player_index in self.__batched_seats:
+                    greedy_waiting.append(index)
+                    greedy_states.append(state)
+            if not greedy_waiting and not policy_waiting:
+                return
+
+            if greedy_waiting:
+                for index, action in zip(greedy_waiting, decide_actions(greedy_states)):
+                    self.games[index].execute_action(self.all_possible_actions[action])
+            if policy_waiting:
+                actions = self.__opponent_policy([self.games[index] for index in policy_waiting], policy_states)
+                for index, action in zip(policy_waiting, actions):
+                    self.games[index].execute_action(self.all_possible_actions[action])
+            pending = greedy_waiting + policy_waiting
+
+    def __write_observation(self, index: int) -> None:
+        """
+        Write the observation of a game into its row of the observation array, and the mask of its valid
+        actions into its row of the action mask array.
+
+        :param index: the index of the game.
+        """
+
+        game = self.games[index]
+        self.__encoder.encode_game(game, out=self.__observations[index])
+
+        action_mask = self.__action_masks[index]
+        action_mask[:] = False
+        action_mask[mask_to_indices(game.turn.action_mask)] = True
@@ -118,13 +118,15 @@ class GameScreen(Screen):
             Rank.SIX: '6', Rank.FIVE: '5', Rank.FOUR: '4', Rank.THREE: '3', Rank.TWO: '2'
         }
 
+        board = self.__game.board
+
         output = "|  ♥  |  ♦  |  ♣  |  ♠  |\n| --- | --- | --- | --- |\n"
 
         # Print the highest rank card for each suit
         for suit in Suit:
             rank_text = ""
             for i in range(Rank.KING.value, Rank.SEVEN.value, -1):
-                if self.__game.board[suit.value - 1][i - 1]:
+                if board[suit.value - 1][i - 1]:
                     rank_text = f"{rank_symbols[Rank(i)]}  " if Rank.TEN != Rank(
                         i) else "10 "
                     break
@@ -133,15 +135,15 @@ class GameScreen(Screen):
 
         # Print the Seven of each suit, if it has been played
         for suit in Suit:
-            output += f"|  7  " if self.__game.board[suit.value -
-                                                     1][Rank.SEVEN.value - 1] else "|     "
+            output += f"|  7  " if board[suit.value -
+                                         1][Rank.SEVEN.value - 1] else "|     "
         output += "|\n"
 
         # Print the lowest rank card for each suit
         for suit in Suit:
             rank_text = ""
             for i in range(Rank.ACE.value, Rank.SEVEN.value):
-                if self.__game.board[suit.value - 1][i - 1]:
+                if board[suit.value - 1][i - 1]:
                     rank_text = f"{rank_symbols[Rank(i)]}  "
                     break
             output += f"|  {rank_text}" if rank_text else "|     "
@@ -172,8 +174,7 @@ class GameScreen(Screen):
         :return: Tuple containing a list of strings representing the actions and the width of the actions.
         """
 
-        best_action = ActionDecider.decide_action(
-            self.__game.board, self.__game.turn)
+        best_action = ActionDecider.decide_state_action(self.__game.export_state())
 
         output = ""
         for i, action in enumerate(actions):
@@ -62,24 +62,26 @@ class Action:
         """
         Determines if this action is equal to another action.
 
-        Two actions are equal if they are of the same type and have the same associated card.
+        Two actions are equal if they are of the same type and have the same associated card. Action types
+        and cards are singletons, so they are compared by identity.
 
         :param other_action: Action, the other action to compare with.
         :return: bool, True if actions are equal, False otherwise.
         """
 
-        return isinstance(other_action, Action) and self.type == other_action.type and self.card == other_action.card
+        return isinstance(other_action, Action) and self.__type is other_action.type and self.__card is other_action.card
 
     def __hash__(self) -> int:
         """
         Calculates the hash of the action.
 
-        The hash is calculated based on the action type and the associated card.
+        The hash is calculated based on the action type and the associated card. Only integers are hashed, so
+        the hash, and the iteration order of sets of actions, is the same in every process.
 
         :return: int, the hash of the action.
         """
 
-        return hash((self.type, self.card))
+        return hash((self.type.value, self.card.index if self.card is not None else -1))
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,135 @@
+# lib/action_codec.py
+
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple
+
+from .action import Action, ActionType
+from .card import CARDS, Rank
+
+
+# Canonical encoding of every possible action as an integer. The actions with a card come first, with the play
+# and the give action of every card interleaved by card index, followed by the actions without a card.
+ACTION_COUNT: int = len(CARDS) * 2 + 3
+
+ACTIONS: Tuple[Action, ...] = tuple(
+    Action(type=action_type, card=card) for card in CARDS for action_type in (ActionType.PLAY_CARD, ActionType.GIVE_CARD)) + (
+    Action(type=ActionType.PLAY_ALL_CARDS),
+    Action(type=ActionType.TAKE_CARD),
+    Action(type=ActionType.PASS_TURN))
+
+# Shared instances of the actions with a card, indexed by card index, and of the actions without a card.
+PLAY_CARD_ACTIONS: Tuple[Action, ...] = ACTIONS[0:len(CARDS) * 2:2]
+GIVE_CARD_ACTIONS: Tuple[Action, ...] = ACTIONS[1:len(CARDS) * 2:2]
+PLAY_ALL_CARDS_ACTION: Action = ACTIONS[len(CARDS) * 2]
+TAKE_CARD_ACTION: Action = ACTIONS[len(CARDS) * 2 + 1]
+PASS_TURN_ACTION: Action = ACTIONS[len(CARDS) * 2 + 2]
+
+# Offset of every action type in the encoding, indexed by the value of the action type.
+_ACTION_OFFSETS: List[int] = [
+    min((index for index, action in enumerate(ACTIONS) if action.type.value == value), default=0)
+    for value in range(len(ActionType) + 1)]
+
+# Bits of the actions without a card in a bitmask of action indices.
+PLAY_ALL_CARDS_BIT: int = 1 << (len(CARDS) * 2)
+TAKE_CARD_BIT: int = 1 << (len(CARDS) * 2 + 1)
+PASS_TURN_BIT: int = 1 << (len(CARDS) * 2 + 2)
+
+# Bits of the play actions of every combination of the cards of one suit, by the bitmask of the ranks of the cards.
+_SUIT_PLAY_BITS: List[int] = [
+    sum(1 << rank * 2 for rank in range(len(Rank)) if rank_mask >> rank & 1) for rank_mask in range(1 << len(Rank))]
+
+
+def action_to_index(action: Action) -> int:
+    """
+    Encodes an action as an integer.
+
+    :param action: The action to encode.
+    :return: Index of the action, from 0 to ACTION_COUNT - 1.
+    """
+
+    if action.card is None:
+        return _ACTION_OFFSETS[action.type.value]
+    return _ACTION_OFFSETS[action.type.value] + action.card.index * 2
+
+
+def index_to_action(index: int) -> Action:
+    """
+    Decodes an action from an integer.
+
+    :param index: Index of the action, from 0 to ACTION_COUNT - 1.
+    :return: The shared instance of the action.
+    """
+
+    return ACTIONS[index]
+
+
+def actions_to_mask(actions: Iterable[Action]) -> int:
+    """
+    Encodes a collection of actions as a compact bitmask.
+
+    :param actions: The actions to encode.
+    :return: Bitmask where the bit of every action index is set.
+    """
+
+    mask = 0
+    for action in actions:
+        mask |= 1 << action_to_index(action)
+    return mask
+
+
+def cards_to_action_mask(card_mask: int, give: bool = False) -> int:
+    """
+    Encodes the play or the give actions of a bitmask of card indices as a bitmask of action indices, by looking
+    up the bits of every suit instead of visiting every card.
+
+    :param card_mask: Bitmask of card indices.
+    :param give: Whether the give actions are encoded instead of the play actions.
+    :return: Bitmask of action indices.
+    """
+
+    suit_mask = (1 << len(Rank)) - 1
+    action_mask = (_SUIT_PLAY_BITS[card_mask & suit_mask]
+                   | _SUIT_PLAY_BITS[card_mask >> len(Rank) & suit_mask] << len(Rank) * 2
+                   | _SUIT_PLAY_BITS[card_mask >> len(Rank) * 2 & suit_mask] << len(Rank) * 4
+                   | _SUIT_PLAY_BITS[card_mask >> len(Rank) * 3] << len(Rank) * 6)
+    return action_mask << 1 if give else action_mask
+
+
+@lru_cache(maxsize=4096)
+def mask_to_action_set(mask: int) -> FrozenSet[Action]:
+    """
+    Decodes the actions of a bitmask into an immutable set. The sets of recently seen bitmasks are cached, so the
+    same set is shared by every turn with the same actions.
+
+    :param mask: Bitmask of action indices.
+    :return: Frozen set of the shared instances of the actions.
+    """
+
+    return frozenset(mask_to_actions(mask))
+
+
+def mask_to_indices(mask: int) -> List[int]:
+    """
+    Decodes the action indices of a bitmask, in ascending order.
+
+    :param mask: Bitmask of action indices.
+    :return: List of action indices.
+    """
+
+    indices = []
+    while mask:
+        lowest_bit = mask & -mask
+        indices.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return indices
+
+
+def mask_to_actions(mask: int) -> List[Action]:
+    """
+    Decodes the actions of a bitmask, in ascending order of their indices.
+
+    :param mask: Bitmask of action indices.
+    :return: List of the shared instances of the actions.
+    """
+
+    return [ACTIONS[index] for index in mask_to_indices(mask)]
@@ -1,12 +1,64 @@
 # lib/action_decider.py
 
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
 
 from .action import Action, ActionType
+from .action_codec import GIVE_CARD_ACTIONS, PLAY_ALL_CARDS_ACTION, PLAY_CARD_ACTIONS, TAKE_CARD_ACTION
+from .board import frontier_of
 from .card import Card, Rank, Suit
+from .game_state import GameState, TurnPhase
 from .turn import Turn
 
 
+# Distance of every rank to the cards on the board of its suit, by the lowest and the highest rank of the suit on
+# the board: CARD_DISTANCES[low][high][rank - 1]. A card that can be played immediately has a distance of 0.
+CARD_DISTANCES: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(rank - high if rank > high else low - rank if rank < low else 0 for rank in range(1, len(Rank) + 1))
+          for high in range(len(Rank) + 1))
+    for low in range(len(Rank) + 1))
+
+# Frontiers of recently analyzed boards, by the bitmask of the cards on the board.
+_cached_frontier_of = lru_cache(maxsize=4096)(frontier_of)
+
+
+@lru_cache(maxsize=4096)
+def card_distances_of(board_mask: int) -> Tuple[int, ...]:
+    """
+    Get the distance of every card to the cards on a board, looked up in the distance tables by the frontier of
+    the board. Recently seen boards are cached by their bitmask.
+
+    :param board_mask: Bitmask of the cards on the board.
+    :return: Distance of every card, by card index.
+    """
+
+    frontier = frontier_of(board_mask)
+    return tuple(distance for suit in Suit
+                 for distance in CARD_DISTANCES[frontier[suit][0].value][frontier[suit][1].value])
+
+
+def _best_card_index(card_mask: int, distances: Tuple[int, ...], furthest: bool) -> int:
+    """
+    Get the card of a bitmask that is closest to or furthest from the board. Ties go to the lowest card index.
+
+    :param card_mask: Bitmask of the cards to choose from, which must not be empty.
+    :param distances: Distance of every card, by card index.
+    :param furthest: Whether the furthest card is chosen instead of the closest.
+    :return: Index of the chosen card.
+    """
+
+    best_index = -1
+    best_distance = -1 if furthest else len(Rank)
+    while card_mask:
+        bit = card_mask & -card_mask
+        index = bit.bit_length() - 1
+        distance = distances[index]
+        if (distance > best_distance) if furthest else (distance < best_distance):
+            best_index, best_distance = index, distance
+        card_mask ^= bit
+    return best_index
+
+
 class ActionDecider:
     """
     The ActionDecider class is responsible for deciding the best action to take based on the state of the game board and 
@@ -24,6 +76,43 @@ class ActionDecider:
         :return: The best action to take.
         """
 
+        return ActionDecider._ActionDecider__decide(
+            turn.actions, lambda: ActionDecider._ActionDecider__analyze_board(board_matrix))
+
+    @staticmethod
+    def decide_state_action(state: GameState) -> Action:
+        """
+        Decide the best action to take for the player of the turn of a compact game state.
+
+        The actions are decided like by decide_action, but the cards are scored straight from the bitmasks of the
+        state with the distance tables, without building any actions to choose from.
+
+        :param state: The state of the game.
+        :return: The best action to take.
+        """
+
+        hand_mask = state.hand_masks[state.turn_player_index]
+        if state.phase is TurnPhase.GIVE:
+            return GIVE_CARD_ACTIONS[_best_card_index(hand_mask, card_distances_of(state.board_mask), True)]
+
+        valid_mask = hand_mask & state.playable_mask
+        if not valid_mask:
+            return TAKE_CARD_ACTION
+        if valid_mask == hand_mask and state.board_mask:
+            return PLAY_ALL_CARDS_ACTION
+        return PLAY_CARD_ACTIONS[_best_card_index(valid_mask, card_distances_of(state.board_mask), False)]
+
+    @staticmethod
+    def __decide(actions: Iterable[Action], analyze_board: Callable[[], Mapping[Suit, Tuple[Rank, Rank]]]) -> Action:
+        """
+        Decide the best action among the available actions.
+
+        :param actions: The available actions.
+        :param analyze_board: Function returning the minimum and maximum card rank for each suit on the board,
+                              only called when cards need to be scored.
+        :return: The best action to take.
+        """
+
         # Define the priority for each action type
         action_priorities = {
             ActionType.PLAY_ALL_CARDS: 1,
@@ -35,15 +124,14 @@ class ActionDecider:
 
         # Group actions by their type
         actions_by_type = {action_type: [] for action_type in ActionType}
-        for action in turn.actions:
+        for action in actions:
             actions_by_type[action.type].append(action)
 
         # Iterate over action types in order of their priority
         for action_type in sorted(action_priorities, key=action_priorities.get):
             if action_type == ActionType.PLAY_CARD:
                 # Analyze the board and score the cards for this action type
-                board_state = ActionDecider._ActionDecider__analyze_board(
-                    board_matrix)
+                board_state = analyze_board()
                 scores = ActionDecider._ActionDecider__score_cards(
                     [action.card for action in actions_by_type[action_type]], board_state)
                 if scores:
@@ -53,8 +141,7 @@ class ActionDecider:
                     return [action for action in actions_by_type[action_type] if action.card == card_choice][0]
             elif action_type == ActionType.GIVE_CARD:
                 # Analyze the board and score the cards for this action type
-                board_state = ActionDecider._ActionDecider__analyze_board(
-                    board_matrix)
+                board_state = analyze_board()
                 scores = ActionDecider._ActionDecider__score_cards(
                     [action.card for action in actions_by_type[action_type]], board_state)
                 if scores:
@@ -70,48 +157,40 @@ class ActionDecider:
         raise ValueError("No valid actions available for the current turn.")
 
     @staticmethod
-    def __analyze_board(board_matrix: List[List[bool]]) -> Dict[Suit, Tuple[Rank, Rank]]:
+    def __analyze_board(board_matrix: List[List[bool]]) -> Mapping[Suit, Tuple[Rank, Rank]]:
         """
         Analyze the game board and determine the minimum and maximum card rank for each suit.
 
+        The matrix is converted to a bitmask of the cards on the board, and the analysis of recently seen boards
+        is looked up by the bitmask instead of being repeated.
+
         :param board_matrix: A 2D list where each sublist corresponds to a suit and each boolean in the sublist 
                                 indicates whether the card of that suit and rank has been played.
-        :return: A dictionary mapping each suit to a tuple of the minimum and maximum card rank for that suit.
+        :return: A mapping of each suit to a tuple of the minimum and maximum card rank for that suit. If no cards
+                 of a suit have been played, both are SEVEN.
         """
 
-        board_state = {}
+        board_mask = 0
         for suit, suit_cards in enumerate(board_matrix):
-            played_cards = [Rank(rank+1)
-                            for rank, played in enumerate(suit_cards) if played]
-            if played_cards:
-                min_card = min(played_cards)
-                max_card = max(played_cards)
-            else:
-                # If no cards of this suit have been played, assume the minimum and maximum card rank are both SEVEN
-                min_card = max_card = Rank.SEVEN
-            board_state[Suit(suit+1)] = (min_card, max_card)
-        return board_state
+            for rank, played in enumerate(suit_cards):
+                if played:
+                    board_mask |= 1 << (suit * len(Rank) + rank)
+        return _cached_frontier_of(board_mask)
 
     @staticmethod
-    def __score_cards(cards: List[Card], board_state: Dict[Suit, Tuple[Rank, Rank]]) -> Dict[Card, int]:
+    def __score_cards(cards: List[Card], board_state: Mapping[Suit, Tuple[Rank, Rank]]) -> Dict[Card, int]:
         """
         Score each card based on the current state of the game board. A lower score indicates a better card to play.
         The score is calculated based on the difference between the rank of the card and the nearest rank that can be played on the board.
 
         :param cards: A list of cards to score.
-        :param board_state: A dictionary mapping each suit to a tuple of the minimum and maximum card rank for that suit.
+        :param board_state: A mapping of each suit to a tuple of the minimum and maximum card rank for that suit.
         :return: A dictionary mapping each card to its score.
         """
 
         scores = {}
         for card in cards:
             min_card, max_card = board_state[card.suit]
-            if card.rank > max_card:
-                score = card.rank.value - max_card.value
-            elif card.rank < min_card:
-                score = min_card.value - card.rank.value
-            else:
-                # If the card can be played immediately, its score is 0
-                score = 0
-            scores[card] = score
+            # If the card can be played immediately, its score is 0
+            scores[card] = CARD_DISTANCES[min_card.value][max_card.value][card.rank.value - 1]
         return scores
@@ -1,139 +1,248 @@
 # lib/board.py
 
-import copy
-from typing import List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from .card import Card, Suit, Rank
 
 
+# Each card occupies the bit given by its index in a 52-bit integer, laid out as four 13-bit suit words
+# (hearts in the lowest word) where bit 0 of a word is the ace and bit 12 is the king.
+SEVEN_OF_HEARTS_MASK: int = 1 << (Rank.SEVEN.value - 1)
+SEVENS_MASK: int = sum(SEVEN_OF_HEARTS_MASK << (suit * len(Rank))
+                       for suit in range(len(Suit)))
+ACES_MASK: int = sum(1 << (suit * len(Rank)) for suit in range(len(Suit)))
+KINGS_MASK: int = ACES_MASK << (len(Rank) - 1)
+
+
+def unlocked_mask(bit: int) -> int:
+    """
+    Get the cards that placing a card makes playable. Placing a card makes its neighbours in the same suit
+    playable, and the seven of hearts also makes the sevens of the other suits playable.
+
+    :param bit: Bit of the placed card.
+    :return: Bitmask of the cards made playable, which may include cards already on the board.
+    """
+
+    unlocked = 0
+    if bit == SEVEN_OF_HEARTS_MASK:
+        unlocked |= SEVENS_MASK
+    if not bit & ACES_MASK:
+        unlocked |= bit >> 1
+    if not bit & KINGS_MASK:
+        unlocked |= bit << 1
+    return unlocked
+
+
+def playable_mask_of(mask: int) -> int:
+    """
+    Get the playable cards of a board with the given cards on it.
+
+    :param mask: Bitmask of the cards on the board.
+    :return: Bitmask of the playable cards.
+    """
+
+    playable = SEVEN_OF_HEARTS_MASK
+    remaining = mask
+    while remaining:
+        bit = remaining & -remaining
+        playable |= unlocked_mask(bit)
+        remaining ^= bit
+    return playable & ~mask
+
+
+# Frontier of a suit without any cards on the board.
+_EMPTY_SUIT_FRONTIER: Tuple[Rank, Rank] = (Rank.SEVEN, Rank.SEVEN)
+
+
+def frontier_of(mask: int) -> Mapping[Suit, Tuple[Rank, Rank]]:
+    """
+    Get the frontier of a board with the given cards on it: the lowest and the highest rank on the board of every
+    suit. Both are the seven for a suit without any cards on the board.
+
+    :param mask: Bitmask of the cards on the board.
+    :return: Read-only mapping of every suit to its lowest and highest rank.
+    """
+
+    frontier = {}
+    for suit in Suit:
+        suit_mask = (mask >> ((suit.value - 1) * len(Rank))) & ((1 << len(Rank)) - 1)
+        if suit_mask:
+            frontier[suit] = (Rank((suit_mask & -suit_mask).bit_length()), Rank(suit_mask.bit_length()))
+        else:
+            frontier[suit] = _EMPTY_SUIT_FRONTIER
+    return MappingProxyType(frontier)
+
+
 class Board:
     """
     Class representing the game board in a card game. Each board has a set of cards organized by suit and rank.
-    The cards on the board are represented as a matrix of booleans where each cell corresponds to a card identified by its suit and rank.
-    The value in a cell is True if the corresponding card is on the board, False otherwise.
+    The cards on the board are stored as a bitmask where each bit corresponds to a card identified by its suit and rank.
+    A bit is set if the corresponding card is on the board.
+
+    Alongside the cards on the board, a second bitmask of the currently playable cards and the lowest and highest
+    rank of every suit are kept up to date on every added card, so checking if a card is valid is a single AND
+    operation and reading the frontier of the board costs nothing.
 
     The board provides methods to add cards to the board, get valid cards, and check if a card is valid.
-    It also provides a property to access a copy of the internal matrix representing the game board.
+    It also provides a property to access a read-only matrix representation of the game board, which is shared
+    between callers until the board is mutated again.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, mask: int = 0) -> None:
         """
-        Initializes an empty board for the game. The board is represented as a matrix of booleans
-        where each cell corresponds to a card identified by its suit and rank.
-        The value in a cell is True if the corresponding card is on the board, False otherwise.
+        Initializes a board for the game, empty by default. Only the seven of hearts is playable on an empty board.
 
+        :param mask: Bitmask of the cards already on the board, used to restore a board.
         :return: None
         """
 
-        self.__matrix: list[list[bool]] = [[False for _ in range(
-            len(Rank))] for _ in range(len(Suit))]
+        self.__mask: int = mask
+        self.__playable_mask: int = playable_mask_of(mask)
+        self.__frontier: Dict[Suit, Tuple[Rank, Rank]] = dict(frontier_of(mask))
+        self.__frontier_view: Mapping[Suit, Tuple[Rank, Rank]] = MappingProxyType(self.__frontier)
+        self.__version: int = 0
+        self.__matrix: Optional[Tuple[Tuple[bool, ...], ...]] = None
+        self.__matrix_version: int = -1
 
     @property
-    def matrix(self) -> list[list[bool]]:
+    def mask(self) -> int:
         """
-        Provides a deep copy of the internal matrix representing the game board.
-
-        Each cell in the returned matrix corresponds to a card identified by its suit and rank.
-        The value in a cell is True if the corresponding card is on the board, and False otherwise.
-        This allows for safe interaction with the board state without modifying the original data.
+        Provides the bitmask of the cards on the board.
 
-        :return: A deep copy of the board's internal matrix.
+        :return: Bitmask where each set bit corresponds to a card on the board.
         """
 
-        return copy.deepcopy(self.__matrix)
+        return self.__mask
 
-    def add_card(self, card: Card) -> None:
+    @property
+    def playable_mask(self) -> int:
         """
-        Adds a card to the board if it's valid.
-        Raises a ValueError if the card is not valid.
+        Provides the bitmask of the cards that can currently be played on the board.
 
-        :param card: Card to be added to the board.
-        :return: None
+        :return: Bitmask where each set bit corresponds to a playable card.
         """
 
-        if not (0 <= card.suit.value - 1 < len(Suit) and 0 <= card.rank.value - 1 < len(Rank)):
-            raise ValueError(f"Invalid card: {card}")
-        if self.is_valid_card(card):
-            self.__matrix[card.suit.value - 1][card.rank.value - 1] = True
-        else:
-            raise ValueError(f"Invalid card: {card}")
+        return self.__playable_mask
 
-    def get_valid_cards(self, cards: List[Card]) -> List[Card]:
+    @property
+    def frontier(self) -> Mapping[Suit, Tuple[Rank, Rank]]:
         """
-        Filters out invalid cards from a given list.
-        Returns a list of valid cards.
+        Provides the frontier of the board: the lowest and the highest rank on the board of every suit. Both are
+        the seven for a suit without any cards on the board.
 
-        :param cards: List of cards to be filtered.
-        :return: List of valid cards.
+        The mapping is a read-only view that reflects the cards added to the board later on.
+
+        :return: Read-only mapping of every suit to its lowest and highest rank.
         """
 
-        return list(filter(self.is_valid_card, cards))
+        return self.__frontier_view
 
-    def is_valid_card(self, card: Card) -> bool:
+    @property
+    def version(self) -> int:
         """
-        Checks if a card can be played according to the game rules.
-        Returns a boolean indicating whether the card is valid.
+        Provides the version of the board, which is incremented every time a card is added.
 
-        :param card: Card to be checked.
-        :return: Boolean indicating whether the card is valid.
+        :return: Version of the board.
         """
 
-        if self.__is_card_on_board(card):
-            return False
+        return self.__version
+
+    @property
+    def matrix(self) -> Tuple[Tuple[bool, ...], ...]:
+        """
+        Provides a read-only matrix representing the game board, built from the internal bitmask.
 
-        if not self.__is_card_on_board_by_suit_rank(Suit.HEARTS, Rank.SEVEN):
-            return card == Card(Suit.HEARTS, Rank.SEVEN)
+        Each cell in the returned matrix corresponds to a card identified by its suit and rank.
+        The value in a cell is True if the corresponding card is on the board, and False otherwise.
+        The matrix is immutable, so the same snapshot is shared between callers until the board version changes.
 
-        if self.__is_card_seven_of_any_suit(card) or self.__is_card_adjacent_to_existing_card(card):
-            return True
+        :return: A read-only matrix of the board's cards.
+        """
 
-        return False
+        if self.__matrix_version != self.__version:
+            self.__matrix = tuple(
+                tuple((self.__mask >> (suit * len(Rank) + rank)) & 1 == 1 for rank in range(len(Rank)))
+                for suit in range(len(Suit)))
+            self.__matrix_version = self.__version
+        return self.__matrix
 
-    def __is_card_seven_of_any_suit(self, card: Card) -> bool:
+    def reset(self, mask: int = 0) -> None:
         """
-        Checks if a card is a seven of any suit.
-        Returns a boolean indicating whether the card is a seven.
+        Resets the board in place, empty by default, so the board can be reused for a new game.
 
-        :param card: Card to be checked.
-        :return: Boolean indicating whether the card is a seven.
+        :param mask: Bitmask of the cards already on the board, used to restore a board.
+        :return: None
         """
 
-        return card.rank == Rank.SEVEN
+        self.__mask = mask
+        self.__playable_mask = playable_mask_of(mask)
+        if mask:
+            self.__frontier.update(frontier_of(mask))
+        else:
+            for suit in self.__frontier:
+                self.__frontier[suit] = _EMPTY_SUIT_FRONTIER
+        self.__version += 1
 
-    def __is_card_adjacent_to_existing_card(self, card: Card) -> bool:
+    def add_card(self, card: Card) -> int:
         """
-        Checks if a card is adjacent (in rank) to an existing card on the board in the same suit.
-        Returns a boolean indicating whether the card is adjacent to an existing card.
+        Adds a card to the board if it's valid.
+        Raises a ValueError if the card is not valid.
 
-        :param card: Card to be checked.
-        :return: Boolean indicating whether the card is adjacent to an existing card.
+        Adding a card makes its neighbours in the same suit playable, and the seven of hearts
+        also makes the sevens of the other suits playable.
+
+        :param card: Card to be added to the board.
+        :return: Bitmask of the cards that became playable by adding the card.
         """
 
-        return self.__is_card_on_board_by_suit_rank(card.suit, card.rank.get_rank_below()) or self.__is_card_on_board_by_suit_rank(card.suit, card.rank.get_rank_above())
+        bit = 1 << card.index
+        if not self.__playable_mask & bit:
+            raise ValueError(f"Invalid card: {card}")
+
+        # Cards are only ever added next to the cards of their suit, so they extend the frontier by one rank
+        low, high = self.__frontier[card.suit]
+        if card.rank.value < low.value:
+            self.__frontier[card.suit] = (card.rank, high)
+        elif card.rank.value > high.value:
+            self.__frontier[card.suit] = (low, card.rank)
+
+        previous_playable_mask = self.__playable_mask
+        self.__mask |= bit
+        self.__playable_mask = (previous_playable_mask | unlocked_mask(bit)) & ~self.__mask
+        self.__version += 1
+
+        return self.__playable_mask & ~previous_playable_mask
 
-    def __is_card_on_board(self, card: Card) -> bool:
+    def get_valid_cards(self, cards: List[Card]) -> List[Card]:
         """
-        Checks if a card is already on the board.
-        Returns a boolean indicating whether the card is on the board.
+        Filters out invalid cards from a given list.
+        Returns a list of valid cards.
 
-        :param card: Card to be checked.
-        :return: Boolean indicating whether the card is on the board.
+        :param cards: List of cards to be filtered.
+        :return: List of valid cards.
         """
 
-        return self.__is_card_on_board_by_suit_rank(card.suit, card.rank)
+        playable_mask = self.__playable_mask
+        return [card for card in cards if (playable_mask >> card.index) & 1]
+
+    def get_valid_mask(self, mask: int) -> int:
+        """
+        Filters out invalid cards from a given bitmask of cards.
 
-    def __is_card_on_board_by_suit_rank(self, suit: Suit, rank: Rank) -> bool:
+        :param mask: Bitmask of cards to be filtered.
+        :return: Bitmask of valid cards.
         """
-        Checks if a card of a certain suit and rank is already on the board.
-        Returns a boolean indicating whether the card is on the board.
 
-        :param suit: Suit of the card to be checked.
-        :param rank: Rank of the card to be checked.
-        :return: Boolean indicating whether the card is on the board.
+        return mask & self.__playable_mask
+
+    def is_valid_card(self, card: Card) -> bool:
         """
+        Checks if a card can be played according to the game rules.
+        Returns a boolean indicating whether the card is valid.
 
-        if not (0 <= suit.value - 1 < len(Suit) and 0 <= rank.value - 1 < len(Rank)):
-            raise ValueError(
-                f"Invalid card for suit: {suit.value} or rank: {rank.value}")
+        :param card: Card to be checked.
+        :return: Boolean indicating whether the card is valid.
+        """
 
-        return self.__matrix[suit.value - 1][rank.value - 1] is True
+        return (self.__playable_mask >> card.index) & 1 == 1
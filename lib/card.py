@@ -1,7 +1,7 @@
 # lib/card.py
 
 from enum import Enum, auto
-from typing import Type
+from typing import List, Optional, Tuple, Type
 
 
 class Suit(Enum):
@@ -88,55 +88,96 @@ class Card:
     """
     Represents a playing card with a suit and a rank. 
 
+    Cards are interned flyweights: there is exactly one instance per suit and rank combination, each with a
+    precomputed index from 0 (ace of hearts) to 51 (king of spades). Equality is identity and hashing and
+    ordering use the index, so cards are cheap to compare and to store in sets and dicts.
+
     The card class provides methods for comparing cards and getting string representations of cards.
     """
 
-    def __init__(self, suit: Suit, rank: Rank) -> None:
+    __slots__ = ("suit", "rank", "index")
+
+    __cards: List[Optional['Card']] = [None] * (len(Suit) * len(Rank))
+
+    def __new__(cls, suit: Suit, rank: Rank) -> 'Card':
         """
-        Initializes a card with a given suit and rank.
+        Returns the card with a given suit and rank, creating it the first time it is requested.
 
         :param suit: The suit of the card.
         :param rank: The rank of the card.
-        :return: None
+        :return: The interned card.
+        """
+
+        index = (suit.value - 1) * len(Rank) + rank.value - 1
+        card = Card.__cards[index]
+        if card is None:
+            card = super().__new__(cls)
+            object.__setattr__(card, "suit", suit)
+            object.__setattr__(card, "rank", rank)
+            object.__setattr__(card, "index", index)
+            Card.__cards[index] = card
+        return card
+
+    @staticmethod
+    def from_index(index: int) -> 'Card':
+        """
+        Returns the card with a given index.
+
+        :param index: The index of the card, from 0 (ace of hearts) to 51 (king of spades).
+        :return: The interned card.
+        """
+
+        return CARDS[index]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Prevents modifying a card, since the same instance is shared by everyone holding it.
+
+        :raises AttributeError: Always.
         """
 
-        self.suit: Suit = suit
-        self.rank: Rank = rank
+        raise AttributeError(f"Cannot modify {name} of an interned card")
+
+    def __reduce__(self) -> Tuple[Type['Card'], Tuple[Suit, Rank]]:
+        """
+        Pickles a card by its suit and rank, so unpickling returns the interned instance.
+
+        :return: Tuple of the card class and its constructor arguments.
+        """
+
+        return (Card, (self.suit, self.rank))
 
     def __hash__(self) -> int:
         """
-        Returns a hash value for a card, which is a combination of its suit and rank.
+        Returns a hash value for a card, which is its index.
 
         :return: Hash value of the card.
         """
 
-        return hash((self.suit, self.rank))
+        return self.index
 
     def __eq__(self, other_card: Type['Card']) -> bool:
         """
         Checks if two cards are the same (i.e., have the same suit and rank).
+        Since cards are interned, this is an identity check.
 
         :param other_card: The other card to compare with.
         :return: True if the cards have the same suit and rank, False otherwise.
         """
 
-        return isinstance(other_card, Card) and self.suit == other_card.suit and self.rank == other_card.rank
+        return self is other_card
 
     def __lt__(self, other_card: Type['Card']) -> bool:
         """
         Defines the less-than ("<") operation for Card instances.
 
-        The operation first compares the suits of the two cards. If they are different, it checks if the suit 
-        of the current card is less than the other card's suit. If the suits are the same, it then checks if the 
-        rank of the current card is less than the other card's rank.
+        Cards are ordered first by suit and then by rank, which is the order of their indices.
 
         :param other_card: The other card to compare with the current card.
         :return: True if the current card should come before the other card in a sorted list, False otherwise.
         """
 
-        if self.suit != other_card.suit:
-            return self.suit.value < other_card.suit.value
-        return self.rank.value < other_card.rank.value
+        return self.index < other_card.index
 
     def __repr__(self) -> str:
         """
@@ -146,3 +187,23 @@ class Card:
         """
 
         return f"{self.rank.name} of {self.suit.name}"
+
+
+# All 52 cards in index order.
+CARDS: Tuple[Card, ...] = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """
+    Decodes the cards of a bitmask where each set bit is the index of a card, in ascending order of index.
+
+    :param mask: Bitmask of card indices.
+    :return: List of the cards.
+    """
+
+    cards = []
+    while mask:
+        lowest_bit = mask & -mask
+        cards.append(CARDS[lowest_bit.bit_length() - 1])
+        mask ^= lowest_bit
+    return cards
@@ -1,7 +1,9 @@
 # lib/deck.py
 
 import random
-from .card import Card, Suit, Rank
+from typing import List, Optional, Union
+
+from .card import Card, CARDS
 
 
 class Deck:
@@ -11,14 +13,18 @@ class Deck:
     be dealt from it, and it can be checked whether it is empty.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[Union[int, random.Random]] = None) -> None:
         """
         Initializes a deck with a standard set of 52 cards.
 
+        :param rng: Random number generator used to shuffle the deck, or a seed to create one with.
+                    Defaults to a generator seeded from the operating system.
         :return: None
         """
 
-        self.__cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+        self.__cards = list(CARDS)
+        self.__rng: random.Random = rng if isinstance(
+            rng, random.Random) else random.Random(rng)
 
     @property
     def cards(self) -> list[Card]:
@@ -30,14 +36,26 @@ class Deck:
 
         return self.__cards.copy()
 
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Puts all the cards back into the deck in their initial order, reusing the deck for a new game.
+
+        :param seed: Seed to reseed the random number generator of the deck with, or None to keep its state.
+        :return: None
+        """
+
+        self.__cards[:] = CARDS
+        if seed is not None:
+            self.__rng.seed(seed)
+
     def shuffle(self) -> None:
         """
-        Shuffles the deck in place using the random.shuffle method.
+        Shuffles the deck in place using the random number generator of the deck.
 
         :return: None
         """
 
-        random.shuffle(self.__cards)
+        self.__rng.shuffle(self.__cards)
 
     def deal(self) -> Card:
         """
@@ -52,6 +70,23 @@ class Deck:
 
         return self.__cards.pop()
 
+    def deal_hands(self, player_count: int) -> List[List[Card]]:
+        """
+        Deals all the cards of the deck to the given number of players at once. The cards are handed out in the
+        same order as dealing them one by one from the end of the deck to each player in turn, so every hand is a
+        stride slice of the deck.
+
+        :param player_count: Number of players to deal to.
+        :return: List of the cards dealt to every player.
+        """
+
+        if player_count < 1:
+            raise ValueError(f"Cannot deal to {player_count} players.")
+
+        cards = self.__cards[::-1]
+        self.__cards.clear()
+        return [cards[player_index::player_count] for player_index in range(player_count)]
+
     def empty(self) -> bool:
         """
         Determines whether the deck is empty or not.
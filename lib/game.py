@@ -1,54 +1,158 @@
 # lib/game.py
 
-from typing import List, NamedTuple, Optional, Set
+import random
+from collections import deque
+from typing import Deque, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 
-from .action_decider import ActionDecider
 from .action import Action, ActionType
-from .board import Board
-from .card import Card, Suit, Rank
+from .action_codec import PASS_TURN_BIT, PLAY_ALL_CARDS_BIT, TAKE_CARD_BIT, cards_to_action_mask, mask_to_action_set
+from .board import SEVEN_OF_HEARTS_MASK, Board
+from .card import Card, CARDS, Suit, Rank, mask_to_cards
 from .deck import Deck
+from .game_state import GameState, TurnPhase
 from .player import Player, PlayerType
+from .strategy import Strategy, create_strategy
 from .turn import Turn
 
 
 class PlayerInfo(NamedTuple):
     name: str
     type: PlayerType
+    strategy: str = "greedy"
+
+
+# Owners of the cards before they are dealt.
+_UNOWNED_CARDS: Tuple[int, ...] = (-1,) * len(CARDS)
+
+# Number of recent TAKE_CARD actions a game remembers.
+TAKE_HISTORY_LENGTH: int = 8
 
 
 class Game:
     """
     Main Game class that encapsulates all the game logic.
+
+    Alongside the players, the game keeps a bitmask of the hand of every player, a bitmask of the cards every
+    player can currently play and the owner of every card. When a card is placed on the board only the cards
+    that became playable are looked up, so the actions of a turn are built without rescanning any hand.
     """
 
-    def __init__(self, player_infos: List[PlayerInfo]) -> None:
+    def __init__(self, player_infos: List[PlayerInfo], seed: Optional[Union[int, random.Random]] = None) -> None:
         """
         Constructor for the Game class.
 
-        :param player_names: List of player names.
+        :param player_infos: List of player information. Computer controlled players play with the strategy
+                             named in their information.
+        :param seed: Seed of the first game, or a random number generator that the seeds of all games are drawn
+                     from. Defaults to seeds drawn from the operating system.
         :return: None
         """
 
         self.__player_infos: List[PlayerInfo] = player_infos
+        self.__strategies: List[Optional[Strategy]] = [create_strategy(
+            player_info.strategy) if player_info.type is PlayerType.AI else None for player_info in player_infos]
         self.__finished_players: List[Player] = []
-        self.reset()
+        self.__seed_rng: random.Random = seed if isinstance(
+            seed, random.Random) else random.Random(seed)
+        self.__strategy_seed_rng: random.Random = random.Random()
+        self.__create_players()
+        self.__deck: Deck = Deck(rng=random.Random())
+        self.__board: Board = Board()
+        self.__take_history: Deque[int] = deque(maxlen=TAKE_HISTORY_LENGTH)
+        self.reset(seed=None if isinstance(seed, random.Random) else seed)
 
-    def reset(self) -> None:
+    def reset(self, seed: Optional[int] = None) -> None:
         """
         Reset the game, initialize players, deck, board and current turn.
 
+        The players, the deck and the board are reused and cleared in place, so resetting a game allocates
+        nothing but the seeds. The deck of the game is shuffled with its own random number generator, seeded
+        with the given seed or with a seed drawn from the seed generator of the game. The seed is recorded, so
+        the game can be replayed. The strategies of the computer controlled players are reseeded from the seed
+        of the game as well.
+
+        :param seed: Seed of the game, or None to draw a new seed.
         :return: None
         """
 
-        self.__players: List[Player] = [
-            Player(player_info.name, player_info.type) for player_info in self.__player_infos]
-        self.__finished_players.clear()
+        self.__seed: int = seed if seed is not None else self.__seed_rng.getrandbits(
+            64)
+
+        self.__clear_players()
+        for seat, strategy in enumerate(self.__strategies):
+            if strategy is not None:
+                self.__strategy_seed_rng.seed(f"{self.__seed}:{seat}")
+                strategy.reset(seed=self.__strategy_seed_rng.getrandbits(64))
         self.__current_player_index: int = 0
-        self.__deck: Deck = Deck()
-        self.__board: Board = Board()
+        self.__turn_player_index: int = 0
+        self.__turn_phase: TurnPhase = TurnPhase.PLAY
+        self.__deck.reset(seed=self.__seed)
+        self.__board.reset()
+        self.__take_history.clear()
         self.__current_turn: Turn = None
 
+    def close(self) -> None:
+        """
+        Releases the resources of the strategies of the computer controlled players, such as worker processes.
+
+        :return: None
+        """
+
+        for strategy in self.__strategies:
+            if strategy is not None:
+                strategy.close()
+
+    def export_state(self) -> GameState:
+        """
+        Export the current state of a started game as a compact and immutable snapshot.
+
+        :return: Snapshot of the game.
+        """
+
+        if self.__current_turn is None:
+            raise ValueError("Cannot export the state of a game that has not started")
+
+        return GameState(board_mask=self.__board.mask, playable_mask=self.__board.playable_mask,
+                         hand_masks=tuple(player.hand_mask for player in self.__players),
+                         current_player_index=self.__current_player_index,
+                         turn_player_index=self.__turn_player_index, phase=self.__turn_phase,
+                         finished=tuple(self.__players.index(player) for player in self.__finished_players))
+
+    def import_state(self, state: GameState) -> None:
+        """
+        Replace the current state of the game with a snapshot, for the same number of players.
+
+        The players are given the hands of the snapshot. Computer controlled players don't act on
+        the imported turn until an action is executed. The take history isn't part of a snapshot, so it is
+        cleared.
+
+        :param state: Snapshot of the game.
+        :return: None
+        """
+
+        if len(state.hand_masks) != len(self.__player_infos):
+            raise ValueError(
+                f"Expected a state of {len(self.__player_infos)} players, got {len(state.hand_masks)}")
+
+        self.__clear_players()
+        for player_index, hand_mask in enumerate(state.hand_masks):
+            cards = mask_to_cards(hand_mask)
+            self.__players[player_index].set_hand(cards)
+            for card in cards:
+                self.__card_owners[card.index] = player_index
+
+        self.__board.reset(mask=state.board_mask)
+        self.__take_history.clear()
+        self.__playable_masks[:] = [self.__board.get_valid_mask(
+            player.hand_mask) for player in self.__players]
+        self.__finished_players.extend(
+            self.__players[player_index] for player_index in state.finished)
+
+        self.__current_player_index = state.current_player_index
+        self.__set_turn(action_mask=state.legal_action_mask,
+                        player_index=state.turn_player_index, phase=state.phase)
+
     def start(self) -> None:
         """
         Start the game by shuffling the deck, dealing cards and determining the initial turn.
@@ -60,6 +164,16 @@ class Game:
         self.__deal_cards()
         self.__start_turn()
 
+    @property
+    def seed(self) -> int:
+        """
+        Get the seed the deck of the current game was shuffled with.
+
+        :return: Seed of the current game.
+        """
+
+        return self.__seed
+
     @property
     def players(self) -> List[Player]:
         """
@@ -81,15 +195,47 @@ class Game:
         return self.__current_turn
 
     @property
-    def board(self) -> List[List[bool]]:
+    def board(self) -> Tuple[Tuple[bool, ...], ...]:
         """
         Get the current state of the board.
 
-        :return: A 2D matrix representing the current state of the board.
+        :return: A read-only 2D matrix representing the current state of the board.
         """
 
         return self.__board.matrix
 
+    @property
+    def frontier(self) -> Mapping[Suit, Tuple[Rank, Rank]]:
+        """
+        Get the frontier of the board: the lowest and the highest rank on the board of every suit.
+
+        :return: Read-only mapping of every suit to its lowest and highest rank, kept up to date by the board.
+        """
+
+        return self.__board.frontier
+
+    @property
+    def cards_received(self) -> List[int]:
+        """
+        Get the number of cards every player has received through GIVE_CARD actions during the game. The counts
+        are updated in place by the game, and must not be modified.
+
+        :return: Number of cards received, by player index.
+        """
+
+        return self.__cards_received
+
+    @property
+    def take_history(self) -> Deque[int]:
+        """
+        Get the players who took a card most recently, up to TAKE_HISTORY_LENGTH of them, the most recent first.
+        The history is updated in place by the game, and must not be modified.
+
+        :return: Indices of the players who took a card.
+        """
+
+        return self.__take_history
+
     def execute_action(self, action: Action) -> None:
         """
         Execute a given action in the game.
@@ -101,17 +247,17 @@ class Game:
         self.__validate_action(action=action)
 
         if action.type is ActionType.PLAY_ALL_CARDS:
-            for card in self.__current_player.hand:
-                self.__current_player.remove_card(card=card)
-                self.__board.add_card(card=card)
+            for card in mask_to_cards(self.__current_player.hand_mask):
+                self.__play_card(card=card)
 
         elif action.type is ActionType.PLAY_CARD:
-            self.__current_player.remove_card(card=action.card)
-            self.__board.add_card(card=action.card)
+            self.__play_card(card=action.card)
 
         elif action.type is ActionType.GIVE_CARD:
-            self.__current_turn.player.remove_card(action.card)
-            self.__current_player.add_card(action.card)
+            self.__give_card(card=action.card)
+
+        elif action.type is ActionType.TAKE_CARD:
+            self.__take_history.appendleft(self.__turn_player_index)
 
         self.__advance_turn(action=action)
 
@@ -148,43 +294,103 @@ class Game:
         if action.type in {ActionType.PLAY_CARD, ActionType.GIVE_CARD}:
             if not action.card:
                 raise ValueError(f"Invalid action {action.type} without card")
-            elif (action.type is ActionType.PLAY_CARD and not self.__current_player.has_card(card=action.card)) or (action.type is ActionType.GIVE_CARD and not self.__current_turn.player.has_card(card=action.card)):
+            elif self.__card_owners[action.card.index] != self.__turn_player_index:
                 raise ValueError(
                     f"Invalid card {action.card} for action {action.type}")
         else:
-            if action.type is ActionType.PLAY_ALL_CARDS and not self.__is_current_player_all_cards_valid():
+            if action.type is ActionType.PLAY_ALL_CARDS and not self.__is_current_player_all_cards_valid:
                 raise ValueError(f"Invalid action {action.type}")
             elif action.card:
                 raise ValueError(
                     f"Invalid card {action.card} for action {action.type}")
 
+    def __create_players(self) -> None:
+        """
+        Create the players, with empty hands, and the bookkeeping of their hands.
+
+        :return: None
+        """
+
+        self.__players: List[Player] = [
+            Player(player_info.name, player_info.type) for player_info in self.__player_infos]
+        self.__opponents: List[List[Player]] = [
+            [opponent for opponent in self.__players if opponent != player] for player in self.__players]
+        self.__playable_masks: List[int] = [0] * len(self.__players)
+        self.__card_owners: List[int] = list(_UNOWNED_CARDS)
+        self.__cards_received: List[int] = [0] * len(self.__players)
+
+    def __clear_players(self) -> None:
+        """
+        Clear the hands of the players and the bookkeeping of their hands in place, for a new game.
+
+        :return: None
+        """
+
+        for player_index, player in enumerate(self.__players):
+            player.clear_hand()
+            self.__playable_masks[player_index] = 0
+            self.__cards_received[player_index] = 0
+        self.__card_owners[:] = _UNOWNED_CARDS
+        self.__finished_players.clear()
+
     def __deal_cards(self) -> None:
         """
-        Deal cards to all players one by one from the deck.
+        Deal all the cards of the deck to the players at once, and find the starting player, who is dealt the
+        card 'Seven of Hearts'.
 
         :return: None
         """
 
-        tmp_player_index: int = 0
-        while (not self.__deck.empty()):
-            card: Card = self.__deck.deal()
-            self.__players[tmp_player_index].add_card(card)
-            tmp_player_index = (tmp_player_index + 1) % len(self.__players)
+        self.__start_player_index: int = -1
+        for player_index, cards in enumerate(self.__deck.deal_hands(len(self.__players))):
+            player = self.__players[player_index]
+            player.set_hand(cards)
+            for card in cards:
+                self.__card_owners[card.index] = player_index
+            self.__playable_masks[player_index] = self.__board.get_valid_mask(player.hand_mask)
+            if player.hand_mask & SEVEN_OF_HEARTS_MASK:
+                self.__start_player_index = player_index
 
-    def __find_player_start_index(self) -> int:
+    def __play_card(self, card: Card) -> None:
         """
-        Find the player who has the card 'Seven of Hearts' as the starting player.
+        Move a card from the hand of the current player to the board, and mark the cards that became playable
+        as playable for their owners.
 
-        :return: Index of the starting player.
+        :param card: The card to play.
+        :return: None
+        """
+
+        bit = 1 << card.index
+        self.__current_player.remove_card(card=card)
+        self.__playable_masks[self.__current_player_index] &= ~bit
+        self.__card_owners[card.index] = -1
+
+        unlocked_mask = self.__board.add_card(card=card)
+        while unlocked_mask:
+            unlocked_bit = unlocked_mask & -unlocked_mask
+            owner = self.__card_owners[unlocked_bit.bit_length() - 1]
+            if owner >= 0:
+                self.__playable_masks[owner] |= unlocked_bit
+            unlocked_mask ^= unlocked_bit
+
+    def __give_card(self, card: Card) -> None:
+        """
+        Move a card from the hand of the player of the current turn to the hand of the current player.
+
+        :param card: The card to give.
+        :return: None
         """
 
-        tmp_player_index: int = 0
-        for player in self.__players:
-            if (player.has_card(Card(Suit.HEARTS, Rank.SEVEN))):
-                return tmp_player_index
-            tmp_player_index = tmp_player_index + 1
+        bit = 1 << card.index
+        giver_index = self.__turn_player_index
+        self.__players[giver_index].remove_card(card)
+        self.__current_player.add_card(card)
 
-        raise ValueError(f"Unable to determine player start index")
+        self.__card_owners[card.index] = self.__current_player_index
+        self.__cards_received[self.__current_player_index] += 1
+        if self.__playable_masks[giver_index] & bit:
+            self.__playable_masks[giver_index] &= ~bit
+            self.__playable_masks[self.__current_player_index] |= bit
 
     def __start_turn(self) -> None:
         """
@@ -193,19 +399,19 @@ class Game:
         :return: None
         """
 
-        self.__current_player_index = self.__find_player_start_index()
+        if self.__start_player_index < 0:
+            raise ValueError(f"Unable to determine player start index")
+
+        self.__current_player_index = self.__start_player_index
 
         seven_of_hearts: Card = Card(Suit.HEARTS, Rank.SEVEN)
 
-        if not self.__current_player.has_card(seven_of_hearts):
+        if self.__card_owners[seven_of_hearts.index] != self.__current_player_index:
             raise ValueError(
                 f"Unexpected error, initial player missing {seven_of_hearts}")
 
-        actions: Set[Action] = set()
-        actions.add(Action(type=ActionType.PLAY_CARD, card=seven_of_hearts))
-
-        self.__current_turn = Turn(
-            actions=actions, player=self.__current_player, opponents=self.__get_player_opponents(self.__current_player))
+        self.__set_turn(action_mask=cards_to_action_mask(1 << seven_of_hearts.index),
+                        player_index=self.__current_player_index)
 
         if self.__current_turn.player.type is PlayerType.AI:
             self.__advance_turn_decision()
@@ -218,7 +424,7 @@ class Game:
         :return: None
         """
 
-        if action.type in {ActionType.PLAY_CARD, ActionType.PLAY_ALL_CARDS, ActionType.GIVE_CARD} and not self.__current_turn.player.hand:
+        if action.type in {ActionType.PLAY_CARD, ActionType.PLAY_ALL_CARDS, ActionType.GIVE_CARD} and not self.__current_turn.player.hand_mask:
             self.__finished_players.append(self.__current_turn.player)
 
         if len(self.__finished_players) == len(self.__players):
@@ -247,18 +453,9 @@ class Game:
         if card is None:
             raise ValueError("Unexpected error, card was not played")
 
-        actions: Set[Action] = set()
-
-        if (card.rank is Rank.ACE or card.rank is Rank.KING) and len(self.__current_player_valid_cards) > 0:
-            if self.__is_current_player_all_cards_valid():
-                actions.add(Action(type=ActionType.PLAY_ALL_CARDS))
-            for card in self.__current_player_valid_cards:
-                actions.add(Action(type=ActionType.PLAY_CARD, card=card))
-
-            actions.add(Action(type=ActionType.PASS_TURN))
-
-            self.__current_turn = Turn(
-                actions=actions, player=self.__current_player, opponents=self.__get_player_opponents(self.__current_player))
+        if (card.rank is Rank.ACE or card.rank is Rank.KING) and self.__playable_masks[self.__current_player_index]:
+            self.__set_turn(action_mask=self.__current_player_play_action_mask | PASS_TURN_BIT,
+                            player_index=self.__current_player_index, phase=TurnPhase.BONUS)
         else:
             self.__advance_turn_other()
 
@@ -269,12 +466,9 @@ class Game:
         :return: None
         """
 
-        actions: Set[Action] = set()
-        for card in self.__previous_player.hand:
-            actions.add(Action(type=ActionType.GIVE_CARD, card=card))
-
-        self.__current_turn = Turn(
-            actions=actions, player=self.__previous_player, opponents=self.__get_player_opponents(self.__previous_player))
+        previous_player_index = self.__previous_player_index
+        self.__set_turn(action_mask=cards_to_action_mask(self.__players[previous_player_index].hand_mask, give=True),
+                        player_index=previous_player_index, phase=TurnPhase.GIVE)
 
     def __advance_turn_other(self) -> None:
         """
@@ -285,18 +479,28 @@ class Game:
 
         self.__advance_player()
 
-        actions: Set[Action] = set()
-
-        if len(self.__current_player_valid_cards) > 0:
-            if self.__is_current_player_all_cards_valid():
-                actions.add(Action(type=ActionType.PLAY_ALL_CARDS))
-            for card in self.__current_player_valid_cards:
-                actions.add(Action(type=ActionType.PLAY_CARD, card=card))
+        if self.__playable_masks[self.__current_player_index]:
+            action_mask = self.__current_player_play_action_mask
         else:
-            actions.add(Action(type=ActionType.TAKE_CARD))
+            action_mask = TAKE_CARD_BIT
 
-        self.__current_turn = Turn(
-            actions=actions, player=self.__current_player, opponents=self.__get_player_opponents(self.__current_player))
+        self.__set_turn(action_mask=action_mask, player_index=self.__current_player_index)
+
+    def __set_turn(self, action_mask: int, player_index: int, phase: TurnPhase = TurnPhase.PLAY) -> None:
+        """
+        Make the given player the player of the current turn. The actions of the turn are looked up by their
+        bitmask, so turns with the same actions share the same set.
+
+        :param action_mask: Bitmask of the action indices that can be performed during the turn.
+        :param player_index: Index of the player of the turn.
+        :param phase: The kind of turn.
+        :return: None
+        """
+
+        self.__turn_player_index = player_index
+        self.__turn_phase = phase
+        self.__current_turn = Turn(actions=mask_to_action_set(action_mask), player=self.__players[player_index],
+                                   opponents=self.__opponents[player_index], action_mask=action_mask)
 
     def __advance_turn_decision(self) -> None:
         """
@@ -305,8 +509,8 @@ class Game:
         :return: None
         """
 
-        action = ActionDecider.decide_action(
-            self.__board.matrix, self.__current_turn)
+        action = self.__strategies[self.__turn_player_index].decide_action(
+            self.export_state())
         self.execute_action(action)
 
     @property
@@ -320,15 +524,19 @@ class Game:
         return self.__players[self.__current_player_index]
 
     @property
-    def __current_player_valid_cards(self) -> List[Card]:
+    def __current_player_play_action_mask(self) -> int:
         """
-        Get a list of valid cards that the current player can play.
+        Get the play actions of the current player, built from the cards the player can currently play.
 
-        :return: A list of Card objects that the current player can play.
+        :return: Bitmask of the action indices of the play actions of the current player.
         """
 
-        return self.__board.get_valid_cards(self.__current_player.hand)
+        action_mask = cards_to_action_mask(self.__playable_masks[self.__current_player_index])
+        if self.__is_current_player_all_cards_valid:
+            action_mask |= PLAY_ALL_CARDS_BIT
+        return action_mask
 
+    @property
     def __is_current_player_all_cards_valid(self) -> bool:
         """
         Check whether all the cards of the current player are valid or not.
@@ -336,29 +544,27 @@ class Game:
         :return: True if all the cards of the current player are valid, False otherwise.
         """
 
-        return self.__board.get_valid_cards(self.__current_player.hand) == self.__current_player.hand
+        hand_mask = self.__current_player.hand_mask
+        return hand_mask != 0 and self.__playable_masks[self.__current_player_index] == hand_mask
 
     @property
-    def __previous_player(self) -> Player:
+    def __previous_player_index(self) -> int:
         """
-        Get the previous player who has cards. Iterates backwards from the current player.
+        Get the index of the previous player who has cards. Iterates backwards from the current player.
         Raises an exception if no such player is found after one full loop over the player list.
 
-        :return: Previous player instance.
+        :return: Index of the previous player.
         """
 
         tmp_previous_player_index = self.__current_player_index
         for _ in range(len(self.__players)):
             tmp_previous_player_index = (
                 tmp_previous_player_index - 1) % len(self.__players)
-            if len(self.__players[tmp_previous_player_index].hand) > 0:
-                return self.__players[tmp_previous_player_index]
+            if self.__players[tmp_previous_player_index].hand_mask:
+                return tmp_previous_player_index
 
         raise ValueError("No players with cards were found.")
 
-    def __get_player_opponents(self, player: Player) -> List[Player]:
-        return [p for p in self.__players if p != player]
-
     def __advance_player(self) -> None:
         """
         Move the turn to the next player.
@@ -369,7 +575,7 @@ class Game:
         for _ in range(len(self.__players)):
             self.__current_player_index = (
                 self.__current_player_index + 1) % len(self.__players)
-            if len(self.__current_player.hand) > 0:
+            if self.__current_player.hand_mask:
                 return
 
         raise ValueError("No players with cards were found.")
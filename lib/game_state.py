@@ -0,0 +1,179 @@
+# lib/game_state.py
+
+from enum import Enum, auto
+from typing import List, NamedTuple, Tuple
+
+from .action import Action, ActionType
+from .action_codec import ACTIONS, PASS_TURN_BIT, PLAY_ALL_CARDS_BIT, TAKE_CARD_BIT, cards_to_action_mask, \
+    mask_to_indices
+from .board import ACES_MASK, KINGS_MASK, SEVEN_OF_HEARTS_MASK, unlocked_mask
+
+
+class TurnPhase(Enum):
+    """
+    Enum representing the kind of turn a game state is in.
+
+    PLAY is a regular turn, BONUS is the extra turn after playing an ace or a king, where passing is allowed,
+    and GIVE is the turn where a player gives a card to the player who took one.
+    """
+
+    PLAY = auto()
+    BONUS = auto()
+    GIVE = auto()
+
+
+_ACE_OR_KING_MASK: int = ACES_MASK | KINGS_MASK
+
+
+class GameState(NamedTuple):
+    """
+    Compact and immutable snapshot of a game. The board and the hands are bitmasks where each bit is the index of
+    a card, and applying an action returns a new state, so states can be shared, copied and stored cheaply by
+    search based players.
+
+    The current player is the player whose turn it is in the order of play. The turn player is the player who
+    acts, which differs from the current player while the previous player gives a card to the current player.
+    """
+
+    board_mask: int
+    playable_mask: int
+    hand_masks: Tuple[int, ...]
+    current_player_index: int
+    turn_player_index: int
+    phase: TurnPhase
+    finished: Tuple[int, ...]
+
+    @staticmethod
+    def new(hand_masks: Tuple[int, ...]) -> 'GameState':
+        """
+        Creates the state of a game that has just been dealt, where the owner of the seven of hearts starts.
+
+        :param hand_masks: Bitmask of the hand of every player, in seating order.
+        :return: The initial state.
+        """
+
+        start_index = next((index for index, hand_mask in enumerate(hand_masks)
+                           if hand_mask & SEVEN_OF_HEARTS_MASK), None)
+        if start_index is None:
+            raise ValueError("Unable to determine player start index")
+
+        return GameState(board_mask=0, playable_mask=SEVEN_OF_HEARTS_MASK, hand_masks=tuple(hand_masks),
+                         current_player_index=start_index, turn_player_index=start_index, phase=TurnPhase.PLAY,
+                         finished=())
+
+    def is_finished(self) -> bool:
+        """
+        Check whether the game is finished or not.
+
+        :return: True if all players have finished, False otherwise.
+        """
+
+        return len(self.finished) == len(self.hand_masks)
+
+    @property
+    def legal_action_mask(self) -> int:
+        """
+        Get the actions the turn player can perform, encoded as a bitmask of action indices.
+
+        :return: Bitmask of the action indices, see lib.action_codec.
+        """
+
+        if self.is_finished():
+            return 0
+
+        hand_mask = self.hand_masks[self.turn_player_index]
+        if self.phase is TurnPhase.GIVE:
+            return cards_to_action_mask(hand_mask, give=True)
+
+        valid_mask = hand_mask & self.playable_mask
+        if not valid_mask:
+            return TAKE_CARD_BIT
+
+        action_mask = cards_to_action_mask(valid_mask)
+        if valid_mask == hand_mask and self.board_mask:
+            action_mask |= PLAY_ALL_CARDS_BIT
+        if self.phase is TurnPhase.BONUS:
+            action_mask |= PASS_TURN_BIT
+        return action_mask
+
+    @property
+    def legal_actions(self) -> List[Action]:
+        """
+        Get the actions the turn player can perform, in ascending order of their action indices.
+
+        :return: List of the shared instances of the actions.
+        """
+
+        return [ACTIONS[index] for index in mask_to_indices(self.legal_action_mask)]
+
+    def apply(self, action: Action) -> 'GameState':
+        """
+        Applies an action of the turn player. The action is not validated, use the legal actions to validate it.
+
+        :param action: The action to apply.
+        :return: The state after the action.
+        """
+
+        board_mask = self.board_mask
+        playable_mask = self.playable_mask
+        hand_masks = list(self.hand_masks)
+        current_index = self.current_player_index
+        turn_index = self.turn_player_index
+        finished = self.finished
+
+        action_type = action.type
+        if action_type is ActionType.PLAY_CARD or action_type is ActionType.PLAY_ALL_CARDS:
+            placed_mask = hand_masks[turn_index] & playable_mask if action_type is ActionType.PLAY_ALL_CARDS \
+                else 1 << action.card.index
+            hand_masks[turn_index] &= ~placed_mask
+            board_mask |= placed_mask
+            while placed_mask:
+                bit = placed_mask & -placed_mask
+                playable_mask |= unlocked_mask(bit)
+                placed_mask ^= bit
+            playable_mask &= ~board_mask
+        elif action_type is ActionType.GIVE_CARD:
+            bit = 1 << action.card.index
+            hand_masks[turn_index] &= ~bit
+            hand_masks[current_index] |= bit
+
+        if action_type is not ActionType.TAKE_CARD and action_type is not ActionType.PASS_TURN and \
+                not hand_masks[turn_index]:
+            finished = finished + (turn_index,)
+
+        player_count = len(hand_masks)
+        phase = TurnPhase.PLAY
+        if len(finished) == player_count:
+            # The turn doesn't advance once the game is finished
+            phase = self.phase
+        elif action_type is ActionType.PLAY_CARD and (1 << action.card.index) & _ACE_OR_KING_MASK and \
+                hand_masks[current_index] & playable_mask:
+            phase = TurnPhase.BONUS
+        elif action_type is ActionType.TAKE_CARD:
+            turn_index = current_index
+            for _ in range(player_count):
+                turn_index = (turn_index - 1) % player_count
+                if hand_masks[turn_index]:
+                    break
+            phase = TurnPhase.GIVE
+        else:
+            for _ in range(player_count):
+                current_index = (current_index + 1) % player_count
+                if hand_masks[current_index]:
+                    break
+            turn_index = current_index
+
+        return GameState(board_mask=board_mask, playable_mask=playable_mask, hand_masks=tuple(hand_masks),
+                         current_player_index=current_index, turn_player_index=turn_index, phase=phase,
+                         finished=finished)
+
+    def apply_index(self, action_index: int) -> 'GameState':
+        """
+        Applies the action with the given action index.
+
+        :param action_index: Index of the action, see lib.action_codec.
+        :return: The state after the action.
+        """
+
+        return self.apply(ACTIONS[action_index])
+
@@ -0,0 +1,241 @@
+# lib/mcts.py
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from .action import Action
+from .action_codec import ACTIONS, mask_to_indices
+from .card import CARDS
+from .game_state import GameState
+
+
+# Bitmask of all cards in a deck.
+ALL_CARDS_MASK: int = (1 << len(CARDS)) - 1
+
+
+class _Node:
+    """
+    Node of the search tree. A node is reached by playing its action, and keeps the statistics of the player
+    who played it. Since the tree is shared between determinizations, a node also counts how often its action
+    was available when its parent was visited.
+    """
+
+    __slots__ = ("parent", "action_index", "player_index",
+                 "children", "visits", "availability", "reward")
+
+    def __init__(self, parent: Optional['_Node'], action_index: int, player_index: int) -> None:
+        """
+        Initializes an unvisited node.
+
+        :param parent: The parent node, or None for the root.
+        :param action_index: Index of the action leading to the node.
+        :param player_index: Index of the player who plays the action.
+        :return: None
+        """
+
+        self.parent: Optional[_Node] = parent
+        self.action_index: int = action_index
+        self.player_index: int = player_index
+        self.children: Dict[int, _Node] = {}
+        self.visits: int = 0
+        self.availability: int = 1
+        self.reward: float = 0.0
+
+
+def determinize(state: GameState, observer_index: int, rng: random.Random) -> GameState:
+    """
+    Samples a state that is consistent with what a player can observe. The board and the hand of the player are
+    kept, and the cards the player can't see are dealt at random to the other players, matching the size of
+    their hands.
+
+    :param state: The true state of the game.
+    :param observer_index: Index of the observing player.
+    :param rng: Random number generator used to deal the hidden cards.
+    :return: A sampled state.
+    """
+
+    hidden_cards = mask_to_indices(
+        ALL_CARDS_MASK & ~state.board_mask & ~state.hand_masks[observer_index])
+    rng.shuffle(hidden_cards)
+
+    hand_masks = list(state.hand_masks)
+    dealt = 0
+    for player_index, hand_mask in enumerate(state.hand_masks):
+        if player_index == observer_index:
+            continue
+        hand_size = bin(hand_mask).count("1")
+        hand_masks[player_index] = sum(
+            1 << card_index for card_index in hidden_cards[dealt:dealt + hand_size])
+        dealt += hand_size
+
+    return state._replace(hand_masks=tuple(hand_masks))
+
+
+def search(state: GameState, iterations: Optional[int] = 1000, time_limit: Optional[float] = None,
+           exploration: float = 0.7, seed: Optional[int] = None) -> Dict[int, int]:
+    """
+    Runs an information set Monte Carlo tree search from the point of view of the player of the turn. Every
+    iteration samples the hidden hands of the opponents, walks the shared tree with the actions that are legal in
+    the sample, and finishes the game with random playouts.
+
+    The search stops when the number of iterations or the time limit is reached, whichever comes first.
+
+    :param state: The state to search from.
+    :param iterations: Maximum number of iterations, or None for no limit.
+    :param time_limit: Maximum time in seconds, or None for no limit.
+    :param exploration: Exploration constant of the upper confidence bound.
+    :param seed: Seed of the search, or None for an unseeded search.
+    :return: Number of visits of every action of the root, by action index.
+    """
+
+    if iterations is None and time_limit is None:
+        raise ValueError("Either an iteration or a time limit is required")
+
+    rng = random.Random(seed)
+    observer_index = state.turn_player_index
+    player_count = len(state.hand_masks)
+    root = _Node(parent=None, action_index=-1, player_index=-1)
+
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    iteration = 0
+    while (iterations is None or iteration < iterations) and (deadline is None or time.perf_counter() < deadline):
+        iteration += 1
+        node = root
+        sample = determinize(state, observer_index, rng)
+
+        # Selection and expansion
+        legal_mask = sample.legal_action_mask
+        while legal_mask:
+            untried = []
+            best_child = None
+            best_value = -math.inf
+            for action_index in mask_to_indices(legal_mask):
+                child = node.children.get(action_index)
+                if child is None:
+                    untried.append(action_index)
+                    continue
+                child.availability += 1
+                value = child.reward / child.visits + exploration * \
+                    math.sqrt(math.log(child.availability) / child.visits)
+                if value > best_value:
+                    best_child, best_value = child, value
+
+            if untried:
+                action_index = rng.choice(untried)
+                child = _Node(parent=node, action_index=action_index,
+                              player_index=sample.turn_player_index)
+                node.children[action_index] = child
+                node = child
+                sample = sample.apply(ACTIONS[action_index])
+                break
+
+            node = best_child
+            sample = sample.apply(ACTIONS[node.action_index])
+            legal_mask = sample.legal_action_mask
+
+        # Playout
+        while not sample.is_finished():
+            sample = sample.apply(
+                ACTIONS[rng.choice(mask_to_indices(sample.legal_action_mask))])
+
+        # Backpropagation, where the winner scores 1 and the last player 0
+        rewards = [0.0] * player_count
+        for position, player_index in enumerate(sample.finished):
+            rewards[player_index] = (
+                player_count - 1 - position) / (player_count - 1)
+        while node is not None:
+            node.visits += 1
+            if node.player_index >= 0:
+                node.reward += rewards[node.player_index]
+            node = node.parent
+
+    return {action_index: child.visits for action_index, child in root.children.items()}
+
+
+class MonteCarloTreeSearch:
+    """
+    Class that decides actions with an information set Monte Carlo tree search over the compact game state,
+    within an iteration or time budget per move. The search can be split into independent searches in worker
+    processes, whose root statistics are merged.
+    """
+
+    def __init__(self, iterations: Optional[int] = 1000, time_limit: Optional[float] = None, exploration: float = 0.7,
+                 workers: int = 1, seed: Optional[int] = None) -> None:
+        """
+        Constructor for the MonteCarloTreeSearch class.
+
+        :param iterations: Maximum number of iterations per move and worker, or None for no limit.
+        :param time_limit: Maximum time in seconds per move, or None for no limit.
+        :param exploration: Exploration constant of the upper confidence bound.
+        :param workers: Number of worker processes, where 1 searches in the calling process.
+        :param seed: Seed that the seeds of the searches are drawn from, or None for unseeded searches.
+        :return: None
+        """
+
+        if iterations is None and time_limit is None:
+            raise ValueError("Either an iteration or a time limit is required")
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+
+        self.__iterations: Optional[int] = iterations
+        self.__time_limit: Optional[float] = time_limit
+        self.__exploration: float = exploration
+        self.__workers: int = workers
+        self.__rng: random.Random = random.Random(seed)
+        self.__executor: Optional[ProcessPoolExecutor] = None
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Reseeds the generator that the seeds of the searches are drawn from.
+
+        :param seed: The new seed, or None for unseeded searches.
+        :return: None
+        """
+
+        self.__rng.seed(seed)
+
+    def decide_action(self, state: GameState) -> Action:
+        """
+        Decide the action of the player of the turn.
+
+        :param state: The state of the game, where only the hand of the player of the turn is looked at.
+        :return: The action with the most visits.
+        """
+
+        legal_indices = mask_to_indices(state.legal_action_mask)
+        if not legal_indices:
+            raise ValueError("No valid actions available for the current turn.")
+        if len(legal_indices) == 1:
+            return ACTIONS[legal_indices[0]]
+
+        seeds = [self.__rng.getrandbits(64) for _ in range(self.__workers)]
+        if self.__workers == 1:
+            results = [search(state, self.__iterations,
+                              self.__time_limit, self.__exploration, seeds[0])]
+        else:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers=self.__workers)
+            futures = [self.__executor.submit(search, state, self.__iterations, self.__time_limit,
+                                              self.__exploration, seed) for seed in seeds]
+            results = [future.result() for future in futures]
+
+        visits: Dict[int, int] = {index: 0 for index in legal_indices}
+        for result in results:
+            for action_index, count in result.items():
+                visits[action_index] = visits.get(action_index, 0) + count
+        return ACTIONS[max(legal_indices, key=visits.get)]
+
+    def close(self) -> None:
+        """
+        Stops the worker processes, if any were started.
+
+        :return: None
+        """
+
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
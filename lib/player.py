@@ -1,10 +1,9 @@
 # lib/player.py
 
-import bisect
 from enum import Enum, auto
-from typing import List, Type
+from typing import Iterable, Type
 
-from .card import Card
+from .card import Card, mask_to_cards
 
 
 class PlayerType(Enum):
@@ -38,6 +37,9 @@ class Player:
     Class representing a player in the card game. Each player has a name, a hand of cards,
     and methods to add and remove cards from the hand, check if a card is in the hand, 
     and compare players.
+
+    The hand is kept as a bitmask where each set bit is the index of a card, so adding, removing and checking
+    cards are bitwise operations. The hand is listed in sorted order, which is the order of the card indices.
     """
 
     def __init__(self, name: str, type: PlayerType) -> None:
@@ -50,7 +52,7 @@ class Player:
 
         self.__name: str = name
         self.__type: PlayerType = type
-        self.__hand: List[Card] = []
+        self.__hand_mask: int = 0
 
     @property
     def name(self) -> str:
@@ -80,7 +82,29 @@ class Player:
         :return: None
         """
 
-        bisect.insort(self.__hand, card)
+        self.__hand_mask |= 1 << card.index
+
+    def set_hand(self, cards: Iterable[Card]) -> None:
+        """
+        Replaces the player's hand with the given cards at once.
+
+        :param cards: Cards of the player's new hand.
+        :return: None
+        """
+
+        hand_mask = 0
+        for card in cards:
+            hand_mask |= 1 << card.index
+        self.__hand_mask = hand_mask
+
+    def clear_hand(self) -> None:
+        """
+        Removes all the cards from the player's hand.
+
+        :return: None
+        """
+
+        self.__hand_mask = 0
 
     def remove_card(self, card: Card) -> None:
         """
@@ -90,7 +114,10 @@ class Player:
         :return: None
         """
 
-        self.__hand.remove(card)
+        bit = 1 << card.index
+        if not self.__hand_mask & bit:
+            raise ValueError(f"Card not in hand: {card}")
+        self.__hand_mask ^= bit
 
     def has_card(self, card: Card) -> bool:
         """
@@ -100,17 +127,37 @@ class Player:
         :return: Boolean indicating whether the card is in the player's hand.
         """
 
-        return card in self.__hand
+        return bool(self.__hand_mask >> card.index & 1)
 
     @property
     def hand(self) -> list[Card]:
         """
         Returns a copy of the player's hand.
 
-        :return: List of Cards in player's hand.
+        :return: List of Cards in player's hand, in sorted order.
+        """
+
+        return mask_to_cards(self.__hand_mask)
+
+    @property
+    def hand_mask(self) -> int:
+        """
+        Returns the player's hand as a bitmask.
+
+        :return: Bitmask where the bit of the index of every card in the player's hand is set.
+        """
+
+        return self.__hand_mask
+
+    @property
+    def hand_size(self) -> int:
+        """
+        Returns the number of cards in the player's hand, without listing them.
+
+        :return: Number of cards in the player's hand.
         """
 
-        return self.__hand.copy()
+        return bin(self.__hand_mask).count("1")
 
     def __eq__(self, otherPlayer: Type['Player']) -> bool:
         """
@@ -129,4 +176,4 @@ class Player:
         :return: String representation of the player.
         """
 
-        return f"Player: {self.__name}, Type: {self.__type}, Hand: {self.__hand}"
+        return f"Player: {self.__name}, Type: {self.__type}, Hand: {self.hand}"
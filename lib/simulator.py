@@ -0,0 +1,284 @@
+# lib/simulator.py
+
+import argparse
+import math
+import random
+import time
+from typing import List, Optional, Tuple
+
+from .game import Game, PlayerInfo
+from .player import PlayerType
+
+
+class SimulationResult:
+    """
+    Class representing the aggregated outcome of a number of simulated games. For every player it keeps a
+    histogram of the finishing positions, along with the number of games played and the time it took.
+    """
+
+    def __init__(self, player_names: List[str]) -> None:
+        """
+        Initializes an empty result for the given players.
+
+        :param player_names: Names of the players, in seating order.
+        :return: None
+        """
+
+        self.__player_names: List[str] = list(player_names)
+        self.__positions: List[List[int]] = [
+            [0] * len(player_names) for _ in player_names]
+        self.__games: int = 0
+        self.__seconds: float = 0.0
+
+    @property
+    def player_names(self) -> List[str]:
+        """
+        Get the names of the players, in seating order.
+
+        :return: List of player names.
+        """
+
+        return self.__player_names
+
+    @property
+    def positions(self) -> List[List[int]]:
+        """
+        Get the finishing position histograms. The outer list is indexed by seat and the inner list by
+        finishing position, starting with the winner.
+
+        :return: Number of games each player finished in each position.
+        """
+
+        return self.__positions
+
+    @property
+    def games(self) -> int:
+        """
+        Get the number of games played.
+
+        :return: Number of games.
+        """
+
+        return self.__games
+
+    @property
+    def seconds(self) -> float:
+        """
+        Get the time spent playing the games.
+
+        :return: Elapsed time in seconds.
+        """
+
+        return self.__seconds
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Get the throughput of the simulation.
+
+        :return: Number of games played per second.
+        """
+
+        return self.__games / self.__seconds if self.__seconds > 0 else 0.0
+
+    def add_game(self, finishing_seats: List[int]) -> None:
+        """
+        Records the outcome of a single game.
+
+        :param finishing_seats: Seat indices of the players in the order they finished.
+        :return: None
+        """
+
+        for position, seat in enumerate(finishing_seats):
+            self.__positions[seat][position] += 1
+        self.__games += 1
+
+    def add_time(self, seconds: float) -> None:
+        """
+        Adds to the time spent playing the games.
+
+        :param seconds: Elapsed time in seconds.
+        :return: None
+        """
+
+        self.__seconds += seconds
+
+    def merge(self, other: 'SimulationResult', include_time: bool = True) -> None:
+        """
+        Merges the games of another result, for the same players, into this one.
+
+        :param other: The result to merge.
+        :param include_time: Whether the time of the other result is added to this one.
+        :return: None
+        """
+
+        if other.player_names != self.__player_names:
+            raise ValueError("Cannot merge results of different players")
+
+        for seat, histogram in enumerate(other.positions):
+            for position, count in enumerate(histogram):
+                self.__positions[seat][position] += count
+        self.__games += other.games
+        if include_time:
+            self.__seconds += other.seconds
+
+    def position_rates(self, seat: int) -> List[float]:
+        """
+        Get the share of games a player finished in each position.
+
+        :param seat: Seat index of the player.
+        :return: Share of games per finishing position, starting with the winner.
+        """
+
+        if self.__games == 0:
+            return [0.0] * len(self.__player_names)
+        return [count / self.__games for count in self.__positions[seat]]
+
+    def confidence_interval(self, seat: int, position: int, z: float = 1.96) -> Tuple[float, float]:
+        """
+        Get the Wilson score interval of the share of games a player finished in a position.
+
+        :param seat: Seat index of the player.
+        :param position: Finishing position, where 0 is the winner.
+        :param z: Standard score of the confidence level, defaults to 95%.
+        :return: Lower and upper bound of the share.
+        """
+
+        if self.__games == 0:
+            return (0.0, 1.0)
+
+        rate = self.__positions[seat][position] / self.__games
+        denominator = 1 + z * z / self.__games
+        center = (rate + z * z / (2 * self.__games)) / denominator
+        margin = z * math.sqrt(rate * (1 - rate) / self.__games +
+                               z * z / (4 * self.__games * self.__games)) / denominator
+        return (max(0.0, center - margin), min(1.0, center + margin))
+
+    def __repr__(self) -> str:
+        """
+        Returns a report of the throughput and the finishing position statistics of every player.
+
+        :return: String representation of the result.
+        """
+
+        output = f"Games: {self.__games} ({self.games_per_second:.1f} games/s)\n"
+        for seat, name in enumerate(self.__player_names):
+            output += f"{name}:\n"
+            for position, rate in enumerate(self.position_rates(seat)):
+                lower, upper = self.confidence_interval(seat, position)
+                output += f"{position + 1}. {rate:.4f} ({lower:.4f}-{upper:.4f})\n"
+        return output.rstrip("\n")
+
+
+class Simulator:
+    """
+    Class that plays full games with computer controlled players only, as fast as possible and without any
+    user interface. A single game is reused between the simulated games.
+    """
+
+    def __init__(self, player_infos: List[PlayerInfo]) -> None:
+        """
+        Constructor for the Simulator class.
+
+        :param player_infos: Information of the players, all of which must be of type AI.
+        :return: None
+        """
+
+        if any(player_info.type is not PlayerType.AI for player_info in player_infos):
+            raise ValueError("Only AI players can be simulated")
+
+        self.__game: Game = Game(player_infos=player_infos)
+        self.__player_names: List[str] = [
+            player_info.name for player_info in player_infos]
+
+    def run(self, games: int, master_seed: Optional[int] = None, first_game: int = 0) -> SimulationResult:
+        """
+        Plays a number of games and aggregates their outcome.
+
+        When a master seed is given, every game is seeded from the master seed and its game number, so a
+        range of games can be replayed, or split into batches, with identical results.
+
+        :param games: Number of games to play.
+        :param master_seed: Seed the games are derived from, or None for unseeded games.
+        :param first_game: Game number of the first game, used together with the master seed.
+        :return: The aggregated result of the games.
+        """
+
+        result = SimulationResult(self.__player_names)
+        seats = {name: seat for seat, name in enumerate(self.__player_names)}
+
+        start_time = time.perf_counter()
+        for game_number in range(first_game, first_game + games):
+            self.__game.reset(seed=game_seed(
+                master_seed, game_number) if master_seed is not None else None)
+            self.__game.start()
+            result.add_game([seats[player.name]
+                            for player in self.__game.finished_players])
+        result.add_time(time.perf_counter() - start_time)
+
+        return result
+
+    def close(self) -> None:
+        """
+        Releases the resources of the strategies of the players, such as worker processes.
+
+        :return: None
+        """
+
+        self.__game.close()
+
+
+def game_seed(master_seed: int, game_number: int) -> int:
+    """
+    Derives the seed of a single game from a master seed.
+
+    :param master_seed: Seed of the whole simulation.
+    :param game_number: Number of the game within the simulation.
+    :return: Seed of the game.
+    """
+
+    return random.Random(f"{master_seed}:{game_number}").getrandbits(64)
+
+
+def simulate(player_infos: List[PlayerInfo], games: int) -> SimulationResult:
+    """
+    Plays a number of games with computer controlled players and aggregates their outcome.
+
+    :param player_infos: Information of the players, all of which must be of type AI.
+    :param games: Number of games to play.
+    :return: The aggregated result of the games.
+    """
+
+    simulator = Simulator(player_infos=player_infos)
+    try:
+        return simulator.run(games=games)
+    finally:
+        simulator.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point that simulates games and prints the throughput and statistics.
+
+    :param argv: Command line arguments, defaults to the arguments of the process.
+    :return: None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Simulate games of Sjuan between AI players.")
+    parser.add_argument("-g", "--games", type=int, default=1000,
+                        help="number of games to play (default: 1000)")
+    parser.add_argument("-p", "--players", type=int, default=4, choices=range(3, 9),
+                        metavar="{3-8}", help="number of players (default: 4)")
+    args = parser.parse_args(argv)
+
+    ai_player_names: List[str] = [
+        "Bob", "Alice", "Ted", "Eve", "Frank", "Olivia", "Dave", "Wendy"]
+    player_infos = [PlayerInfo(name=name, type=PlayerType.AI)
+                    for name in ai_player_names[:args.players]]
+
+    print(simulate(player_infos=player_infos, games=args.games))
+
+
+if __name__ == "__main__":
+    main()
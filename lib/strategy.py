@@ -0,0 +1,153 @@
+# lib/strategy.py
+
+import importlib
+import random
+from typing import Callable, Dict, List, Optional, Union
+
+from .action import Action
+from .action_decider import ActionDecider
+from .action_codec import ACTIONS, mask_to_indices
+from .game_state import GameState
+from .mcts import MonteCarloTreeSearch
+
+
+class Strategy:
+    """
+    Base class of the strategies of computer controlled players. A strategy decides the action of the player of
+    the turn from a compact and read-only snapshot of the game.
+    """
+
+    def reset(self, seed: int) -> None:
+        """
+        Prepares the strategy for a new game.
+
+        :param seed: Seed of the strategy for the game, derived from the seed of the game.
+        :return: None
+        """
+
+    def decide_action(self, state: GameState) -> Action:
+        """
+        Decides the action of the player of the turn.
+
+        :param state: The state of the game.
+        :return: The action to take.
+        """
+
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Releases the resources of the strategy, such as worker processes.
+
+        :return: None
+        """
+
+
+class GreedyStrategy(Strategy):
+    """
+    Strategy that plays the card closest to the cards on the board and gives away the card furthest from them.
+    """
+
+    def decide_action(self, state: GameState) -> Action:
+        return ActionDecider.decide_state_action(state)
+
+
+class RandomStrategy(Strategy):
+    """
+    Strategy that takes a random legal action.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Constructor for the RandomStrategy class.
+
+        :param seed: Seed of the strategy until the first game is reset.
+        :return: None
+        """
+
+        self.__rng: random.Random = random.Random(seed)
+
+    def reset(self, seed: int) -> None:
+        self.__rng.seed(seed)
+
+    def decide_action(self, state: GameState) -> Action:
+        return ACTIONS[self.__rng.choice(mask_to_indices(state.legal_action_mask))]
+
+
+class MonteCarloTreeSearchStrategy(Strategy):
+    """
+    Strategy that decides actions with an information set Monte Carlo tree search.
+    """
+
+    def __init__(self, iterations: Optional[int] = 1000, time_limit: Optional[float] = None, workers: int = 1) -> None:
+        """
+        Constructor for the MonteCarloTreeSearchStrategy class.
+
+        :param iterations: Maximum number of iterations per move, or None for no limit.
+        :param time_limit: Maximum time in seconds per move, or None for no limit.
+        :param workers: Number of worker processes of the search.
+        :return: None
+        """
+
+        self.__search: MonteCarloTreeSearch = MonteCarloTreeSearch(
+            iterations=iterations, time_limit=time_limit, workers=workers)
+
+    def reset(self, seed: int) -> None:
+        self.__search.reseed(seed)
+
+    def decide_action(self, state: GameState) -> Action:
+        return self.__search.decide_action(state)
+
+    def close(self) -> None:
+        self.__search.close()
+
+
+# Factories of the strategies by name. A factory is either a callable creating a strategy or the import path of
+# one, in the form "module:attribute", so strategies with heavy dependencies are only imported when used.
+_STRATEGIES: Dict[str, Union[Callable[[], Strategy], str]] = {
+    "greedy": GreedyStrategy,
+    "random": RandomStrategy,
+    "mcts": MonteCarloTreeSearchStrategy,
+    "ppo": "ai.ppo_strategy:PPOStrategy",
+}
+
+
+def register_strategy(name: str, factory: Union[Callable[[], Strategy], str]) -> None:
+    """
+    Registers a strategy under a name, replacing any strategy registered under the same name.
+
+    :param name: Name of the strategy, as used in the player information.
+    :param factory: Callable creating the strategy, or its import path in the form "module:attribute".
+    :return: None
+    """
+
+    _STRATEGIES[name] = factory
+
+
+def strategy_names() -> List[str]:
+    """
+    Get the names of the registered strategies.
+
+    :return: List of strategy names.
+    """
+
+    return list(_STRATEGIES)
+
+
+def create_strategy(name: str) -> Strategy:
+    """
+    Creates a strategy by name.
+
+    :param name: Name of the strategy.
+    :return: A new strategy.
+    """
+
+    factory = _STRATEGIES.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown strategy: {name}")
+
+    if isinstance(factory, str):
+        module_name, attribute = factory.split(":")
+        factory = getattr(importlib.import_module(module_name), attribute)
+
+    return factory()
@@ -0,0 +1,176 @@
+# lib/tournament.py
+
+import argparse
+import multiprocessing.util
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .game import PlayerInfo
+from .player import PlayerType
+from .simulator import SimulationResult, Simulator
+from .strategy import strategy_names
+
+
+# Simulator of the current worker process, reused for every batch the worker plays.
+_worker_simulator: Optional[Simulator] = None
+
+
+def _initialize_worker(player_infos: List[PlayerInfo], close_at_exit: bool = False) -> None:
+    """
+    Creates the simulator of a worker process.
+
+    :param player_infos: Information of the players.
+    :param close_at_exit: Whether the simulator is closed when the worker process exits.
+    :return: None
+    """
+
+    global _worker_simulator
+    _worker_simulator = Simulator(player_infos=player_infos)
+    if close_at_exit:
+        multiprocessing.util.Finalize(None, _close_worker, exitpriority=0)
+
+
+def _close_worker() -> None:
+    """
+    Closes the simulator of a worker process, releasing the resources of the strategies of its players.
+
+    :return: None
+    """
+
+    global _worker_simulator
+    if _worker_simulator is not None:
+        _worker_simulator.close()
+        _worker_simulator = None
+
+
+def _play_batch(master_seed: int, first_game: int, games: int) -> SimulationResult:
+    """
+    Plays a batch of seeded games in a worker process.
+
+    :param master_seed: Seed the games are derived from.
+    :param first_game: Game number of the first game in the batch.
+    :param games: Number of games in the batch.
+    :return: The aggregated result of the batch.
+    """
+
+    return _worker_simulator.run(games=games, master_seed=master_seed, first_game=first_game)
+
+
+class Tournament:
+    """
+    Class that plays a large number of seeded games between AI players, sharded in batches across worker
+    processes. Every game is seeded from the master seed and its game number, so the merged result is the
+    same regardless of the number of workers and the batch size.
+    """
+
+    def __init__(self, player_infos: List[PlayerInfo], workers: Optional[int] = None, batch_size: int = 1000) -> None:
+        """
+        Constructor for the Tournament class.
+
+        :param player_infos: Information of the players, all of which must be of type AI.
+        :param workers: Number of worker processes, defaults to the number of cores.
+        :param batch_size: Number of games per batch handed to a worker.
+        :return: None
+        """
+
+        if any(player_info.type is not PlayerType.AI for player_info in player_infos):
+            raise ValueError("Only AI players can play in a tournament")
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch size: {batch_size}")
+
+        self.__player_infos: List[PlayerInfo] = list(player_infos)
+        self.__workers: int = workers if workers is not None else (
+            os.cpu_count() or 1)
+        self.__batch_size: int = batch_size
+
+    def run(self, games: int, master_seed: int) -> SimulationResult:
+        """
+        Plays a number of games and merges the finishing position statistics of all batches.
+
+        :param games: Number of games to play.
+        :param master_seed: Seed the games are derived from.
+        :return: The merged result, timed by the wall clock of the whole tournament.
+        """
+
+        result = SimulationResult(
+            [player_info.name for player_info in self.__player_infos])
+
+        start_time = time.perf_counter()
+        if self.__workers <= 1:
+            _initialize_worker(self.__player_infos)
+            try:
+                for first_game, batch_games in self.__batches(games):
+                    result.merge(_play_batch(master_seed, first_game,
+                                 batch_games), include_time=False)
+            finally:
+                _close_worker()
+        else:
+            batches = self.__batches(games)
+            with ProcessPoolExecutor(max_workers=self.__workers, initializer=_initialize_worker,
+                                     initargs=(self.__player_infos, True)) as executor:
+                futures = [executor.submit(_play_batch, master_seed, first_game, batch_games)
+                           for first_game, batch_games in batches]
+                for future in futures:
+                    result.merge(future.result(), include_time=False)
+        result.add_time(time.perf_counter() - start_time)
+
+        return result
+
+    def __batches(self, games: int) -> List[Tuple[int, int]]:
+        """
+        Splits the games into batches.
+
+        :param games: Number of games to play.
+        :return: List of the first game number and the number of games of each batch.
+        """
+
+        return [(first_game, min(self.__batch_size, games - first_game))
+                for first_game in range(0, games, self.__batch_size)]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point that runs a tournament and prints the throughput and statistics.
+
+    :param argv: Command line arguments, defaults to the arguments of the process.
+    :return: None
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Run a tournament of Sjuan between AI players on all cores.")
+    parser.add_argument("-g", "--games", type=int, default=100000,
+                        help="number of games to play (default: 100000)")
+    parser.add_argument("-p", "--players", type=int, default=4, choices=range(3, 9),
+                        metavar="{3-8}", help="number of players (default: 4)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of cores)")
+    parser.add_argument("-b", "--batch-size", type=int, default=1000,
+                        help="number of games per batch (default: 1000)")
+    parser.add_argument("-s", "--seed", type=int, default=0,
+                        help="master seed of the tournament (default: 0)")
+    parser.add_argument("-t", "--strategies", default="greedy",
+                        help="comma separated strategies of the players, repeated over the seats "
+                             f"(one of: {', '.join(strategy_names())}, default: greedy)")
+    args = parser.parse_args(argv)
+
+    strategies = args.strategies.split(",")
+    unknown_strategies = set(strategies) - set(strategy_names())
+    if unknown_strategies:
+        parser.error(
+            f"unknown strategies: {', '.join(sorted(unknown_strategies))}")
+
+    ai_player_names: List[str] = [
+        "Bob", "Alice", "Ted", "Eve", "Frank", "Olivia", "Dave", "Wendy"]
+    player_infos = [PlayerInfo(name=f"{name} ({strategies[seat % len(strategies)]})", type=PlayerType.AI,
+                               strategy=strategies[seat % len(strategies)])
+                    for seat, name in enumerate(ai_player_names[:args.players])]
+
+    tournament = Tournament(player_infos=player_infos,
+                            workers=args.workers, batch_size=args.batch_size)
+    print(tournament.run(games=args.games, master_seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,57 @@
 # lib/turn.py
 
-from typing import List, Set
+from typing import FrozenSet, Iterable, List, Optional
 
 from .action import Action
+from .action_codec import actions_to_mask
 from .player import Player
 
 
 class Turn:
     """
     Class representing a turn in the card game. It includes the actions available and
-    the current player.
+    the current player. The actions are kept in an immutable set, which may be shared between turns.
     """
 
-    def __init__(self, actions: Set[Action], player: Player, opponents: List[Player]) -> None:
+    def __init__(self, actions: Iterable[Action], player: Player, opponents: List[Player],
+                 action_mask: Optional[int] = None) -> None:
         """
         Constructor for the Turn class.
 
-        :param actions: Set of actions that can be performed during the turn.
+        :param actions: Actions that can be performed during the turn.
         :param player: The current player.
+        :param opponents: The opponents to the current player.
+        :param action_mask: The actions encoded as a bitmask of action indices, if already known.
         :return: None
         """
 
-        self.__actions: Set[Action] = actions
+        self.__actions: FrozenSet[Action] = actions if isinstance(actions, frozenset) else frozenset(actions)
         self.__player: Player = player
         self.__opponents: List[Player] = opponents
+        self.__action_mask: Optional[int] = action_mask
 
     @property
-    def actions(self) -> Set[Action]:
+    def actions(self) -> FrozenSet[Action]:
         """
         Get the actions that can be performed during the turn.
 
-        :return: Set of actions.
+        :return: Frozen set of actions.
         """
 
         return self.__actions
 
+    @property
+    def action_mask(self) -> int:
+        """
+        Get the actions that can be performed during the turn, encoded as a bitmask of action indices.
+
+        :return: Bitmask of the action indices, see lib.action_codec.
+        """
+
+        if self.__action_mask is None:
+            self.__action_mask = actions_to_mask(self.__actions)
+        return self.__action_mask
+
     @property
     def player(self) -> Player:
         """
@@ -63,4 +80,4 @@ class Turn:
         :return: True if the action is available, False otherwise.
         """
 
-        return any(__action == action for __action in self.__actions)
+        return action in self.__actions
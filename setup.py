@@ -4,4 +4,10 @@ setup(
     name="sjuan",
     version="0.1",
     packages=find_packages(),
+    entry_points={
+        "console_scripts": [
+            "sjuan-simulate=lib.simulator:main",
+            "sjuan-tournament=lib.tournament:main",
+        ],
+    },
 )
@@ -0,0 +1,12 @@
+# tests/strategies.py
+
+from lib.strategy import GreedyStrategy
+
+
+class ClosingStrategy(GreedyStrategy):
+    """Greedy strategy that counts how many strategies were closed."""
+
+    closed = 0
+
+    def close(self) -> None:
+        ClosingStrategy.closed += 1
@@ -0,0 +1,93 @@
+# tests/test_action_codec.py
+
+import unittest
+
+from lib.action import Action, ActionType
+from lib.action_codec import ACTION_COUNT, ACTIONS, PLAY_CARD_ACTIONS, action_to_index, actions_to_mask, \
+    cards_to_action_mask, index_to_action, mask_to_action_set, mask_to_actions, mask_to_indices
+from lib.card import CARDS, Card, Rank, Suit
+from lib.player import Player, PlayerType
+from lib.turn import Turn
+
+
+class TestActionCodec(unittest.TestCase):
+
+    def test_actions_cover_every_index(self) -> None:
+        """Test that there is one distinct action per index."""
+        self.assertEqual(len(ACTIONS), ACTION_COUNT)
+        self.assertEqual(len(set(ACTIONS)), ACTION_COUNT)
+
+    def test_action_to_index_round_trip(self) -> None:
+        """Test that every action is encoded as its index and decoded back."""
+        for index, action in enumerate(ACTIONS):
+            self.assertEqual(action_to_index(action), index)
+            self.assertIs(index_to_action(index), action)
+
+    def test_action_to_index_of_new_actions(self) -> None:
+        """Test that actions created elsewhere are encoded by value."""
+        card = Card(Suit.CLUBS, Rank.QUEEN)
+
+        self.assertEqual(action_to_index(
+            Action(type=ActionType.PLAY_CARD, card=card)), card.index * 2)
+        self.assertEqual(action_to_index(
+            Action(type=ActionType.GIVE_CARD, card=card)), card.index * 2 + 1)
+        self.assertEqual(action_to_index(
+            Action(type=ActionType.PLAY_ALL_CARDS)), 104)
+        self.assertEqual(action_to_index(
+            Action(type=ActionType.TAKE_CARD)), 105)
+        self.assertEqual(action_to_index(
+            Action(type=ActionType.PASS_TURN)), 106)
+
+    def test_mask_round_trip(self) -> None:
+        """Test that a set of actions is encoded as a bitmask and decoded back in index order."""
+        actions = {Action(type=ActionType.PASS_TURN),
+                   Action(type=ActionType.PLAY_CARD, card=Card(Suit.HEARTS, Rank.SEVEN)),
+                   Action(type=ActionType.GIVE_CARD, card=Card(Suit.SPADES, Rank.KING))}
+
+        mask = actions_to_mask(actions)
+
+        self.assertEqual(mask_to_indices(mask), sorted(
+            action_to_index(action) for action in actions))
+        self.assertEqual(mask_to_actions(mask), sorted(actions, key=action_to_index))
+        self.assertEqual(actions_to_mask([]), 0)
+        self.assertEqual(mask_to_actions(0), [])
+
+    def test_turn_action_mask(self) -> None:
+        """Test that a turn exposes its actions as a bitmask."""
+        actions = {Action(type=ActionType.TAKE_CARD),
+                   Action(type=ActionType.PLAY_CARD, card=Card(Suit.DIAMONDS, Rank.SEVEN))}
+        turn = Turn(actions=actions, player=Player(
+            name="Player 1", type=PlayerType.AI), opponents=[])
+
+        self.assertEqual(turn.action_mask, actions_to_mask(actions))
+        self.assertTrue(turn.has_action(Action(type=ActionType.TAKE_CARD)))
+        self.assertFalse(turn.has_action(Action(type=ActionType.PASS_TURN)))
+
+    def test_cards_to_action_mask(self) -> None:
+        """Test that the play and give actions of a bitmask of cards are encoded by card index."""
+        cards = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.DIAMONDS, Rank.SEVEN), Card(Suit.SPADES, Rank.KING)]
+        card_mask = sum(1 << card.index for card in cards)
+
+        self.assertEqual(cards_to_action_mask(card_mask), actions_to_mask(
+            Action(type=ActionType.PLAY_CARD, card=card) for card in cards))
+        self.assertEqual(cards_to_action_mask(card_mask, give=True), actions_to_mask(
+            Action(type=ActionType.GIVE_CARD, card=card) for card in cards))
+        self.assertEqual(cards_to_action_mask((1 << len(CARDS)) - 1), actions_to_mask(PLAY_CARD_ACTIONS))
+
+    def test_action_sets_are_shared(self) -> None:
+        """Test that the action sets of a bitmask are immutable and shared between turns with the same actions."""
+        mask = actions_to_mask([Action(type=ActionType.TAKE_CARD), Action(type=ActionType.PASS_TURN)])
+        actions = mask_to_action_set(mask)
+
+        self.assertIsInstance(actions, frozenset)
+        self.assertEqual(actions, set(mask_to_actions(mask)))
+        self.assertIs(mask_to_action_set(mask), actions)
+
+        turn = Turn(actions=actions, player=Player(name="Player 1", type=PlayerType.AI), opponents=[],
+                    action_mask=mask)
+        self.assertIs(turn.actions, actions)
+        self.assertEqual(turn.action_mask, mask)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 from lib.action import Action, ActionType
 
-from lib.action_decider import ActionDecider
+from lib.action_decider import ActionDecider, card_distances_of
+from lib.board import Board
 from lib.card import Card, Rank, Suit
 from lib.player import Player, PlayerType
 from lib.turn import Turn
@@ -155,8 +156,10 @@ class TestActionDecider(unittest.TestCase):
             actual_action = ActionDecider.decide_action(board_matrix, turn)
             self.assertEqual(actual_action, expected_action)
 
-            # Remove the action from the turn actions to check the next priority
-            turn.actions.remove(expected_action)
+            # Remove the action from the actions and create a new turn to check the next priority, since the
+            # actions of a turn are immutable
+            actions.remove(expected_action)
+            turn = Turn(actions=actions, player=turn.player, opponents=[])
 
     def test_decide_action_no_actions(self):
         # Create a board state where no cards have been played yet
@@ -192,6 +195,17 @@ class TestActionDecider(unittest.TestCase):
 
         self.assertEqual(actual_board_state, expected_board_state)
 
+    def test_analyze_board_is_cached_by_mask(self):
+        # Test that equal boards passed as new matrices share the cached analysis
+        board_matrix = [[False]*13 for _ in range(4)]
+        board_matrix[Suit.CLUBS.value - 1][Rank.SEVEN.value - 1] = True
+        copied_board_matrix = [list(suit_cards) for suit_cards in board_matrix]
+
+        actual_board_state = ActionDecider._ActionDecider__analyze_board(
+            board_matrix)
+        self.assertIs(ActionDecider._ActionDecider__analyze_board(
+            copied_board_matrix), actual_board_state)
+
     def test_analyze_board_no_cards_played(self):
         # Test when no cards have been played yet
         board_matrix = [[False]*13 for _ in range(4)]
@@ -300,6 +314,20 @@ class TestActionDecider(unittest.TestCase):
             cards, board_state)
         self.assertEqual(actual_scores, expected_scores)
 
+    def test_card_distances_match_score_cards(self):
+        # The distances looked up by the board mask are the scores of every card against the board
+        board = Board()
+        for card in [Card(Suit.HEARTS, Rank.SEVEN), Card(Suit.HEARTS, Rank.SIX), Card(Suit.SPADES, Rank.SEVEN),
+                     Card(Suit.SPADES, Rank.EIGHT), Card(Suit.SPADES, Rank.NINE)]:
+            board.add_card(card)
+
+        cards = [Card(suit, rank) for suit in Suit for rank in Rank]
+        expected_scores = ActionDecider._ActionDecider__score_cards(cards, board.frontier)
+        distances = card_distances_of(board.mask)
+        self.assertEqual({card: distances[card.index] for card in cards}, expected_scores)
+        self.assertEqual(distances[Card(Suit.SPADES, Rank.KING).index], 4)
+        self.assertEqual(distances[Card(Suit.DIAMONDS, Rank.ACE).index], 6)
+
 
 if __name__ == '__main__':
     unittest.main()
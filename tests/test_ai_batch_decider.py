@@ -0,0 +1,44 @@
+import random
+import unittest
+import numpy as np
+
+from ai.batch_decider import card_distances, decide_actions, masks_to_bits
+from lib.action_codec import ACTIONS
+from lib.action_decider import card_distances_of
+from lib.game import Game, PlayerInfo
+from lib.player import PlayerType
+from lib.strategy import GreedyStrategy
+
+
+class TestBatchDecider(unittest.TestCase):
+
+    def test_masks_to_bits(self):
+        bits = masks_to_bits([0, 1, 1 << 51 | 1 << 13])
+        self.assertEqual(bits.shape, (3, 52))
+        self.assertEqual(bits.dtype, bool)
+        self.assertEqual([list(np.flatnonzero(row)) for row in bits], [[], [0], [13, 51]])
+
+    def test_decide_actions_match_greedy_strategy(self):
+        rng = random.Random(3)
+        games = [Game(player_infos=[PlayerInfo(name=name, type=PlayerType.HUMAN)
+                                    for name in ["Bob", "Alice", "Ted", "Eve"]], seed=seed) for seed in range(8)]
+        for game in games:
+            game.start()
+        strategy = GreedyStrategy()
+
+        # Play every game with random actions, and compare the batch decisions with the greedy strategy
+        while not all(game.is_finished() for game in games):
+            playing = [game for game in games if not game.is_finished()]
+            states = [game.export_state() for game in playing]
+
+            distances = card_distances([state.board_mask for state in states])
+            for row, state in zip(distances, states):
+                self.assertEqual(tuple(row), card_distances_of(state.board_mask))
+
+            for game, state, action in zip(playing, states, decide_actions(states)):
+                self.assertIs(ACTIONS[action], strategy.decide_action(state))
+                game.execute_action(rng.choice(sorted(game.turn.actions, key=str)))
+
+
+if __name__ == "__main__":
+    unittest.main()
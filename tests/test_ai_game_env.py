@@ -43,6 +43,33 @@ class TestGameEnv(unittest.TestCase):
         # Whether the game ends or not depends on the specific action and game rules
         self.assertNotEqual(reward, -1.0)
 
+    def test_action_masks(self):
+        self.env.reset()
+
+        # The mask marks exactly the actions of the current turn
+        action_mask = self.env.action_masks()
+        self.assertEqual(action_mask.shape, (self.env.action_space.n,))
+        self.assertEqual(action_mask.dtype, bool)
+        self.assertEqual({self.env.all_possible_actions[i] for i in np.flatnonzero(action_mask)},
+                         set(self.env.game.turn.actions))
+
+        # The mask of the next state is passed in the info
+        observation, reward, done, info = self.env.step(int(np.flatnonzero(action_mask)[0]))
+        if not done:
+            np.testing.assert_array_equal(info["action_mask"], self.env.action_masks())
+            self.assertEqual({self.env.all_possible_actions[i] for i in np.flatnonzero(info["action_mask"])},
+                             set(self.env.game.turn.actions))
+
+    def test_step_masked_action_is_penalized(self):
+        self.env.reset()
+
+        # Pass turn, the last action, is never valid on the first move
+        action = self.env.action_space.n - 1
+        self.assertFalse(self.env.action_masks()[action])
+        observation, reward, done, info = self.env.step(action)
+        if not done:
+            self.assertEqual(reward, -0.01)
+
     def test_reset(self):
         initial_state = self.env.reset()
         # Verify the type of state
@@ -51,6 +78,12 @@ class TestGameEnv(unittest.TestCase):
         self.assertEqual(len(initial_state),
                          self.env.observation_space.shape[0])
 
+    def test_reset_with_seed(self):
+        initial_state = self.env.reset(seed=1234)
+        self.assertEqual(self.env.game.seed, 1234)
+        # The same seed deals the same cards
+        np.testing.assert_array_equal(self.env.reset(seed=1234), initial_state)
+
     def test_render(self):
         self.env.reset()
         # Simply call the function to verify it doesn't cause an error
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from ai.game_stepper import GameStepper
+from ai.rewards import RewardConfig
+from lib.game import Game, PlayerInfo
+from lib.player import PlayerType
+
+
+class TestGameStepper(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(player_infos=[
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI)])
+        self.stepper = GameStepper(self.game, copy_observations=False)
+        self.stepper.start(seed=1234)
+
+    def test_start(self):
+        # The mask of the valid actions is the mask of the turn of the agent
+        self.assertEqual({self.stepper.all_possible_actions[i] for i in np.flatnonzero(self.stepper.action_masks())},
+                         set(self.game.turn.actions))
+        # Observations are written into the buffer of the encoder
+        self.assertIs(self.stepper.observation(), self.stepper.observation())
+        self.assertEqual(self.stepper.observation().dtype, np.int32)
+
+    def test_step_invalid_action_plays_valid_action(self):
+        # Pass turn, the last action, is never valid on the first move
+        action = len(self.stepper.all_possible_actions) - 1
+        self.assertFalse(self.stepper.action_masks()[action])
+        state = self.game.export_state()
+
+        reward, done = self.stepper.step(action, np.random.default_rng(0))
+
+        # A valid action was played instead, which is penalized
+        self.assertNotEqual(self.game.export_state(), state)
+        if not done:
+            self.assertEqual(reward, RewardConfig().invalid_action)
+
+    def test_step_until_finished(self):
+        rng = np.random.default_rng(0)
+        done = False
+        while not done:
+            reward, done = self.stepper.step(int(np.flatnonzero(self.stepper.action_masks())[0]), rng)
+
+        # The game ends with the reward of the outcome and no valid actions
+        self.assertIn(reward, [-1.0, 1.0])
+        self.assertFalse(self.stepper.action_masks().any())
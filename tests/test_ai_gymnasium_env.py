@@ -0,0 +1,74 @@
+import subprocess
+import sys
+import unittest
+import numpy as np
+from gymnasium.utils.env_checker import check_env
+from gymnasium.vector import AsyncVectorEnv
+
+from ai.gymnasium_env import GymnasiumGameEnv
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+
+PLAYER_INFOS = [
+    PlayerInfo(name="Gym", type=PlayerType.AGENT),
+    PlayerInfo(name="Alice", type=PlayerType.AI),
+    PlayerInfo(name="Ted", type=PlayerType.AI),
+    PlayerInfo(name="Eve", type=PlayerType.AI)]
+
+
+def make_env():
+    return GymnasiumGameEnv(player_infos=PLAYER_INFOS)
+
+
+class TestGymnasiumGameEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.env = make_env()
+
+    def test_env_follows_gymnasium_api(self):
+        check_env(self.env, skip_render_check=True)
+
+    def test_reset_and_step(self):
+        observation, info = self.env.reset(seed=1)
+        self.assertTrue(self.env.observation_space.contains(observation))
+        np.testing.assert_array_equal(info["action_mask"], self.env.action_masks())
+
+        terminated = False
+        while not terminated:
+            action = int(np.flatnonzero(self.env.action_masks())[0])
+            observation, reward, terminated, truncated, info = self.env.step(action)
+            self.assertFalse(truncated)
+            self.assertTrue(self.env.observation_space.contains(observation))
+        self.assertIn(reward, [-1.0, 1.0])
+
+    def test_seed_is_reproducible(self):
+        other = make_env()
+        observation, info = self.env.reset(seed=7)
+        other_observation, other_info = other.reset(seed=7)
+        np.testing.assert_array_equal(observation, other_observation)
+        self.assertEqual(info["game_seed"], other_info["game_seed"])
+
+        # The seed of the game can be given in the options
+        self.assertEqual(self.env.reset(options={"game_seed": 42})[1]["game_seed"], 42)
+
+    def test_async_vector_env(self):
+        envs = AsyncVectorEnv([make_env for _ in range(2)])
+        try:
+            observations, infos = envs.reset(seed=3)
+            self.assertEqual(observations.shape, (2,) + self.env.observation_space.shape)
+
+            actions = np.array([int(np.flatnonzero(mask)[0]) for mask in infos["action_mask"]])
+            observations, rewards, terminated, truncated, infos = envs.step(actions)
+            self.assertEqual(rewards.shape, (2,))
+            self.assertFalse(truncated.any())
+        finally:
+            envs.close()
+
+    def test_legacy_gym_is_not_imported(self):
+        result = subprocess.run([sys.executable, "-c", "import sys, ai.gymnasium_env; print('gym' in sys.modules)"],
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
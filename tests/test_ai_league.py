@@ -0,0 +1,171 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from ai.batch_decider import decide_actions
+from ai.vec_game_env import POLICY_STRATEGY, VecGameEnv
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+
+# The league loads its snapshots with stable-baselines3, which isn't a requirement of the tests
+HAS_STABLE_BASELINES = importlib.util.find_spec("stable_baselines3") is not None
+if HAS_STABLE_BASELINES:
+    from stable_baselines3 import PPO
+
+    from ai.league import League, LeagueCallback, SnapshotOpponents
+    from ai.sb3_vec_env import StableBaselinesVecEnv
+
+
+@unittest.skipUnless(HAS_STABLE_BASELINES, "stable-baselines3 is not installed")
+class TestLeague(unittest.TestCase):
+
+    def setUp(self):
+        self.league = League(seed=1234)
+
+    def test_add(self):
+        self.assertEqual(self.league.add("first"), 0)
+        self.assertEqual(self.league.add("second"), 1)
+        self.assertEqual(self.league.paths, ["first", "second"])
+        # A snapshot that hasn't played has an even win rate
+        self.assertEqual(self.league.win_rate(1), 0.5)
+
+    def test_sample_requires_snapshots(self):
+        with self.assertRaises(ValueError):
+            self.league.sample()
+
+    def test_record(self):
+        self.league.add("first")
+        self.league.record(0, True)
+        self.league.record(0, True)
+        self.league.record(0, False)
+        self.assertEqual(self.league.win_rate(0), 3 / 5)
+
+    def test_sample_prefers_snapshots_that_beat_the_agent(self):
+        self.league.add("weak")
+        self.league.add("strong")
+        for _ in range(50):
+            self.league.record(0, False)
+            self.league.record(1, True)
+
+        samples = [self.league.sample() for _ in range(1000)]
+        self.assertGreater(samples.count(1), samples.count(0) * 10)
+        # Every snapshot can still be sampled
+        self.assertIn(0, samples)
+
+
+@unittest.skipUnless(HAS_STABLE_BASELINES, "stable-baselines3 is not installed")
+class TestSnapshotOpponents(unittest.TestCase):
+
+    def test_snapshot_decides_valid_actions(self):
+        player_infos = [
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI, strategy=POLICY_STRATEGY)]
+        league = League(seed=1234)
+        opponents = SnapshotOpponents(league, len(player_infos))
+        env = VecGameEnv(player_infos=player_infos, num_envs=4, seed=1234, batch_opponents=True,
+                         opponent_policy=opponents)
+
+        # An opponent policy without a snapshot can't decide
+        with self.assertRaises(ValueError):
+            env.reset()
+
+        with tempfile.TemporaryDirectory() as league_dir:
+            path = os.path.join(league_dir, "snapshot_0")
+            PPO("MlpPolicy", StableBaselinesVecEnv(env), n_steps=8, batch_size=8).save(path)
+            opponents.use(league.add(path))
+
+        env.reset()
+        states = [game.export_state() for game in env.games]
+        actions = opponents(env.games, states)
+        self.assertEqual(actions.shape, (4,))
+        for action, state in zip(actions, states):
+            self.assertTrue((state.legal_action_mask >> int(action)) & 1)
+
+
+@unittest.skipUnless(HAS_STABLE_BASELINES, "stable-baselines3 is not installed")
+class TestLeagueCallback(unittest.TestCase):
+
+    def setUp(self):
+        self.league = League(seed=1234)
+        self.league.add("snapshot")
+        self.opponents = SnapshotOpponents(self.league, 4)
+        # Use the snapshot without loading it, since only the results are recorded
+        self.opponents.index = 0
+        self.callback = LeagueCallback(self.opponents, snapshot_seats=[2, 3])
+
+    def record(self, infos):
+        self.callback.locals = {"infos": infos}
+        self.assertTrue(self.callback._on_step())
+
+    def test_greedy_seat_winning_is_not_a_snapshot_win(self):
+        # The greedy seat wins and the agent finishes ahead of both snapshot seats
+        self.record([{"finishing_position": 1, "finishing_positions": [1, 0, 2, 3]}])
+        self.assertEqual(self.league.win_rate(0), 1 / 3)
+
+    def test_snapshot_seat_ahead_of_agent_is_a_snapshot_win(self):
+        self.record([{"finishing_position": 2, "finishing_positions": [2, 0, 3, 1]}])
+        self.assertEqual(self.league.win_rate(0), 2 / 3)
+
+    def test_unfinished_games_are_not_recorded(self):
+        self.record([{}, {"terminal_observation": None}])
+        self.assertEqual(self.league.win_rate(0), 0.5)
+
+
+class TestVecGameEnvOpponentPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.player_infos = [
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI, strategy=POLICY_STRATEGY),
+            PlayerInfo(name="Eve", type=PlayerType.AI, strategy=POLICY_STRATEGY)]
+        self.calls = []
+
+    def opponent_policy(self, games, states):
+        # Play like the greedy strategy, recording the seats of every call
+        self.calls.append([state.turn_player_index for state in states])
+        return decide_actions(states)
+
+    def test_policy_strategy_requires_opponent_policy(self):
+        with self.assertRaises(ValueError):
+            VecGameEnv(player_infos=self.player_infos, num_envs=2, batch_opponents=True)
+
+    def test_opponent_policy_decides_policy_seats_in_batch(self):
+        env = VecGameEnv(player_infos=self.player_infos, num_envs=8, seed=1234, batch_opponents=True,
+                         opponent_policy=self.opponent_policy)
+        env.reset()
+
+        finishing_positions = []
+        for _ in range(200):
+            actions = np.array([np.flatnonzero(mask)[0] for mask in env.action_masks()])
+            _, _, dones, infos = env.step(actions)
+            for done, info in zip(dones, infos):
+                if done:
+                    finishing_positions.append(info["finishing_position"])
+                    # Every seat finishes in a different position
+                    self.assertEqual(sorted(info["finishing_positions"]), [0, 1, 2, 3])
+                    self.assertEqual(info["finishing_positions"][0], info["finishing_position"])
+
+        # The policy only decides for its seats, many games at once
+        self.assertTrue(self.calls)
+        self.assertTrue(all(seat in (2, 3) for call in self.calls for seat in call))
+        self.assertGreater(max(len(call) for call in self.calls), 1)
+        # The agent finishes somewhere in every finished game
+        self.assertTrue(finishing_positions)
+        self.assertTrue(all(0 <= position < 4 for position in finishing_positions))
+
+    def test_opponent_policy_matches_greedy_opponents(self):
+        greedy_infos = [player_info._replace(strategy="greedy") for player_info in self.player_infos]
+        greedy_env = VecGameEnv(player_infos=greedy_infos, num_envs=3, seed=1234, batch_opponents=True)
+        policy_env = VecGameEnv(player_infos=self.player_infos, num_envs=3, seed=1234, batch_opponents=True,
+                                opponent_policy=self.opponent_policy)
+
+        np.testing.assert_array_equal(greedy_env.reset(), policy_env.reset())
+        for _ in range(50):
+            actions = np.array([np.flatnonzero(mask)[0] for mask in greedy_env.action_masks()])
+            greedy_observations, greedy_rewards, _, _ = greedy_env.step(actions)
+            policy_observations, policy_rewards, _, _ = policy_env.step(actions)
+            np.testing.assert_array_equal(greedy_observations, policy_observations)
+            np.testing.assert_array_equal(greedy_rewards, policy_rewards)
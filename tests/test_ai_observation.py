@@ -0,0 +1,104 @@
+import random
+import unittest
+import numpy as np
+
+from ai.game_env import GameEnv
+from ai.observation import ObservationEncoder, observation_size
+from lib.action import ActionType
+from lib.card import Suit
+from lib.game_state import TurnPhase
+from lib.game import Game, PlayerInfo
+from lib.player import PlayerType
+
+
+class TestObservationEncoder(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(player_infos=[PlayerInfo(name=name, type=PlayerType.HUMAN)
+                                       for name in ["Gym", "Alice", "Ted", "Eve"]], seed=5)
+        self.encoder = ObservationEncoder(player_count=4)
+
+    def expected_observation(self):
+        # Encode the observation from the board matrix, the hand and the opponents of the turn
+        board_encoding = [card for suit in self.game.board for card in suit]
+        hand_encoding = [0] * 52
+        for card in self.game.turn.player.hand:
+            hand_encoding[card.index] = 1
+        opponent_hand_sizes = [len(opponent.hand) for opponent in self.game.turn.opponents]
+        return np.array(board_encoding + hand_encoding + opponent_hand_sizes)
+
+    def test_encode_matches_game(self):
+        rng = random.Random(5)
+        self.game.start()
+        out = np.zeros((2, 107), dtype=np.int8)
+
+        while not self.game.is_finished():
+            observation = self.encoder.encode(self.game.export_state())
+            self.assertEqual(observation.dtype, np.int32)
+            np.testing.assert_array_equal(observation, self.expected_observation())
+
+            # The observation can be written into a row of another array
+            row = out[1]
+            self.assertIs(self.encoder.encode(self.game.export_state(), out=row), row)
+            np.testing.assert_array_equal(out[1], self.expected_observation())
+
+            self.game.execute_action(rng.choice(sorted(self.game.turn.actions, key=str)))
+
+    def test_encode_extended(self):
+        rng = random.Random(9)
+        encoder = ObservationEncoder(player_count=4, extended=True, take_window=3)
+        self.assertEqual(encoder.shape, (observation_size(4) + 52 + 8 + 3 + 3,))
+        self.game.start()
+        takers = []
+
+        while not self.game.is_finished():
+            state = self.game.export_state()
+            observation = encoder.encode_game(self.game)
+            np.testing.assert_array_equal(observation[:107], self.expected_observation())
+
+            playable = observation[107:159]
+            self.assertEqual(set(np.flatnonzero(playable)), {
+                index for index in range(52) if state.playable_mask >> index & 1})
+
+            frontier = observation[159:167]
+            self.assertEqual(list(frontier), [rank.value for suit in Suit for rank in self.game.frontier[suit]])
+
+            phase = observation[167:170]
+            self.assertEqual(list(phase), [int(state.phase is turn_phase) for turn_phase in TurnPhase])
+
+            # The players who took a card, relative to the player of the turn, the most recent first
+            expected_takes = [(taker - state.turn_player_index) % 4 + 1 for taker in takers[:3]]
+            self.assertEqual(list(observation[170:]), expected_takes + [0] * (3 - len(expected_takes)))
+
+            action = rng.choice(sorted(self.game.turn.actions, key=str))
+            if action.type is ActionType.TAKE_CARD:
+                takers.insert(0, state.turn_player_index)
+            self.game.execute_action(action)
+
+        self.assertEqual(list(self.game.take_history), takers[:8])
+        with self.assertRaises(ValueError):
+            ObservationEncoder(player_count=4, extended=True, take_window=9)
+
+    def test_encode_reuses_buffer(self):
+        self.game.start()
+        observation = self.encoder.encode(self.game.export_state())
+        self.assertIs(self.encoder.encode(self.game.export_state()), observation)
+
+    def test_env_observations(self):
+        env = GameEnv(Game(player_infos=[PlayerInfo(name=name, type=PlayerType.HUMAN)
+                                         for name in ["Gym", "Alice", "Ted", "Eve"]]), copy_observations=False)
+        observation = env.reset(seed=5)
+        self.assertEqual(observation.dtype, env.observation_space.dtype)
+        self.assertTrue(env.observation_space.contains(observation))
+        self.assertIs(env.get_state(), observation)
+
+        env = GameEnv(Game(player_infos=[PlayerInfo(name=name, type=PlayerType.AI if name != "Gym" else
+                                                     PlayerType.HUMAN) for name in ["Gym", "Alice", "Ted", "Eve"]]),
+                      extended_observations=True)
+        observation = env.reset(seed=5)
+        self.assertEqual(observation.shape, env.observation_space.shape)
+        self.assertTrue(env.observation_space.contains(observation))
+
+
+if __name__ == "__main__":
+    unittest.main()
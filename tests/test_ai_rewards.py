@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+
+from ai.game_env import GameEnv
+from ai.rewards import RewardConfig
+from lib.game import Game, PlayerInfo
+from lib.player import PlayerType
+
+
+class TestRewards(unittest.TestCase):
+
+    def make_env(self, reward_config):
+        game = Game(player_infos=[
+            PlayerInfo(name="Gym", type=PlayerType.HUMAN),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI),
+            PlayerInfo(name="Eve", type=PlayerType.AI)])
+        return GameEnv(game, reward_config=reward_config)
+
+    def play_episode(self, env, seed):
+        # Play the last valid action of every step, and collect the rewards of the episode
+        env.reset(seed=seed)
+        hand_size = env.game.players[0].hand_size
+        rewards = []
+        done = False
+        while not done:
+            action = int(np.flatnonzero(env.action_masks())[-1])
+            _, reward, done, _ = env.step(action)
+            rewards.append(reward)
+        return hand_size, rewards
+
+    def test_default_rewards_are_sparse(self):
+        env = self.make_env(RewardConfig())
+        for seed in range(5):
+            _, rewards = self.play_episode(env, seed)
+            self.assertTrue(all(reward == 0 for reward in rewards[:-1]))
+            self.assertIn(rewards[-1], [-1.0, 1.0])
+
+    def test_shaped_rewards_add_up(self):
+        config = RewardConfig(win=1.0, loss=-1.0, card_shed=0.5, card_received=-0.25, finish_position=4.0)
+        env = self.make_env(config)
+        for seed in range(5):
+            hand_size, rewards = self.play_episode(env, seed)
+            received = env.game.cards_received[0]
+            position = env.game.finished_players.index(env.game.players[0])
+
+            # Every card dealt or received is shed by the end of the game
+            expected = (config.card_shed * (hand_size + received) + config.card_received * received
+                        + (config.win if position == 0 else config.loss) + config.finish_position * (3 - position) / 3)
+            self.assertAlmostEqual(sum(rewards), expected)
+
+    def test_invalid_action_is_penalized(self):
+        env = self.make_env(RewardConfig(invalid_action=-0.5))
+        env.reset(seed=1)
+        invalid_action = int(np.flatnonzero(~env.action_masks())[0])
+        _, reward, done, _ = env.step(invalid_action)
+        if not done:
+            self.assertEqual(reward, -0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
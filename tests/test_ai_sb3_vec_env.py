@@ -0,0 +1,55 @@
+import importlib.util
+import unittest
+import numpy as np
+
+from ai.vec_game_env import VecGameEnv
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+
+# The adapter implements the VecEnv of stable-baselines3, which isn't a requirement of the tests
+HAS_STABLE_BASELINES = importlib.util.find_spec("stable_baselines3") is not None
+if HAS_STABLE_BASELINES:
+    from ai.sb3_vec_env import StableBaselinesVecEnv
+
+
+@unittest.skipUnless(HAS_STABLE_BASELINES, "stable-baselines3 is not installed")
+class TestStableBaselinesVecEnv(unittest.TestCase):
+
+    def setUp(self):
+        player_infos = [
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI)]
+        self.env = StableBaselinesVecEnv(VecGameEnv(player_infos=player_infos, num_envs=3))
+
+    def tearDown(self):
+        self.env.close()
+
+    def play(self, steps):
+        # Choose the first valid action of every game
+        observations = []
+        for _ in range(steps):
+            actions = np.array([np.flatnonzero(mask)[0] for mask in self.env.env_method("action_masks")])
+            observations.append(self.env.step(actions)[0])
+        return observations
+
+    def test_reset_with_same_seed_is_reproducible(self):
+        self.env.seed(1234)
+        first_observations = self.env.reset()
+        first_steps = self.play(50)
+
+        self.env.seed(1234)
+        second_observations = self.env.reset()
+        second_steps = self.play(50)
+
+        np.testing.assert_array_equal(first_observations, second_observations)
+        for first, second in zip(first_steps, second_steps):
+            np.testing.assert_array_equal(first, second)
+
+    def test_seeds_are_only_used_once(self):
+        self.env.seed(1234)
+        first_observations = self.env.reset()
+        self.assertEqual(self.env._seeds, [None, None, None])
+
+        # Resetting without a new seed deals new games
+        self.assertFalse(np.array_equal(self.env.reset(), first_observations))
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+
+from ai.shared_vec_env import SharedMemoryVecEnv
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+
+
+class TestSharedMemoryVecEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.player_infos = [
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI)]
+        self.env = SharedMemoryVecEnv(
+            player_infos=self.player_infos, num_workers=2, envs_per_worker=2, seed=1234)
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_reset(self):
+        observations = self.env.reset()
+        # Verify the size and dtype of the observations of every game of every worker
+        self.assertEqual(observations.shape, (4, 52 * 2 + 2))
+        self.assertEqual(observations.dtype, np.int8)
+        # Every game starts with the agent holding its cards
+        self.assertTrue(np.all(observations[:, 52:104].sum(axis=1) > 0))
+        # Every game has at least one valid action
+        self.assertEqual(self.env.action_masks().shape, (4, self.env.action_space.n))
+        self.assertTrue(np.all(self.env.action_masks().any(axis=1)))
+
+    def test_step_until_games_finish(self):
+        observations = self.env.reset()
+        rng = np.random.default_rng(0)
+
+        finished = 0
+        while finished < 4:
+            next_observations, rewards, dones, infos = self.env.step(
+                rng.integers(0, self.env.action_space.n, size=4))
+
+            # The observations are exchanged through the same shared array
+            self.assertIs(next_observations, observations)
+            self.assertEqual(len(infos), 4)
+            for index in np.flatnonzero(dones):
+                finished += 1
+                self.assertIn(rewards[index], [-1.0, 1.0])
+                self.assertEqual(infos[index]["terminal_observation"].shape, (52 * 2 + 2,))
+
+    def test_seed_is_reproducible(self):
+        other = SharedMemoryVecEnv(
+            player_infos=self.player_infos, num_workers=2, envs_per_worker=2, seed=1234)
+        try:
+            np.testing.assert_array_equal(self.env.reset().copy(), other.reset())
+        finally:
+            other.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+
+from ai.vec_game_env import VecGameEnv
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+
+
+class TestVecGameEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.player_infos = [
+            PlayerInfo(name="Gym", type=PlayerType.AGENT),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI),
+            PlayerInfo(name="Eve", type=PlayerType.AI)]
+        self.env = VecGameEnv(player_infos=self.player_infos, num_envs=3, seed=1234)
+
+    def valid_actions(self):
+        # Choose the first valid action of every game
+        return np.array([next(i for i, act in enumerate(self.env.all_possible_actions) if act in game.turn.actions)
+                         for game in self.env.games])
+
+    def test_reset(self):
+        observations = self.env.reset()
+        # Verify the type, size and dtype of the observations
+        self.assertIsInstance(observations, np.ndarray)
+        self.assertEqual(observations.shape, (3, 52 * 2 + 3))
+        self.assertEqual(observations.dtype, np.int8)
+        # Every game starts with the agent holding its cards
+        for index, game in enumerate(self.env.games):
+            self.assertEqual(observations[index, 52:104].sum(), len(game.turn.player.hand))
+
+    def test_step_valid_actions(self):
+        observations = self.env.reset()
+
+        next_observations, rewards, dones, infos = self.env.step(self.valid_actions())
+
+        # The observations are written into the same preallocated array
+        self.assertIs(next_observations, observations)
+        self.assertEqual(rewards.shape, (3,))
+        self.assertEqual(dones.shape, (3,))
+        self.assertEqual(len(infos), 3)
+        self.assertTrue(np.all(rewards[~dones] == 0))
+
+    def test_step_invalid_actions_are_penalized(self):
+        self.env.reset()
+
+        # Pass turn, the last action, is never valid on the first move of the agent
+        actions = np.full(3, len(self.env.all_possible_actions) - 1)
+        _, rewards, dones, _ = self.env.step(actions)
+
+        self.assertTrue(np.all(rewards[~dones] == -0.01))
+
+    def test_action_masks(self):
+        self.env.reset()
+
+        # Every row marks exactly the actions of the current turn of its game
+        action_masks = self.env.action_masks()
+        self.assertEqual(action_masks.shape, (3, self.env.action_space.n))
+        for index, game in enumerate(self.env.games):
+            self.assertEqual({self.env.all_possible_actions[i] for i in np.flatnonzero(action_masks[index])},
+                             set(game.turn.actions))
+
+    def test_finished_games_are_reset(self):
+        self.env.reset()
+
+        finished = 0
+        while finished == 0:
+            _, rewards, dones, infos = self.env.step(self.valid_actions())
+            for index in np.flatnonzero(dones):
+                finished += 1
+                self.assertIn(rewards[index], [-1.0, 1.0])
+                self.assertIn("terminal_observation", infos[index])
+                # The game was started again
+                self.assertFalse(self.env.games[index].is_finished())
+
+    def test_seed_is_reproducible(self):
+        other = VecGameEnv(player_infos=self.player_infos, num_envs=3, seed=1234)
+        np.testing.assert_array_equal(self.env.reset(), other.reset())
+
+    def test_batched_opponents_match_opponents(self):
+        batched = VecGameEnv(player_infos=self.player_infos, num_envs=3, seed=1234, batch_opponents=True)
+        np.testing.assert_array_equal(self.env.reset(), batched.reset())
+
+        # The greedy opponents decide the same actions whether they play in batch or one game at a time
+        for _ in range(40):
+            actions = self.valid_actions()
+            observations, rewards, dones, _ = self.env.step(actions)
+            batched_observations, batched_rewards, batched_dones, _ = batched.step(actions)
+            np.testing.assert_array_equal(observations, batched_observations)
+            np.testing.assert_array_equal(rewards, batched_rewards)
+            np.testing.assert_array_equal(dones, batched_dones)
+
+    def test_batched_opponents_require_greedy_strategy(self):
+        player_infos = self.player_infos[:-1] + [PlayerInfo(name="Eve", type=PlayerType.AI, strategy="random")]
+        with self.assertRaises(ValueError):
+            VecGameEnv(player_infos=player_infos, num_envs=3, batch_opponents=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,7 +73,7 @@ class TestBoard(unittest.TestCase):
         # This function is used to add a card to the board and test the valid cards
         def add_card_and_test(suit, rank, next_rank) -> None:
             current_card = Card(suit, rank)
-            future_card = Card(suit, next_rank)
+            future_card = Card(suit, next_rank) if next_rank is not None else None
 
             # The current card should be valid before adding it to the board
             self.assertTrue(board.is_valid_card(current_card))
@@ -136,6 +136,102 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(str(context.exception),
                          f"Invalid card: {invalid_card}")
 
+    def test_board_playable_mask(self) -> None:
+        """Test that the playable mask follows the cards added to the board."""
+        board = Board()
+
+        # At the start of the game, only the seven of hearts should be playable
+        self.assertEqual(board.mask, 0)
+        self.assertEqual(board.playable_mask, 1 << Card(Suit.HEARTS, Rank.SEVEN).index)
+
+        # Playing the seven of hearts unlocks the other sevens and its neighbours
+        board.add_card(Card(Suit.HEARTS, Rank.SEVEN))
+        expected_playable_cards = [Card(Suit.HEARTS, Rank.SIX), Card(Suit.HEARTS, Rank.EIGHT)] + [
+            Card(suit, Rank.SEVEN) for suit in [Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]]
+        self.assertEqual(board.playable_mask, sum(
+            1 << card.index for card in expected_playable_cards))
+
+        # Playing down to the ace and up to the king never unlocks cards of other suits
+        for rank in [Rank.SIX, Rank.FIVE, Rank.FOUR, Rank.THREE, Rank.TWO, Rank.ACE]:
+            board.add_card(Card(Suit.HEARTS, rank))
+        for rank in list(Rank)[7:]:  # EIGHT to KING
+            board.add_card(Card(Suit.HEARTS, rank))
+        self.assertEqual(board.mask, (1 << len(Rank)) - 1)
+        self.assertEqual(board.playable_mask, sum(
+            1 << Card(suit, Rank.SEVEN).index for suit in [Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]))
+
+    def test_board_get_valid_mask(self) -> None:
+        """Test filtering a bitmask of cards against the board."""
+        board = Board()
+        board.add_card(Card(Suit.HEARTS, Rank.SEVEN))
+
+        cards = [Card(Suit.HEARTS, Rank.SIX), Card(
+            Suit.HEARTS, Rank.FIVE), Card(Suit.CLUBS, Rank.SEVEN)]
+        mask = sum(1 << card.index for card in cards)
+
+        self.assertEqual(board.get_valid_mask(mask), mask & ~(
+            1 << Card(Suit.HEARTS, Rank.FIVE).index))
+
+    def test_board_matrix(self) -> None:
+        """Test that the matrix representation matches the cards on the board."""
+        board = Board()
+        board.add_card(Card(Suit.HEARTS, Rank.SEVEN))
+        board.add_card(Card(Suit.SPADES, Rank.SEVEN))
+
+        expected_matrix = [[False] * 13 for _ in range(4)]
+        expected_matrix[Suit.HEARTS.value - 1][Rank.SEVEN.value - 1] = True
+        expected_matrix[Suit.SPADES.value - 1][Rank.SEVEN.value - 1] = True
+        self.assertEqual([list(suit) for suit in board.matrix], expected_matrix)
+
+    def test_board_matrix_is_shared_until_mutated(self) -> None:
+        """Test that the read-only matrix is reused until a card is added to the board."""
+        board = Board()
+        matrix = board.matrix
+        version = board.version
+
+        # Reading the matrix again returns the very same immutable snapshot
+        self.assertIs(board.matrix, matrix)
+        with self.assertRaises(TypeError):
+            matrix[Suit.HEARTS.value - 1][Rank.SEVEN.value - 1] = True
+
+        # Adding a card bumps the version and invalidates the snapshot
+        board.add_card(Card(Suit.HEARTS, Rank.SEVEN))
+        self.assertEqual(board.version, version + 1)
+        self.assertIsNot(board.matrix, matrix)
+        self.assertFalse(matrix[Suit.HEARTS.value - 1][Rank.SEVEN.value - 1])
+        self.assertTrue(board.matrix[Suit.HEARTS.value - 1][Rank.SEVEN.value - 1])
+
+    def test_board_restored_from_mask(self) -> None:
+        """Test that a board restored from a bitmask has the same playable cards as the board it was taken from."""
+        board = Board()
+        for card in [Card(Suit.HEARTS, Rank.SEVEN), Card(Suit.HEARTS, Rank.SIX), Card(Suit.SPADES, Rank.SEVEN),
+                     Card(Suit.SPADES, Rank.EIGHT), Card(Suit.HEARTS, Rank.EIGHT)]:
+            unlocked_mask = board.add_card(card)
+            self.assertEqual(unlocked_mask & board.mask, 0)
+
+        restored = Board(mask=board.mask)
+
+        self.assertEqual(restored.mask, board.mask)
+        self.assertEqual(restored.playable_mask, board.playable_mask)
+        self.assertEqual(restored.matrix, board.matrix)
+        self.assertEqual(Board(mask=0).playable_mask, Board().playable_mask)
+
+    def test_board_frontier(self) -> None:
+        """Test that the frontier is kept up to date as cards are added, and matches a board restored from its mask."""
+        board = Board()
+        frontier = board.frontier
+        self.assertEqual(frontier[Suit.HEARTS], (Rank.SEVEN, Rank.SEVEN))
+
+        for card in [Card(Suit.HEARTS, Rank.SEVEN), Card(Suit.HEARTS, Rank.SIX), Card(Suit.SPADES, Rank.SEVEN),
+                     Card(Suit.SPADES, Rank.EIGHT), Card(Suit.SPADES, Rank.NINE), Card(Suit.HEARTS, Rank.FIVE)]:
+            board.add_card(card)
+
+        self.assertEqual(frontier, {Suit.HEARTS: (Rank.FIVE, Rank.SEVEN), Suit.DIAMONDS: (Rank.SEVEN, Rank.SEVEN),
+                                    Suit.CLUBS: (Rank.SEVEN, Rank.SEVEN), Suit.SPADES: (Rank.SEVEN, Rank.NINE)})
+        self.assertEqual(dict(Board(mask=board.mask).frontier), dict(board.frontier))
+        with self.assertRaises(TypeError):
+            frontier[Suit.HEARTS] = (Rank.ACE, Rank.KING)
+
     def test_cards_are_hashable(self) -> None:
         """Test that cards can be added to a set, which requires them to be hashable."""
         card1 = Card(Suit.HEARTS, Rank.SEVEN)
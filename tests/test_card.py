@@ -1,8 +1,9 @@
 # tests/test_card.py
 
+import pickle
 import unittest
 
-from lib.card import Card, Suit, Rank
+from lib.card import Card, CARDS, Suit, Rank
 
 
 class TestCard(unittest.TestCase):
@@ -33,6 +34,30 @@ class TestCard(unittest.TestCase):
         card = Card(Suit.HEARTS, Rank.SEVEN)
         assert str(card) == "SEVEN of HEARTS"
 
+    def test_cards_are_interned(self) -> None:
+        """Test that creating a card with the same Suit and Rank returns the same instance."""
+        card = Card(Suit.HEARTS, Rank.SEVEN)
+
+        self.assertIs(card, Card(Suit.HEARTS, Rank.SEVEN))
+        self.assertIs(card, Card.from_index(card.index))
+        self.assertIs(card, pickle.loads(pickle.dumps(card)))
+
+    def test_card_indices(self) -> None:
+        """Test that the 52 cards have unique indices ordered by suit and then by rank."""
+        self.assertEqual(len(CARDS), 52)
+        self.assertEqual([card.index for card in CARDS], list(range(52)))
+        self.assertEqual(Card(Suit.HEARTS, Rank.ACE).index, 0)
+        self.assertEqual(Card(Suit.SPADES, Rank.KING).index, 51)
+        self.assertEqual(sorted(CARDS, reverse=True), list(reversed(CARDS)))
+
+    def test_card_is_immutable(self) -> None:
+        """Test that an interned card cannot be modified."""
+        card = Card(Suit.HEARTS, Rank.SEVEN)
+
+        with self.assertRaises(AttributeError):
+            card.rank = Rank.ACE
+        self.assertFalse(hasattr(card, "__dict__"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 # tests/test_deck.py
 
+import random
 import unittest
 from lib.deck import Deck
 
@@ -19,11 +20,43 @@ class TestDeck(unittest.TestCase):
         self.deck.shuffle()
         self.assertNotEqual(cards_before_shuffling, self.deck.cards)
 
+    def test_shuffle_with_seed_is_reproducible(self) -> None:
+        """Test that decks shuffled with the same seed, or an equally seeded generator, have the same order."""
+        deck1 = Deck(rng=1234)
+        deck2 = Deck(rng=random.Random(1234))
+        deck1.shuffle()
+        deck2.shuffle()
+        self.assertEqual(deck1.cards, deck2.cards)
+
+    def test_shuffle_does_not_use_global_random(self) -> None:
+        """Test that shuffling a deck leaves the global random number generator untouched."""
+        state = random.getstate()
+        self.deck.shuffle()
+        self.assertEqual(random.getstate(), state)
+
     def test_deal_reduces_deck_size_by_one(self) -> None:
         """Test that dealing a card reduces the size of the deck by 1."""
         self.deck.deal()
         self.assertEqual(len(self.deck.cards), 51)
 
+    def test_deal_hands_matches_dealing_one_by_one(self) -> None:
+        """Test that dealing all hands at once hands out the same cards as dealing them one by one in turn."""
+        deck1 = Deck(rng=1234)
+        deck2 = Deck(rng=1234)
+        deck1.shuffle()
+        deck2.shuffle()
+
+        expected_hands = [[] for _ in range(3)]
+        player_index = 0
+        while not deck1.empty():
+            expected_hands[player_index].append(deck1.deal())
+            player_index = (player_index + 1) % 3
+
+        self.assertEqual(deck2.deal_hands(3), expected_hands)
+        self.assertTrue(deck2.empty())
+        with self.assertRaises(ValueError):
+            Deck().deal_hands(0)
+
     def test_string_representation_is_as_expected(self) -> None:
         """Test that the string representation of a deck is as expected."""
         self.assertEqual(str(self.deck), "Deck of 52 cards")
@@ -88,6 +88,99 @@ class TestGame(unittest.TestCase):
         self.assertIn("Ted", finished_player_names)
         self.assertIn("Eve", finished_player_names)
 
+    def test_game_play_actions_match_hand(self) -> None:
+        """Test that the incrementally kept play actions always match a rescan of the hand against the board."""
+
+        rng = random.Random(5)
+        self.game.reset(seed=5)
+        self.game.start()
+
+        while not self.game.is_finished():
+            turn = self.game.turn
+            board = self.game._Game__board
+            if Action(type=ActionType.TAKE_CARD) not in turn.actions and Action(type=ActionType.GIVE_CARD, card=turn.player.hand[0]) not in turn.actions:
+                valid_cards = board.get_valid_cards(turn.player.hand)
+                self.assertEqual({action.card for action in turn.actions if action.type is ActionType.PLAY_CARD},
+                                 set(valid_cards))
+                self.assertEqual(Action(type=ActionType.PLAY_ALL_CARDS) in turn.actions,
+                                 valid_cards == turn.player.hand)
+            elif Action(type=ActionType.TAKE_CARD) in turn.actions:
+                self.assertEqual(board.get_valid_cards(turn.player.hand), [])
+
+            # The exported hands are the hands of the players
+            self.assertEqual(self.game.export_state().hand_masks,
+                             tuple(player.hand_mask for player in self.game.players))
+
+            self.game.execute_action(
+                action=rng.choice(sorted(turn.actions, key=str)))
+
+    def test_game_with_seed_is_reproducible(self) -> None:
+        """Test that games with the same seed are dealt and played the same way."""
+
+        player_infos = [PlayerInfo(name=name, type=PlayerType.AI)
+                        for name in ["Bob", "Alice", "Ted", "Eve"]]
+        game1 = Game(player_infos=player_infos, seed=1234)
+        game2 = Game(player_infos=player_infos)
+        game2.reset(seed=1234)
+
+        self.assertEqual(game1.seed, 1234)
+        self.assertEqual(game2.seed, 1234)
+
+        game1.start()
+        game2.start()
+        self.assertEqual([player.name for player in game1.finished_players], [
+                         player.name for player in game2.finished_players])
+
+    def test_game_reset_reuses_objects(self) -> None:
+        """Test that resetting a played game reuses its objects and plays like a new game with the same seed."""
+
+        player_infos = [PlayerInfo(name=name, type=PlayerType.AI)
+                        for name in ["Bob", "Alice", "Ted", "Eve"]]
+        game = Game(player_infos=player_infos, seed=1)
+        game.start()
+        players = game.players
+        deck = game._Game__deck
+        board = game._Game__board
+
+        game.reset(seed=1234)
+        self.assertEqual(game.finished_players, [])
+        self.assertEqual(game.board, Game(player_infos=player_infos).board)
+        game.start()
+
+        self.assertIs(game.players, players)
+        self.assertIs(game._Game__deck, deck)
+        self.assertIs(game._Game__board, board)
+
+        replay = Game(player_infos=player_infos, seed=1234)
+        replay.start()
+        self.assertEqual([player.name for player in game.finished_players], [
+                         player.name for player in replay.finished_players])
+
+    def test_game_records_drawn_seeds(self) -> None:
+        """Test that a game records the seed it draws, and draws the same seeds from an equally seeded generator."""
+
+        player_infos = [PlayerInfo(name=name, type=PlayerType.HUMAN)
+                        for name in ["Bob", "Alice", "Ted"]]
+        game1 = Game(player_infos=player_infos, seed=random.Random(99))
+        game2 = Game(player_infos=player_infos, seed=random.Random(99))
+        seeds1 = [game1.seed]
+        seeds2 = [game2.seed]
+        for _ in range(3):
+            game1.reset()
+            game2.reset()
+            seeds1.append(game1.seed)
+            seeds2.append(game2.seed)
+
+        self.assertEqual(seeds1, seeds2)
+        self.assertEqual(len(set(seeds1)), 4)
+
+        game1.start()
+        replay = Game(player_infos=player_infos, seed=game1.seed)
+        replay.start()
+        self.assertEqual(game1.turn.player.name, replay.turn.player.name)
+        self.assertEqual([player.hand for player in game1.players], [
+                         player.hand for player in replay.players])
+
     def test_invalid_play_card(self) -> None:
         """Test that playing an invalid card raises an error."""
 
@@ -0,0 +1,150 @@
+# tests/test_game_state.py
+
+import random
+import unittest
+
+from lib.action import Action, ActionType
+from lib.action_codec import actions_to_mask
+from lib.card import Card, Rank, Suit
+from lib.game import Game, PlayerInfo
+from lib.game_state import GameState, TurnPhase
+from lib.player import PlayerType
+
+
+def card_mask(*cards: Card) -> int:
+    """Build a bitmask of the given cards."""
+    return sum(1 << card.index for card in cards)
+
+
+class TestGameState(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up player information for use in test cases."""
+
+        self.player_infos = [PlayerInfo(name=name, type=PlayerType.HUMAN)
+                             for name in ["Bob", "Alice", "Ted", "Eve"]]
+
+    def test_new_state_starts_with_seven_of_hearts(self) -> None:
+        """Test that the owner of the seven of hearts starts and can only play it."""
+
+        seven_of_hearts = Card(Suit.HEARTS, Rank.SEVEN)
+        state = GameState.new((card_mask(Card(Suit.HEARTS, Rank.SIX)),
+                               card_mask(seven_of_hearts, Card(Suit.HEARTS, Rank.EIGHT))))
+
+        self.assertEqual(state.current_player_index, 1)
+        self.assertEqual(state.turn_player_index, 1)
+        self.assertEqual(state.legal_actions, [
+                         Action(type=ActionType.PLAY_CARD, card=seven_of_hearts)])
+
+    def test_apply_is_persistent(self) -> None:
+        """Test that applying an action returns a new state and leaves the original unchanged."""
+
+        seven_of_hearts = Card(Suit.HEARTS, Rank.SEVEN)
+        state = GameState.new((card_mask(Card(Suit.HEARTS, Rank.SIX)),
+                               card_mask(seven_of_hearts, Card(Suit.HEARTS, Rank.EIGHT))))
+
+        next_state = state.apply(
+            Action(type=ActionType.PLAY_CARD, card=seven_of_hearts))
+
+        self.assertEqual(state.board_mask, 0)
+        self.assertEqual(next_state.board_mask, card_mask(seven_of_hearts))
+        self.assertEqual(next_state.current_player_index, 0)
+        self.assertEqual(next_state.legal_actions, [Action(type=ActionType.PLAY_CARD, card=Card(Suit.HEARTS, Rank.SIX)),
+                                                    Action(type=ActionType.PLAY_ALL_CARDS)])
+
+    def test_bonus_turn_after_ace(self) -> None:
+        """Test that playing an ace with more playable cards gives a bonus turn where passing is allowed."""
+
+        state = GameState(board_mask=card_mask(*[Card(Suit.HEARTS, rank) for rank in Rank if rank is not Rank.ACE]),
+                          playable_mask=card_mask(Card(Suit.HEARTS, Rank.ACE), Card(Suit.DIAMONDS, Rank.SEVEN)),
+                          hand_masks=(card_mask(Card(Suit.HEARTS, Rank.ACE), Card(Suit.DIAMONDS, Rank.SEVEN),
+                                                Card(Suit.DIAMONDS, Rank.TWO)),
+                                      card_mask(Card(Suit.DIAMONDS, Rank.EIGHT))),
+                          current_player_index=0, turn_player_index=0, phase=TurnPhase.PLAY, finished=())
+
+        state = state.apply(Action(type=ActionType.PLAY_CARD,
+                            card=Card(Suit.HEARTS, Rank.ACE)))
+
+        self.assertIs(state.phase, TurnPhase.BONUS)
+        self.assertEqual(state.current_player_index, 0)
+        self.assertEqual(set(state.legal_actions), {Action(type=ActionType.PLAY_CARD, card=Card(Suit.DIAMONDS, Rank.SEVEN)),
+                                                    Action(type=ActionType.PASS_TURN)})
+
+    def test_take_and_give(self) -> None:
+        """Test that taking a card makes the previous player with cards give one of their cards."""
+
+        state = GameState(board_mask=card_mask(Card(Suit.HEARTS, Rank.SEVEN)),
+                          playable_mask=card_mask(Card(Suit.HEARTS, Rank.SIX), Card(Suit.HEARTS, Rank.EIGHT)),
+                          hand_masks=(card_mask(Card(Suit.SPADES, Rank.TWO)), 0,
+                                      card_mask(Card(Suit.CLUBS, Rank.TWO))),
+                          current_player_index=0, turn_player_index=0, phase=TurnPhase.PLAY, finished=(1,))
+
+        self.assertEqual(state.legal_actions, [
+                         Action(type=ActionType.TAKE_CARD)])
+
+        state = state.apply(Action(type=ActionType.TAKE_CARD))
+        self.assertIs(state.phase, TurnPhase.GIVE)
+        self.assertEqual(state.turn_player_index, 2)
+
+        state = state.apply(Action(type=ActionType.GIVE_CARD,
+                            card=Card(Suit.CLUBS, Rank.TWO)))
+        self.assertEqual(state.finished, (1, 2))
+        self.assertEqual(state.hand_masks[0], card_mask(
+            Card(Suit.SPADES, Rank.TWO), Card(Suit.CLUBS, Rank.TWO)))
+        self.assertEqual(state.current_player_index, 0)
+        self.assertEqual(state.turn_player_index, 0)
+
+    def test_state_follows_game(self) -> None:
+        """Test that applying the actions of a game to its exported state gives the state the game exports."""
+
+        rng = random.Random(3)
+        game = Game(player_infos=self.player_infos, seed=3)
+        game.start()
+        state = game.export_state()
+
+        while not game.is_finished():
+            self.assertEqual(state, game.export_state())
+            self.assertEqual(state.legal_action_mask,
+                             actions_to_mask(game.turn.actions))
+
+            action = rng.choice(sorted(game.turn.actions, key=str))
+            game.execute_action(action=action)
+            state = state.apply(action)
+
+        self.assertEqual(state, game.export_state())
+        self.assertTrue(state.is_finished())
+        self.assertEqual(state.legal_actions, [])
+
+    def test_game_import_state(self) -> None:
+        """Test that a game imports an exported state and continues from it."""
+
+        rng = random.Random(4)
+        game = Game(player_infos=self.player_infos, seed=4)
+        game.start()
+        for _ in range(20):
+            game.execute_action(action=rng.choice(
+                sorted(game.turn.actions, key=str)))
+        state = game.export_state()
+
+        copy = Game(player_infos=self.player_infos)
+        copy.import_state(state)
+
+        self.assertEqual(copy.export_state(), state)
+        self.assertEqual(copy.board, game.board)
+        self.assertEqual(copy.turn.actions, game.turn.actions)
+        self.assertEqual(copy.turn.player.name, game.turn.player.name)
+        self.assertEqual([player.hand for player in copy.players], [
+                         player.hand for player in game.players])
+
+    def test_game_import_state_of_other_player_count(self) -> None:
+        """Test that importing a state with another number of players raises an error."""
+
+        game = Game(player_infos=self.player_infos, seed=5)
+        game.start()
+
+        with self.assertRaises(ValueError):
+            Game(player_infos=self.player_infos[:3]).import_state(
+                game.export_state())
+
+
+if __name__ == '__main__':
+    unittest.main()
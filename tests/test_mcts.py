@@ -0,0 +1,95 @@
+# tests/test_mcts.py
+
+import random
+import unittest
+
+from lib.action import Action, ActionType
+from lib.card import Card, Rank, Suit
+from lib.game import Game, PlayerInfo
+from lib.game_state import GameState, TurnPhase
+from lib.mcts import MonteCarloTreeSearch, determinize, search
+from lib.player import PlayerType
+
+
+class TestMonteCarloTreeSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up a started game for use in test cases."""
+
+        self.game = Game(player_infos=[PlayerInfo(name=name, type=PlayerType.HUMAN)
+                                       for name in ["Bob", "Alice", "Ted", "Eve"]], seed=8)
+        self.game.start()
+        rng = random.Random(8)
+        for _ in range(12):
+            self.game.execute_action(rng.choice(
+                sorted(self.game.turn.actions, key=str)))
+
+    def test_determinize_keeps_observed_information(self) -> None:
+        """Test that a sampled state keeps the board, the hand of the observer and the size of every hand."""
+
+        state = self.game.export_state()
+        observer_index = state.turn_player_index
+
+        sample = determinize(state, observer_index, random.Random(1))
+
+        self.assertEqual(sample.board_mask, state.board_mask)
+        self.assertEqual(
+            sample.hand_masks[observer_index], state.hand_masks[observer_index])
+        self.assertEqual([bin(hand_mask).count("1") for hand_mask in sample.hand_masks],
+                         [bin(hand_mask).count("1") for hand_mask in state.hand_masks])
+        self.assertEqual(sum(sample.hand_masks) | sample.board_mask, (1 << 52) - 1)
+        self.assertEqual(sum(sample.hand_masks) & sample.board_mask, 0)
+
+    def test_search_visits_legal_root_actions(self) -> None:
+        """Test that a search only visits actions that are legal for the player of the turn."""
+
+        state = self.game.export_state()
+
+        visits = search(state, iterations=100, seed=2)
+
+        self.assertEqual(sum(visits.values()), 100)
+        self.assertEqual(set(visits) - set(i for i in range(107) if state.legal_action_mask >> i & 1), set())
+
+    def test_decide_action_is_legal_and_reproducible(self) -> None:
+        """Test that equally seeded searches decide the same legal action."""
+
+        state = self.game.export_state()
+
+        action1 = MonteCarloTreeSearch(iterations=50, seed=3).decide_action(state)
+        action2 = MonteCarloTreeSearch(iterations=50, seed=3).decide_action(state)
+
+        self.assertIn(action1, state.legal_actions)
+        self.assertEqual(action1, action2)
+
+    def test_decide_action_finishes_when_possible(self) -> None:
+        """Test that the search plays the last card of a hand instead of passing the turn."""
+
+        kings = [Card(suit, Rank.KING) for suit in [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]]
+        kings_mask = sum(1 << king.index for king in kings)
+        state = GameState(board_mask=((1 << 52) - 1) & ~kings_mask, playable_mask=kings_mask,
+                          hand_masks=tuple(1 << king.index for king in kings),
+                          current_player_index=0, turn_player_index=0, phase=TurnPhase.BONUS, finished=())
+
+        action = MonteCarloTreeSearch(iterations=200, seed=4).decide_action(state)
+
+        self.assertIn(action, [Action(type=ActionType.PLAY_CARD, card=kings[0]),
+                               Action(type=ActionType.PLAY_ALL_CARDS)])
+
+    def test_decide_action_in_worker_processes(self) -> None:
+        """Test that searches in worker processes decide a legal action."""
+
+        state = self.game.export_state()
+        mcts = MonteCarloTreeSearch(iterations=20, workers=2, seed=5)
+        try:
+            self.assertIn(mcts.decide_action(state), state.legal_actions)
+        finally:
+            mcts.close()
+
+    def test_invalid_budget_raises_error(self) -> None:
+        """Test that a search without any budget raises an error."""
+
+        with self.assertRaises(ValueError):
+            MonteCarloTreeSearch(iterations=None, time_limit=None)
+
+
+if __name__ == '__main__':
+    unittest.main()
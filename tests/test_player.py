@@ -49,6 +49,32 @@ class TestPlayer(unittest.TestCase):
         self.player.remove_card(self.card)
         self.assertFalse(self.player.has_card(self.card))
 
+    def test_remove_card_not_in_hand_raises_error(self) -> None:
+        """Test that removing a card that is not in the hand raises an error and leaves the hand unchanged."""
+        self.player.add_card(self.card)
+        with self.assertRaises(ValueError):
+            self.player.remove_card(Card(Suit.SPADES, Rank.KING))
+        self.assertEqual(self.player.hand, [self.card])
+
+    def test_hand_mask_and_size_follow_hand(self) -> None:
+        """Test that the hand bitmask and size follow the cards added to and removed from the hand."""
+        cards = [Card(Suit.SPADES, Rank.KING), Card(Suit.HEARTS, Rank.ACE), Card(Suit.CLUBS, Rank.SEVEN)]
+        for card in cards:
+            self.player.add_card(card)
+        self.player.remove_card(cards[2])
+
+        self.assertEqual(self.player.hand_mask, (1 << cards[0].index) | (1 << cards[1].index))
+        self.assertEqual(self.player.hand_size, 2)
+        self.assertEqual(self.player.hand, [cards[1], cards[0]])
+
+    def test_set_hand_replaces_hand(self) -> None:
+        """Test that setting the hand replaces the cards in the hand and keeps them sorted."""
+        self.player.add_card(self.card)
+        cards = [Card(Suit.SPADES, Rank.KING), Card(Suit.DIAMONDS, Rank.TWO), Card(Suit.HEARTS, Rank.ACE)]
+        self.player.set_hand(cards)
+        self.assertEqual(self.player.hand, sorted(cards))
+        self.assertFalse(self.player.has_card(self.card))
+
     def test_players_with_same_name_are_equal(self) -> None:
         """Test that two players with the same name and hand are considered equal."""
         player2 = Player("Alice", PlayerType.HUMAN)
@@ -0,0 +1,82 @@
+# tests/test_simulator.py
+
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from lib import strategy
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+from lib.simulator import SimulationResult, Simulator, simulate
+from lib.strategy import register_strategy
+from tests.strategies import ClosingStrategy
+
+
+class TestSimulator(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up the player information for use in test cases."""
+
+        self.player_infos = [
+            PlayerInfo(name="Bob", type=PlayerType.AI),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI),
+            PlayerInfo(name="Eve", type=PlayerType.AI)]
+
+    def test_simulate_aggregates_finishing_positions(self) -> None:
+        """Test that every simulated game is recorded once per player and position."""
+
+        result = simulate(player_infos=self.player_infos, games=10)
+
+        self.assertEqual(result.games, 10)
+        self.assertEqual(result.player_names, ["Bob", "Alice", "Ted", "Eve"])
+        for seat in range(4):
+            self.assertEqual(sum(result.positions[seat]), 10)
+            self.assertAlmostEqual(sum(result.position_rates(seat)), 1.0)
+        for position in range(4):
+            self.assertEqual(sum(histogram[position]
+                             for histogram in result.positions), 10)
+        self.assertGreater(result.games_per_second, 0)
+
+    def test_simulator_rejects_non_ai_players(self) -> None:
+        """Test that a simulation cannot include players that need input."""
+
+        with self.assertRaises(ValueError):
+            Simulator(player_infos=[PlayerInfo(
+                name="Gym", type=PlayerType.HUMAN)] + self.player_infos[1:])
+
+    def test_merge_results(self) -> None:
+        """Test that results of the same players can be merged."""
+
+        result = simulate(player_infos=self.player_infos, games=3)
+        result.merge(simulate(player_infos=self.player_infos, games=2))
+        self.assertEqual(result.games, 5)
+        self.assertEqual(sum(result.positions[0]), 5)
+
+        with self.assertRaises(ValueError):
+            result.merge(SimulationResult(["Bob", "Alice", "Ted"]))
+
+    @mock.patch.dict(strategy._STRATEGIES)
+    def test_simulate_closes_strategies(self) -> None:
+        """Test that the strategies of every player are closed once the simulation is done."""
+
+        register_strategy("closing", ClosingStrategy)
+        ClosingStrategy.closed = 0
+        simulate(player_infos=[player_info._replace(strategy="closing") for player_info in self.player_infos],
+                 games=2)
+
+        self.assertEqual(ClosingStrategy.closed, 4)
+
+    def test_simulator_does_not_import_ml_dependencies(self) -> None:
+        """Test that the simulator can run without gym, numpy or stable baselines."""
+
+        code = ("import sys; from lib.simulator import main; main(['--games', '1']); "
+                "assert not {'gym', 'gymnasium', 'numpy', 'stable_baselines3'} & set(sys.modules)")
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("Games: 1", completed.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# tests/test_strategy.py
+
+import random
+import unittest
+from unittest import mock
+
+from lib import strategy
+from lib.action import Action
+from lib.action_decider import ActionDecider
+from lib.game import Game, PlayerInfo
+from lib.game_state import GameState
+from lib.player import PlayerType
+from lib.strategy import GreedyStrategy, RandomStrategy, Strategy, create_strategy, register_strategy, \
+    strategy_names
+
+
+class FirstActionStrategy(Strategy):
+    """Strategy that always takes the legal action with the lowest index."""
+
+    def decide_action(self, state: GameState) -> Action:
+        return state.legal_actions[0]
+
+
+class TestStrategy(unittest.TestCase):
+
+    def test_builtin_strategies_are_registered(self) -> None:
+        """Test that the built-in strategies can be created by name."""
+        self.assertTrue({"greedy", "random", "mcts", "ppo"} <= set(strategy_names()))
+        self.assertIsInstance(create_strategy("greedy"), GreedyStrategy)
+        self.assertIsInstance(create_strategy("random"), RandomStrategy)
+
+    def test_unknown_strategy_raises_error(self) -> None:
+        """Test that creating an unknown strategy, or a game using one, raises an error."""
+        with self.assertRaises(ValueError):
+            create_strategy("unknown")
+        with self.assertRaises(ValueError):
+            Game(player_infos=[PlayerInfo(name="Bob", type=PlayerType.AI, strategy="unknown"),
+                               PlayerInfo(name="Alice", type=PlayerType.AI),
+                               PlayerInfo(name="Ted", type=PlayerType.AI)])
+
+    @mock.patch.dict(strategy._STRATEGIES)
+    def test_registered_strategy_plays_seat(self) -> None:
+        """Test that a registered strategy decides the actions of the seats naming it."""
+        register_strategy("first", FirstActionStrategy)
+        game = Game(player_infos=[PlayerInfo(name="Bob", type=PlayerType.AI, strategy="first"),
+                                  PlayerInfo(name="Alice", type=PlayerType.AI, strategy="first"),
+                                  PlayerInfo(name="Ted", type=PlayerType.AI, strategy="random")], seed=6)
+        game.start()
+
+        self.assertTrue(game.is_finished())
+        self.assertIn("first", strategy_names())
+
+    def test_greedy_strategy_matches_action_decider(self) -> None:
+        """Test that the greedy strategy decides like the action decider on the same turn."""
+        rng = random.Random(7)
+        game = Game(player_infos=[PlayerInfo(name=name, type=PlayerType.HUMAN)
+                                  for name in ["Bob", "Alice", "Ted", "Eve"]], seed=7)
+        game.start()
+        strategy = GreedyStrategy()
+
+        while not game.is_finished():
+            state = game.export_state()
+            action = strategy.decide_action(state)
+            self.assertIn(action, game.turn.actions)
+
+            expected_action = ActionDecider.decide_action(game.board, game.turn)
+            self.assertEqual(action.type, expected_action.type)
+            if action.card is not None:
+                # Cards with equal scores may be broken differently, so compare the scores
+                board_state = ActionDecider._ActionDecider__analyze_board(game.board)
+                scores = ActionDecider._ActionDecider__score_cards([action.card, expected_action.card], board_state)
+                self.assertEqual(scores[action.card], scores[expected_action.card])
+
+            game.execute_action(rng.choice(sorted(game.turn.actions, key=str)))
+
+    def test_random_strategy_is_seeded_by_game(self) -> None:
+        """Test that games with random strategies are reproducible from the seed of the game."""
+        player_infos = [PlayerInfo(name=name, type=PlayerType.AI, strategy="random")
+                        for name in ["Bob", "Alice", "Ted", "Eve"]]
+        finishing_orders = []
+        for _ in range(2):
+            game = Game(player_infos=player_infos, seed=11)
+            game.start()
+            finishing_orders.append([player.name for player in game.finished_players])
+
+        self.assertEqual(finishing_orders[0], finishing_orders[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
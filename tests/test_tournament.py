@@ -0,0 +1,69 @@
+# tests/test_tournament.py
+
+import unittest
+from unittest import mock
+
+from lib import strategy
+from lib.game import PlayerInfo
+from lib.player import PlayerType
+from lib.simulator import Simulator
+from lib.strategy import register_strategy
+from lib.tournament import Tournament
+from tests.strategies import ClosingStrategy
+
+
+class TestTournament(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up the player information for use in test cases."""
+
+        self.player_infos = [
+            PlayerInfo(name="Bob", type=PlayerType.AI),
+            PlayerInfo(name="Alice", type=PlayerType.AI),
+            PlayerInfo(name="Ted", type=PlayerType.AI)]
+
+    def test_tournament_plays_all_games(self) -> None:
+        """Test that every game of every batch is merged into the result."""
+
+        result = Tournament(player_infos=self.player_infos,
+                            workers=1, batch_size=4).run(games=10, master_seed=7)
+
+        self.assertEqual(result.games, 10)
+        for seat in range(3):
+            self.assertEqual(sum(result.positions[seat]), 10)
+            lower, upper = result.confidence_interval(seat, 0)
+            self.assertLessEqual(lower, result.position_rates(seat)[0])
+            self.assertGreaterEqual(upper, result.position_rates(seat)[0])
+
+    def test_tournament_is_deterministic_regardless_of_workers(self) -> None:
+        """Test that the same master seed gives the same result for any number of workers and batch size."""
+
+        single = Tournament(player_infos=self.player_infos,
+                            workers=1, batch_size=12).run(games=12, master_seed=42)
+        multiple = Tournament(player_infos=self.player_infos,
+                              workers=2, batch_size=5).run(games=12, master_seed=42)
+        sequential = Simulator(player_infos=self.player_infos).run(
+            games=12, master_seed=42)
+
+        self.assertEqual(single.positions, multiple.positions)
+        self.assertEqual(single.positions, sequential.positions)
+
+    @mock.patch.dict(strategy._STRATEGIES)
+    def test_tournament_closes_strategies(self) -> None:
+        """Test that the strategies of the players are closed once the tournament is done."""
+
+        register_strategy("closing", ClosingStrategy)
+        ClosingStrategy.closed = 0
+        Tournament(player_infos=[player_info._replace(strategy="closing") for player_info in self.player_infos],
+                   workers=1, batch_size=2).run(games=5, master_seed=3)
+
+        self.assertEqual(ClosingStrategy.closed, 3)
+
+    def test_tournament_rejects_invalid_batch_size(self) -> None:
+        """Test that a tournament needs at least one game per batch."""
+
+        with self.assertRaises(ValueError):
+            Tournament(player_infos=self.player_infos, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()